@@ -0,0 +1,63 @@
+"""Caption, hashtag and video script generators for brand campaigns"""
+import time
+
+
+def generate_ai_content(brand, title):
+    """Generate AI content for brand campaigns"""
+    templates = {
+        'প্রাণ ফুডস': {
+            'headline': f'{brand} - {title}',
+            'body': 'বিশেষ অফার! সীমিত সময়ের জন্য সবচেয়ে ভালো দামে পাচ্ছেন। আজই অর্ডার করুন!',
+            'hashtags': f'#{brand.replace(" ", "")} #বাংলাদেশ #অফার #স্পেশাল'
+        },
+        'আকিজ গ্রুপ': {
+            'headline': f'{brand} এর নতুন কালেকশন',
+            'body': 'নতুন ডিজাইনের সাথে উপস্থিত! স্টাইলিশ এবং আরামদায়ক, আপনার জন্য বিশেষ দাম।',
+            'hashtags': f'#{brand.replace(" ", "")} #ফ্যাশন #নতুনকালেকশন #বাংলাদেশ'
+        },
+        'ড্যানিশ ডেইরি': {
+            'headline': f'{brand} - পুষ্টির উৎস',
+            'body': '১০০% বিশুদ্ধ ও পুষ্টিকর। পরিবারের স্বাস্থ্যের জন্য সেরা পছন্দ।',
+            'hashtags': f'#{brand.replace(" ", "")} #স্বাস্থ্য #পুষ্টি #ডেইরি'
+        }
+    }
+
+    return templates.get(brand, {
+        'headline': f'{brand} - {title}',
+        'body': 'বিশেষ অফার! সীমিত সময়ের জন্য বিশেষ দাম। আজই কিনুন!',
+        'hashtags': f'#{brand.replace(" ", "")} #অফার #বাংলাদেশ #স্পেশাল'
+    })
+
+
+def generate_video_script(brand, title):
+    """Generate video script for brand campaigns"""
+    scripts = {
+        'প্রাণ ফুডস': f'আজ আমরা দেখবো {brand} এর নতুন প্রোডাক্ট। স্বাদের সাথে স্বাস্থ্যের পরিপূর্ণ সংমিশ্রণ।',
+        'আকিজ গ্রুপ': f'{brand} এর নতুন কালেকশন নিয়ে আজকের ভিডিও। স্টাইলিশ ডিজাইন আর আরামদায়ক ফিট।',
+        'ড্যানিশ ডেইরি': f'{brand} - বিশুদ্ধতার প্রতিশ্রুতি। পরিবারের প্রতিটি সদস্যের জন্য পুষ্টির উৎস।'
+    }
+
+    return scripts.get(brand, f'{brand} এর {title} সম্পর্কে আজকের বিশেষ ভিডিও।')
+
+
+class TemplateModel:
+    """Local stand-in for a generation model backed by the template generators
+
+    `delay` simulates model latency so the job queue can be exercised
+    without a real model.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def caption(self, brand, title):
+        """Return headline, body and hashtags for a campaign"""
+        if self.delay:
+            time.sleep(self.delay)
+        return generate_ai_content(brand, title)
+
+    def script(self, brand, title):
+        """Return a short video script for a campaign"""
+        if self.delay:
+            time.sleep(self.delay)
+        return generate_video_script(brand, title)
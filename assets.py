@@ -0,0 +1,107 @@
+"""Local static assets: bundled fonts and generated placeholder images
+
+Everything is served by Streamlit's static file server from ./static
+(see .streamlit/config.toml) under content-hashed names. That server
+only sends ETag/Last-Modified, so the proxy in front of the app should
+add IMMUTABLE_CACHE_CONTROL to /app/static/fonts/ and
+/app/static/generated/; a changed file always gets a new name.
+Fonts are produced by build_assets.py; placeholders are generated on
+first use and kept on disk.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).resolve().parent / 'static'
+FONT_DIR = STATIC_DIR / 'fonts'
+GENERATED_DIR = STATIC_DIR / 'generated'
+FONT_MANIFEST = FONT_DIR / 'manifest.json'
+
+# URL prefix Streamlit mounts ./static under
+STATIC_URL = '/app/static'
+
+# Header for the content-hashed files under STATIC_URL (one year)
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+FONT_FAMILY = 'Hind Siliguri'
+FALLBACK_FONTS = "'Noto Sans Bengali', 'Nirmala UI', 'Vrinda', sans-serif"
+
+
+def content_hash(data, length=12):
+    """Short hex digest used to version asset file names"""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+@lru_cache(maxsize=1)
+def font_face_css():
+    """@font-face rules for the bundled Hind Siliguri subsets
+
+    Weights missing from the manifest fall back to a locally installed
+    Hind Siliguri and then to system Bengali fonts, so the page never
+    waits on a third-party host for text.
+    """
+    try:
+        with open(FONT_MANIFEST, encoding='utf-8') as f:
+            files = json.load(f)
+    except (OSError, ValueError):
+        files = {}
+    if not files:
+        warnings.warn(f"{FONT_MANIFEST} not found; run build_assets.py to bundle the fonts")
+
+    rules = []
+    for weight, filename in sorted(files.items()):
+        rules.append(f"""
+    @font-face {{
+        font-family: '{FONT_FAMILY}';
+        font-style: normal;
+        font-weight: {weight};
+        font-display: swap;
+        src: local('{FONT_FAMILY}'), url('{STATIC_URL}/fonts/{filename}') format('woff2');
+        unicode-range: U+0000-00FF, U+0980-09FF, U+200C-200D, U+2013-2014, U+2018-201D, U+2022, U+25CC;
+    }}""")
+    return ''.join(rules)
+
+
+def font_stack():
+    """CSS font-family value with the bundled font first"""
+    return f"'{FONT_FAMILY}', {FALLBACK_FONTS}"
+
+
+def placeholder_svg(width, height, color, title, subtitle=''):
+    """SVG markup for a flat-colour placeholder with centred labels"""
+    title_size = height // 10 if subtitle else height // 3
+    lines = [f'<text x="50%" y="{50 if subtitle else 55}%" font-size="{title_size}" font-weight="600">'
+             f'{escape(title)}</text>']
+    if subtitle:
+        lines.append(f'<text x="50%" y="65%" font-size="{height // 16}">{escape(subtitle)}</text>')
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<rect width="100%" height="100%" fill="{escape(color)}"/>'
+        f'<g fill="#ffffff" text-anchor="middle" dominant-baseline="middle" '
+        f'font-family="{escape(font_stack())}">{"".join(lines)}</g></svg>'
+    )
+
+
+@lru_cache(maxsize=512)
+def placeholder_image(width, height, color, title, subtitle=''):
+    """Static URL of a cached placeholder image, generating the file on first use
+
+    st.image passes a relative URL through to the browser unchanged, so
+    the hashed file is fetched from the static server and cached there
+    instead of being inlined into every rerun.
+    """
+    data = placeholder_svg(width, height, color, title, subtitle).encode('utf-8')
+    path = GENERATED_DIR / f"placeholder-{content_hash(data)}.svg"
+    if not path.exists():
+        GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=GENERATED_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return f"{STATIC_URL}/generated/{path.name}"
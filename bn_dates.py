@@ -0,0 +1,66 @@
+"""Parsing of Bengali date strings such as '১৫ ডিসেম্বর'"""
+import unicodedata
+from datetime import date
+
+BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+ASCII_DIGITS = str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯')
+
+BENGALI_MONTHS = {
+    'জানুয়ারি': 1, 'জানুয়ারী': 1,
+    'ফেব্রুয়ারি': 2, 'ফেব্রুয়ারী': 2,
+    'মার্চ': 3,
+    'এপ্রিল': 4,
+    'মে': 5,
+    'জুন': 6,
+    'জুলাই': 7,
+    'আগস্ট': 8, 'অগাস্ট': 8,
+    'সেপ্টেম্বর': 9,
+    'অক্টোবর': 10,
+    'নভেম্বর': 11,
+    'ডিসেম্বর': 12
+}
+# Spelling used when formatting: the first listed for each month
+MONTH_NAMES = {month: name for name, month in reversed(BENGALI_MONTHS.items())}
+
+
+def to_ascii_digits(text):
+    """Replace Bengali numerals with ASCII digits"""
+    return text.translate(BENGALI_DIGITS)
+
+
+def to_bengali_digits(text):
+    """Replace ASCII digits with Bengali numerals"""
+    return text.translate(ASCII_DIGITS)
+
+
+def parse_bengali_date(text, reference=None):
+    """Parse '১৫ ডিসেম্বর' or '১৫ ডিসেম্বর ২০২৬' into a date
+
+    Without a year the first occurrence on or after `reference` (default
+    today) is used, so pass the date the deadline was set; a deadline
+    never resolves to before it. Raises ValueError for strings that are
+    not a day and month name.
+    """
+    # NFC turns the precomposed 'য়' into the ya + nukta form used above
+    parts = to_ascii_digits(unicodedata.normalize('NFC', text)).split()
+    if len(parts) not in (2, 3) or parts[1] not in BENGALI_MONTHS:
+        raise ValueError(f"Unrecognized Bengali date: {text!r}")
+    day, month = int(parts[0]), BENGALI_MONTHS[parts[1]]
+    if len(parts) == 3:
+        return date(int(parts[2]), month, day)
+
+    reference = reference or date.today()
+    # Four years always reach the next 29 February
+    for year in range(reference.year, reference.year + 5):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate >= reference:
+            return candidate
+    raise ValueError(f"Unrecognized Bengali date: {text!r}")
+
+
+def format_bengali_date(value):
+    """Format a date as '১৫ ডিসেম্বর ২০২৬'"""
+    return to_bengali_digits(f"{value.day} {MONTH_NAMES[value.month]} {value.year}")
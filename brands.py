@@ -0,0 +1,122 @@
+"""Seed brand and campaign data loaded into the catalog"""
+
+BRANDS = {
+    'প্রাণ ফুডস': {
+        'logo': '🥘',
+        'color': '#FF6B6B',
+        'category': 'ফুড এন্ড বেভারেজ',
+        'rating': 4.8,
+        'campaigns': [
+            {
+                'id': 'pran1',
+                'title': 'প্রাণ জুস প্রমোশন',
+                'description': 'নতুন প্রাণ ম্যাঙ্গো জুসের প্রমোশনাল কন্টেন্ট তৈরি করুন',
+                'content_type': 'video',
+                'base_payment': 150,
+                'target_reach': 1000,
+                'per_engagement': 0.5,
+                'min_engagement': 200,
+                'deadline': '১৫ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            },
+            {
+                'id': 'pran2',
+                'title': 'প্রাণ নুডলস রেসিপি',
+                'description': 'প্রাণ নুডলস দিয়ে সহজ রেসিপি ভিডিও তৈরি করুন',
+                'content_type': 'text_image',
+                'base_payment': 100,
+                'target_reach': 500,
+                'per_engagement': 0.3,
+                'min_engagement': 150,
+                'deadline': '২০ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            }
+        ]
+    },
+    'আকিজ গ্রুপ': {
+        'logo': '👔',
+        'color': '#3b82f6',
+        'category': 'ফ্যাশন এন্ড টেক্সটাইল',
+        'rating': 4.6,
+        'campaigns': [
+            {
+                'id': 'akij1',
+                'title': 'আকিজ ফুটওয়্যার লঞ্চ',
+                'description': 'নতুন আকিজ জুতা কালেকশনের স্ট্যাটিক পোস্ট তৈরি করুন',
+                'content_type': 'static_post',
+                'base_payment': 120,
+                'target_reach': 800,
+                'per_engagement': 0.4,
+                'min_engagement': 200,
+                'deadline': '১২ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            }
+        ]
+    },
+    'ড্যানিশ ডেইরি': {
+        'logo': '🥛',
+        'color': '#10b981',
+        'category': 'ডেইরি প্রোডাক্ট',
+        'rating': 4.7,
+        'campaigns': [
+            {
+                'id': 'danish1',
+                'title': 'ড্যানিশ মিল্ক হেলথ ক্যাম্পেইন',
+                'description': 'ড্যানিশ মিল্কের স্বাস্থ্য উপকারিতা নিয়ে ভিডিও তৈরি করুন',
+                'content_type': 'video',
+                'base_payment': 180,
+                'target_reach': 1200,
+                'per_engagement': 0.6,
+                'min_engagement': 300,
+                'deadline': '১৮ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            }
+        ]
+    },
+    'বেস্টার্ন কম্পিউটার': {
+        'logo': '💻',
+        'color': '#8b5cf6',
+        'category': 'ইলেকট্রনিক্স',
+        'rating': 4.5,
+        'campaigns': [
+            {
+                'id': 'bestern1',
+                'title': 'বেস্টার্ন ল্যাপটপ রিভিউ',
+                'description': 'বেস্টার্ন ল্যাপটপের হ্যান্ডস-অন রিভিউ ভিডিও তৈরি করুন',
+                'content_type': 'video',
+                'base_payment': 200,
+                'target_reach': 1500,
+                'per_engagement': 0.7,
+                'min_engagement': 400,
+                'deadline': '২৫ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            }
+        ]
+    },
+    'লিজেন্ড ফার্মাসিউটিক্যাল': {
+        'logo': '💊',
+        'color': '#f59e0b',
+        'category': 'ফার্মাসিউটিক্যাল',
+        'rating': 4.9,
+        'campaigns': [
+            {
+                'id': 'legend1',
+                'title': 'লিজেন্ড ভিটামিন সচেতনতা',
+                'description': 'স্বাস্থ্য সচেতনতা বিষয়ক টেক্সট+ইমেজ কন্টেন্ট তৈরি করুন',
+                'content_type': 'text_image',
+                'base_payment': 90,
+                'target_reach': 600,
+                'per_engagement': 0.35,
+                'min_engagement': 180,
+                'deadline': '১০ ডিসেম্বর',
+                'status': 'active',
+                'created_content': None
+            }
+        ]
+    }
+}
@@ -0,0 +1,95 @@
+"""Build the bundled Hind Siliguri fonts
+
+Usage:
+    python build_assets.py [--source DIR]
+
+Downloads Hind Siliguri (or reads the TTFs from --source), subsets each
+weight to Latin + Bengali and writes content-hashed WOFF2 files plus a
+manifest to static/fonts. Needs fontTools and brotli (pip install
+fonttools brotli), which are build-time only and not required to run
+the app. Placeholder images need no build step; see assets.py.
+"""
+import argparse
+import io
+import json
+import sys
+import urllib.request
+from pathlib import Path
+
+from assets import FONT_DIR, FONT_MANIFEST, content_hash
+
+FONT_URL = 'https://github.com/google/fonts/raw/main/ofl/hindsiliguri/HindSiliguri-{style}.ttf'
+
+FONT_STYLES = {
+    400: 'Regular',
+    500: 'Medium',
+    600: 'SemiBold',
+    700: 'Bold'
+}
+
+# Basic Latin + Latin-1, Bengali block, ZWNJ/ZWJ, dashes, curly quotes,
+# bullet and the dotted circle used for isolated vowel signs
+SUBSET_UNICODES = (
+    list(range(0x20, 0x100)) + list(range(0x980, 0xA00)) +
+    [0x200C, 0x200D, 0x2013, 0x2014, 0x2018, 0x2019, 0x201C, 0x201D, 0x2022, 0x25CC]
+)
+
+
+def _read_font(style, source=None):
+    if source:
+        return (Path(source) / f"HindSiliguri-{style}.ttf").read_bytes()
+    with urllib.request.urlopen(FONT_URL.format(style=style), timeout=60) as response:
+        return response.read()
+
+
+def subset_font(data):
+    """Subset TTF bytes to the app's character set and return WOFF2 bytes"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(io.BytesIO(data))
+    options = subset.Options()
+    options.flavor = 'woff2'
+    # Keep the shaping features Bengali conjuncts and vowel signs need
+    options.layout_features = ['*']
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=SUBSET_UNICODES)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font.flavor = 'woff2'
+    font.save(out)
+    return out.getvalue()
+
+
+def build_fonts(source=None):
+    """Write hashed WOFF2 subsets and the manifest; returns {weight: filename}"""
+    FONT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for weight, style in FONT_STYLES.items():
+        woff2 = subset_font(_read_font(style, source))
+        filename = f"HindSiliguri-{weight}.{content_hash(woff2)}.woff2"
+        (FONT_DIR / filename).write_bytes(woff2)
+        manifest[str(weight)] = filename
+        print(f"{filename}: {len(woff2) / 1024:.1f} KiB", file=sys.stderr)
+
+    for stale in FONT_DIR.glob('HindSiliguri-*.woff2'):
+        if stale.name not in manifest.values():
+            stale.unlink()
+    with open(FONT_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the bundled Hind Siliguri fonts")
+    parser.add_argument('--source', help="directory with HindSiliguri-*.ttf instead of downloading")
+    args = parser.parse_args(argv)
+
+    try:
+        build_fonts(args.source)
+    except ImportError:
+        parser.error("fontTools and brotli are required: pip install fonttools brotli")
+
+
+if __name__ == '__main__':
+    main()
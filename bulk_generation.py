@@ -0,0 +1,158 @@
+"""Batched starter-draft generation for whole campaign cohorts
+
+Usage:
+    python bulk_generation.py items.jsonl drafts.jsonl [--chunk-size N] [--workers N]
+
+Each input line is a JSON object with "brand", "campaign" (at least
+"id", "title" and "content_type") and "creator" (at least "creator_id";
+optionally "name" and "platforms"). Malformed lines and items the model
+fails on are skipped and counted as rejected.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from ai_content import TemplateModel
+
+
+def personalize(model, brand, campaign, creator, bases=None):
+    """Build one creator's starter draft for a campaign
+
+    `model` is any generation model with caption() and script() (see
+    ai_content.TemplateModel). `bases` memoizes its outputs per
+    (kind, brand, title), since a cohort shares a handful of campaigns.
+    """
+    bases = {} if bases is None else bases
+    name = creator.get('name', '')
+    platforms = creator.get('platforms') or ['Facebook']
+    draft = {
+        'creator_id': creator['creator_id'],
+        'campaign_id': campaign['id'],
+        'brand': brand,
+        'content_type': campaign['content_type']
+    }
+    kind = 'script' if campaign['content_type'] == 'video' else 'caption'
+    key = (kind, brand, campaign['title'])
+    if key not in bases:
+        bases[key] = getattr(model, kind)(brand, campaign['title'])
+    if kind == 'script':
+        script = bases[key]
+        draft['script'] = f"আসসালামু আলাইকুম, আমি {name}। {script}" if name else script
+    else:
+        caption = bases[key]
+        draft['variants'] = {
+            platform: {
+                'headline': caption['headline'],
+                'body': caption['body'],
+                'hashtags': f"{caption['hashtags']} #{platform}"
+            }
+            for platform in platforms
+        }
+    return draft
+
+
+def _generate_chunk(model, chunk):
+    drafts = []
+    rejected = 0
+    bases = {}
+    for brand, campaign, creator in chunk:
+        try:
+            drafts.append(personalize(model, brand, campaign, creator, bases))
+        except Exception:
+            # One bad campaign dict or model failure must not sink the run
+            rejected += 1
+    return drafts, rejected
+
+
+class BatchStats:
+    """Running item and rejection counts and throughput of a batch run"""
+
+    def __init__(self):
+        self.items = 0
+        self.rejected = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def items_per_sec(self):
+        elapsed = self.elapsed
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+def generate_drafts(items, model=None, chunk_size=500, max_workers=None, stats=None):
+    """Generate drafts for (brand, campaign, creator) tuples across a process pool
+
+    Items are consumed lazily in chunks and drafts are yielded as each
+    chunk finishes, so arbitrarily large cohorts stream through with at
+    most two chunks per worker in flight. `model` (default TemplateModel)
+    must be picklable, as it is shipped to the workers with each chunk.
+    Items that fail are counted in the BatchStats instead of raising;
+    pass one to follow throughput while iterating.
+    """
+    model = model if model is not None else TemplateModel()
+    stats = stats if stats is not None else BatchStats()
+    items = iter(items)
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        max_in_flight = 2 * max_workers
+        pending = set()
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                pending.add(pool.submit(_generate_chunk, model, chunk))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                drafts, rejected = future.result()
+                stats.items += len(drafts)
+                stats.rejected += rejected
+                yield from drafts
+
+
+def _read_items(path, stats):
+    """Yield (brand, campaign, creator) from a JSONL file, counting malformed lines as rejected"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                item = row['brand'], row['campaign'], row['creator']
+            except (ValueError, KeyError, TypeError):
+                stats.rejected += 1
+                continue
+            if not isinstance(item[1], dict) or not isinstance(item[2], dict):
+                stats.rejected += 1
+                continue
+            yield item
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate starter drafts for a campaign cohort")
+    parser.add_argument('items', help="input JSONL of brand/campaign/creator rows")
+    parser.add_argument('output', help="output JSONL of drafts")
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    stats = BatchStats()
+    with open(args.output, 'w', encoding='utf-8') as out:
+        items = _read_items(args.items, stats)
+        for draft in generate_drafts(items, TemplateModel(), args.chunk_size, args.workers, stats):
+            out.write(json.dumps(draft, ensure_ascii=False) + '\n')
+    print(f"{stats.items} drafts in {stats.elapsed:.2f}s ({stats.items_per_sec:.0f} items/sec), "
+          f"{stats.rejected} rejected", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Materialized per-campaign statistics for marketplace cards"""
+import threading
+import time
+
+
+class CampaignStatsBook:
+    """Accept/success counters and mean earning per campaign
+
+    Counters live in memory for O(1) reads by the campaign card and are
+    bumped incrementally on accept and completion events. With a store
+    the increments are also persisted, and the in-memory copy is
+    reloaded every `refresh_interval` seconds to pick up events from
+    other worker processes.
+    """
+
+    def __init__(self, store=None, refresh_interval=60.0):
+        self.store = store
+        self.refresh_interval = refresh_interval
+        self._counters = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh()
+
+    def _refresh(self):
+        if self.store is not None:
+            counters = self.store.load_campaign_stats()
+            with self._lock:
+                self._counters = counters
+        self._loaded_at = time.monotonic()
+
+    def _bump(self, campaign_id, accepts=0, successes=0, earning=0.0):
+        with self._lock:
+            counter = self._counters.setdefault(campaign_id, [0, 0, 0.0])
+            counter[0] += accepts
+            counter[1] += successes
+            counter[2] += earning
+        if self.store is not None:
+            self.store.bump_campaign_stats(campaign_id, accepts, successes, earning)
+
+    def record_accept(self, campaign_id):
+        """Count a creator accepting a campaign"""
+        self._bump(campaign_id, accepts=1)
+
+    def record_success(self, campaign_id, earning):
+        """Count a completed campaign and its earning"""
+        self._bump(campaign_id, successes=1, earning=earning)
+
+    def get(self, campaign_id):
+        """Return accept count, success count and mean earning (None without successes)"""
+        if time.monotonic() - self._loaded_at > self.refresh_interval:
+            self._refresh()
+        accepts, successes, earning = self._counters.get(campaign_id, (0, 0, 0.0))
+        return {
+            'accept_count': accepts,
+            'success_count': successes,
+            'mean_earning': earning / successes if successes else None
+        }
@@ -0,0 +1,378 @@
+"""Brand-side campaign management: create, update, pause, close and bulk import
+
+Usage:
+    python campaigns.py import FILE [--brand NAME] [--chunk-size N] [--db PATH]
+
+FILE is a .csv with a header row or a .jsonl file with one campaign per
+line. Each row needs the campaign fields (id, title, content_type,
+base_payment, target_reach, min_engagement, per_engagement, deadline)
+and a "brand" unless --brand is given. Rows are upserted by id; an
+existing campaign keeps its status unless the row sets one, and closed
+campaigns are rejected. A
+deadline without a year ("১৫ মে") means its next occurrence from the
+day of the import and is stored with that year.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from itertools import islice
+
+from bn_dates import format_bengali_date, parse_bengali_date
+from payouts import RATE_SCALE
+from storage import SQLiteCreatorStore
+
+CONTENT_TYPES = ('static_post', 'video', 'text_image')
+
+ACTIVE = 'active'
+PAUSED = 'paused'
+CLOSED = 'closed'
+# Set by sync once an active campaign's deadline has passed
+EXPIRED = 'expired'
+STATUSES = (ACTIVE, PAUSED, CLOSED, EXPIRED)
+
+CAMPAIGN_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+MAX_PAYMENT = 1_000_000
+MAX_PER_ENGAGEMENT = 100
+MAX_REACH = 100_000_000
+
+
+class CampaignValidationError(ValueError):
+    """Campaign data failed validation; `errors` maps field names to messages"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('; '.join(f"{field}: {message}" for field, message in errors.items()))
+
+
+def _number(value, integer, minimum, maximum):
+    if isinstance(value, bool):
+        raise ValueError("must be a number")
+    if isinstance(value, str):
+        value = value.strip()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("must be a number") from None
+    if not math.isfinite(number):
+        raise ValueError("must be a finite number")
+    if integer:
+        if number != int(number):
+            raise ValueError("must be a whole number")
+        number = int(number)
+    if not minimum <= number <= maximum:
+        raise ValueError(f"must be between {minimum} and {maximum}")
+    return number
+
+
+def _text(value, max_length, required=True):
+    value = '' if value is None else str(value).strip()
+    if required and not value:
+        raise ValueError("is required")
+    if len(value) > max_length:
+        raise ValueError(f"must be at most {max_length} characters")
+    return value
+
+
+def _money(value, scale, maximum):
+    number = _number(value, False, 0, maximum)
+    # Payouts are exact in integer units of 1/scale Taka, so finer amounts are rejected
+    if abs(number * scale - round(number * scale)) > 1e-6:
+        raise ValueError(f"must have at most {len(str(scale)) - 1} decimal places")
+    return int(number) if number == int(number) else number
+
+
+def _content_type(value):
+    value = _text(value, 32)
+    if value not in CONTENT_TYPES:
+        raise ValueError(f"must be one of {', '.join(CONTENT_TYPES)}")
+    return value
+
+
+def _deadline(value):
+    # A deadline without a year is pinned to its next occurrence now, when
+    # it is set, so it is never re-guessed relative to a later day
+    return format_bengali_date(parse_bengali_date(_text(value, 64)))
+
+
+def _status(value):
+    value = _text(value, 16)
+    if value not in STATUSES:
+        raise ValueError(f"must be one of {', '.join(STATUSES)}")
+    return value
+
+
+FIELD_VALIDATORS = {
+    'id': lambda v: _text(v, 64),
+    'title': lambda v: _text(v, 200),
+    'description': lambda v: _text(v, 2000, required=False),
+    'content_type': _content_type,
+    'base_payment': lambda v: _money(v, 100, MAX_PAYMENT),
+    'target_reach': lambda v: _number(v, True, 1, MAX_REACH),
+    'min_engagement': lambda v: _number(v, True, 0, MAX_REACH),
+    'per_engagement': lambda v: _money(v, RATE_SCALE, MAX_PER_ENGAGEMENT),
+    'deadline': _deadline,
+    'status': _status
+}
+
+OPTIONAL_FIELDS = {'description': '', 'status': ACTIVE}
+
+
+def validate_campaign(data, partial=False):
+    """Return a clean campaign dict or raise CampaignValidationError
+
+    Values from CSV arrive as strings and are coerced to numbers. With
+    `partial` only the given fields are checked (for updates).
+    """
+    campaign = {}
+    errors = {}
+    for field, validator in FIELD_VALIDATORS.items():
+        if field not in data or data[field] in (None, ''):
+            if partial:
+                continue
+            if field in OPTIONAL_FIELDS:
+                campaign[field] = OPTIONAL_FIELDS[field]
+                continue
+            errors[field] = "is required"
+            continue
+        try:
+            campaign[field] = validator(data[field])
+        except (TypeError, ValueError) as exc:
+            errors[field] = str(exc) or "is invalid"
+
+    if 'id' in campaign and not CAMPAIGN_ID_PATTERN.match(campaign['id']):
+        errors['id'] = "may only contain letters, digits, '-' and '_'"
+    if not errors and 'target_reach' in campaign and 'min_engagement' in campaign:
+        if campaign['min_engagement'] > campaign['target_reach']:
+            errors['min_engagement'] = "must not exceed target_reach"
+    if errors:
+        raise CampaignValidationError(errors)
+    return campaign
+
+
+def _read_rows(path):
+    """Yield (line_number, row dict) from a CSV or JSONL file without loading it whole"""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    yield line_number, exc
+                    continue
+                yield line_number, row
+
+
+class ImportReport:
+    """Outcome of a bulk import"""
+
+    def __init__(self):
+        self.imported = 0
+        self.errors = []
+
+    def add_error(self, line, message):
+        self.errors.append((line, message))
+
+
+class CampaignManager:
+    """Brand-facing campaign API over the store's catalog tables
+
+    Every change is written to the store with a monotonically increasing
+    sequence number. `sync` applies only changes newer than the last one
+    it saw to an in-memory CampaignCatalog, so every server process picks
+    up edits and imports without a restart. Syncs closer together than
+    `refresh_interval` seconds are skipped unless forced.
+
+    `sync` also retires campaigns past their deadline, under the same
+    lock as every other catalog change, and writes the 'expired' status
+    back to the store so all processes agree on it.
+
+    Other threads read `catalog` without locking, so a published catalog
+    is never changed: sync applies changes to a copy and then swaps the
+    reference. Readers keep a consistent snapshot for as long as they
+    hold one.
+    """
+
+    def __init__(self, store, catalog=None, refresh_interval=1.0):
+        self.store = store
+        self.catalog = catalog
+        self.refresh_interval = refresh_interval
+        self.synced_seq = 0
+        self._synced_at = None
+        self._lock = threading.Lock()
+
+    def sync(self, force=False):
+        """Apply catalog changes made since the last sync and expire due campaigns; returns the number of changes"""
+        if self.catalog is None:
+            return 0
+        now = time.monotonic()
+        if not force and self._synced_at is not None and now - self._synced_at < self.refresh_interval:
+            return 0
+        with self._lock:
+            self._synced_at = now
+            changes = self.store.load_catalog_changes(self.synced_seq)
+            if not changes['brands'] and not changes['campaigns'] and not self.catalog.has_due():
+                return 0
+            catalog = self.catalog.copy()
+            for brand_name, data in changes['brands']:
+                catalog.add_brand(brand_name, data)
+            for brand_name, campaign in changes['campaigns']:
+                catalog.upsert_campaign(brand_name, campaign)
+            expired = catalog.expire_due()
+            if expired:
+                self.store.save_catalog(campaigns=[catalog.get(campaign_id) for campaign_id in expired])
+            self.catalog = catalog
+            self.synced_seq = changes['seq']
+            return len(changes['brands']) + len(changes['campaigns']) + len(expired)
+
+    def seed(self, brands):
+        """Load an initial BRANDS-style dict when the store has no catalog yet"""
+        if self.store.catalog_brand_names():
+            return False
+        self.store.save_catalog(
+            [(name, {k: v for k, v in data.items() if k != 'campaigns'}) for name, data in brands.items()],
+            [(name, dict(validate_campaign(c), created_content=None))
+             for name, data in brands.items() for c in data['campaigns']]
+        )
+        return True
+
+    def save_brand(self, brand_name, logo='🏢', color='#3b82f6', category='', rating=0.0):
+        """Create or update a brand's profile"""
+        brand_name = _text(brand_name, 100)
+        self.store.save_catalog(brands=[(brand_name, {
+            'logo': logo, 'color': color, 'category': category, 'rating': rating
+        })])
+
+    def create_campaign(self, brand_name, data):
+        """Validate and add a new campaign to an existing brand"""
+        campaign = validate_campaign(data)
+        if brand_name not in self.store.catalog_brand_names():
+            raise CampaignValidationError({'brand': f"unknown brand {brand_name!r}"})
+        if self.store.catalog_campaign_owners([campaign['id']]):
+            raise CampaignValidationError({'id': "already exists"})
+        campaign['created_content'] = None
+        self.store.save_catalog(campaigns=[(brand_name, campaign)])
+        return campaign
+
+    def update_campaign(self, campaign_id, **changes):
+        """Validate and apply field changes to an existing campaign; KeyError if unknown"""
+        changes.pop('id', None)
+        existing = self.store.load_catalog_campaign(campaign_id)
+        if existing is None:
+            raise KeyError(campaign_id)
+        brand_name, campaign = existing
+        if campaign['status'] == CLOSED:
+            raise CampaignValidationError({'status': "closed campaigns cannot be changed"})
+        campaign = dict(campaign, **validate_campaign(changes, partial=True))
+        # Re-check cross-field rules against the merged campaign
+        validate_campaign(campaign)
+        self.store.save_catalog(campaigns=[(brand_name, campaign)])
+        return campaign
+
+    def pause(self, campaign_id):
+        """Hide a campaign from the marketplace until resumed"""
+        return self.update_campaign(campaign_id, status=PAUSED)
+
+    def resume(self, campaign_id):
+        """Return a paused campaign to the marketplace"""
+        return self.update_campaign(campaign_id, status=ACTIVE)
+
+    def close(self, campaign_id):
+        """Close a campaign for good"""
+        return self.update_campaign(campaign_id, status=CLOSED)
+
+    def import_file(self, path, brand_name=None, chunk_size=500):
+        """Upsert campaigns from a CSV/JSONL file in chunks of `chunk_size` rows
+
+        Each chunk is validated and written in one transaction, so memory
+        stays flat for large files. Invalid rows are skipped and reported
+        with their line numbers. Like update_campaign, an import never
+        changes a closed campaign, and rows without a status keep the
+        stored one.
+        """
+        report = ImportReport()
+        brands = self.store.catalog_brand_names()
+        rows = _read_rows(path)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            valid = []
+            for line, row in chunk:
+                if isinstance(row, Exception):
+                    report.add_error(line, f"invalid JSON: {row}")
+                    continue
+                if not isinstance(row, dict):
+                    report.add_error(line, "expected an object")
+                    continue
+                brand = row.get('brand')
+                if brand in (None, ''):
+                    brand = brand_name or ''
+                if not isinstance(brand, str):
+                    report.add_error(line, "brand: must be a string")
+                    continue
+                brand = brand.strip()
+                if not brand:
+                    report.add_error(line, "brand: is required")
+                    continue
+                try:
+                    campaign = validate_campaign(row)
+                except CampaignValidationError as exc:
+                    report.add_error(line, str(exc))
+                    continue
+                campaign['created_content'] = None
+                valid.append((line, brand, campaign, row.get('status') not in (None, '')))
+
+            owners = self.store.catalog_campaign_owners(c['id'] for _, _, c, _ in valid)
+            to_save = []
+            for line, brand, campaign, has_status in valid:
+                owner, status = owners.get(campaign['id'], (brand, None))
+                if brand not in brands:
+                    report.add_error(line, f"brand: unknown brand {brand!r}")
+                elif owner != brand:
+                    report.add_error(line, f"id: belongs to brand {owner!r}")
+                elif status == CLOSED:
+                    report.add_error(line, "status: closed campaigns cannot be changed")
+                else:
+                    if status is not None and not has_status:
+                        campaign['status'] = status
+                    to_save.append((brand, campaign))
+            if to_save:
+                self.store.save_catalog(campaigns=to_save)
+                report.imported += len(to_save)
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage marketplace campaigns")
+    commands = parser.add_subparsers(dest='command', required=True)
+    importer = commands.add_parser('import', help="bulk import campaigns from CSV or JSONL")
+    importer.add_argument('file')
+    importer.add_argument('--brand', help="brand for rows without a brand column")
+    importer.add_argument('--chunk-size', type=int, default=500)
+    importer.add_argument('--db', default=os.environ.get('COLLABNET_DB_PATH', 'collabnet.db'))
+    args = parser.parse_args(argv)
+
+    manager = CampaignManager(SQLiteCreatorStore(args.db))
+    report = manager.import_file(args.file, args.brand, args.chunk_size)
+    for line, message in report.errors:
+        print(f"{args.file}:{line}: {message}", file=sys.stderr)
+    print(f"{report.imported} campaigns imported, {len(report.errors)} rows rejected", file=sys.stderr)
+    return 1 if report.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""Indexed campaign catalog for the brand marketplace"""
+from datetime import date, timedelta
+from heapq import heapify, heappop, heappush, nsmallest
+
+from bn_dates import parse_bengali_date
+from search import SearchIndex
+
+PAYMENT_BUCKETS = ('under_100', '100_150', 'over_150')
+
+
+def payment_bucket(base_payment):
+    """Map a base payment to the marketplace payment filter bucket"""
+    if base_payment < 100:
+        return 'under_100'
+    if base_payment <= 150:
+        return '100_150'
+    return 'over_150'
+
+
+class CampaignCatalog:
+    """Campaigns from all brands with inverted indexes for marketplace filters
+
+    A catalog shared between threads must not change while it is being
+    read; writers change a `copy()` and publish that instead.
+    """
+
+    def __init__(self, brands=None):
+        self.brands = {}
+        self.campaigns = {}
+        self.brand_of = {}
+        self.versions = {}
+        self.revision = 0
+        self._brand_position = {}
+        self._position = {}
+        self._keys = {}
+        self._by_content_type = {}
+        self._by_payment = {}
+        self._by_status = {}
+        self.search_index = SearchIndex()
+        self.deadlines = {}
+        # Min-heap of (deadline, campaign_id, version); entries whose version
+        # is no longer current are stale and skipped lazily
+        self._deadline_heap = []
+
+        for brand_name, brand_data in (brands or {}).items():
+            self.add_brand(brand_name, brand_data)
+            for campaign in brand_data['campaigns']:
+                self.upsert_campaign(brand_name, campaign)
+
+    def copy(self):
+        """Independent copy sharing only the (never mutated) campaign and brand dicts"""
+        clone = CampaignCatalog.__new__(CampaignCatalog)
+        clone.brands = dict(self.brands)
+        clone.campaigns = dict(self.campaigns)
+        clone.brand_of = dict(self.brand_of)
+        clone.versions = dict(self.versions)
+        clone.revision = self.revision
+        clone._brand_position = dict(self._brand_position)
+        clone._position = dict(self._position)
+        clone._keys = dict(self._keys)
+        clone._by_content_type = {key: set(ids) for key, ids in self._by_content_type.items()}
+        clone._by_payment = {key: set(ids) for key, ids in self._by_payment.items()}
+        clone._by_status = {key: set(ids) for key, ids in self._by_status.items()}
+        clone.search_index = self.search_index.copy()
+        clone.deadlines = dict(self.deadlines)
+        clone._deadline_heap = list(self._deadline_heap)
+        return clone
+
+    def has_due(self, today=None):
+        """Whether expire_due has heap entries to pop"""
+        return bool(self._deadline_heap) and self._deadline_heap[0][0] < (today or date.today())
+
+    def add_brand(self, brand_name, brand_data):
+        """Register brand metadata (logo, color, category, rating)"""
+        self.brands[brand_name] = {k: v for k, v in brand_data.items() if k != 'campaigns'}
+        self._brand_position.setdefault(brand_name, len(self._brand_position))
+
+    def upsert_campaign(self, brand_name, campaign):
+        """Add or replace a campaign, touching only its own index postings"""
+        campaign_id = campaign['id']
+        if campaign_id in self._keys:
+            self._unindex(campaign_id)
+            sequence = self._position[campaign_id][1]
+        else:
+            sequence = len(self._position)
+        self._position[campaign_id] = (self._brand_position[brand_name], sequence)
+
+        self.campaigns[campaign_id] = campaign
+        self.brand_of[campaign_id] = brand_name
+        self.versions[campaign_id] = self.versions.get(campaign_id, 0) + 1
+        self.revision += 1
+        self._index_deadline(campaign)
+
+        keys = (
+            campaign['content_type'],
+            payment_bucket(campaign['base_payment']),
+            campaign['status'],
+        )
+        self._keys[campaign_id] = keys
+        self._by_content_type.setdefault(keys[0], set()).add(campaign_id)
+        self._by_payment.setdefault(keys[1], set()).add(campaign_id)
+        self._by_status.setdefault(keys[2], set()).add(campaign_id)
+        self.search_index.add(campaign_id, {
+            'brand': brand_name,
+            'title': campaign['title'],
+            'description': campaign.get('description'),
+            'category': self.brands[brand_name].get('category')
+        })
+
+    def _index_deadline(self, campaign):
+        campaign_id = campaign['id']
+        try:
+            deadline = parse_bengali_date(campaign['deadline'])
+        except (KeyError, ValueError):
+            self.deadlines.pop(campaign_id, None)
+            return
+        self.deadlines[campaign_id] = deadline
+        heappush(self._deadline_heap, (deadline, campaign_id, self.versions[campaign_id]))
+        if len(self._deadline_heap) > 2 * len(self.campaigns) + 64:
+            self._deadline_heap = [
+                entry for entry in self._deadline_heap if not self._is_stale(entry)
+            ]
+            heapify(self._deadline_heap)
+
+    def _is_stale(self, entry):
+        return self.versions.get(entry[1]) != entry[2]
+
+    def _unindex(self, campaign_id):
+        content_type, bucket, status = self._keys.pop(campaign_id)
+        self._by_content_type[content_type].discard(campaign_id)
+        self._by_payment[bucket].discard(campaign_id)
+        self._by_status[status].discard(campaign_id)
+        self.search_index.remove(campaign_id)
+
+    def get(self, campaign_id):
+        """Return (brand_name, campaign) for a campaign id"""
+        return self.brand_of[campaign_id], self.campaigns[campaign_id]
+
+    def query(self, status='active', content_type=None, payment=None, text=''):
+        """Return ids matching every given filter via set intersections"""
+        candidates = [self._by_status.get(status, set())]
+        if content_type is not None:
+            candidates.append(self._by_content_type.get(content_type, set()))
+        if payment is not None:
+            candidates.append(self._by_payment.get(payment, set()))
+        matched = self.search_index.match(text)
+        if matched is not None:
+            candidates.append(matched)
+
+        candidates.sort(key=len)
+        return set(candidates[0]).intersection(*candidates[1:])
+
+    def ranked(self, text, campaign_ids, limit=None):
+        """Order campaign ids by search relevance for `text`, ties in catalog order"""
+        return self.search_index.rank(text, campaign_ids, limit, tiebreak=self._position.__getitem__)
+
+    def ordered(self, campaign_ids, limit=None):
+        """Sort campaign ids into stable catalog order, grouped by brand
+
+        With a limit only the first `limit` ids are selected, so a page
+        costs O(n log limit) instead of a full sort.
+        """
+        if limit is not None and limit < len(campaign_ids):
+            return nsmallest(limit, campaign_ids, key=self._position.__getitem__)
+        return sorted(campaign_ids, key=self._position.__getitem__)
+
+    def days_left(self, campaign_id, today=None):
+        """Days until a campaign's deadline, or None when it has no parsable deadline"""
+        deadline = self.deadlines.get(campaign_id)
+        if deadline is None:
+            return None
+        return (deadline - (today or date.today())).days
+
+    def expiring_soon(self, days, today=None):
+        """Active campaign ids due within `days`, soonest first
+
+        Walks the heap as a tree and only descends below entries inside
+        the window, so the cost grows with the number of hits rather
+        than the catalog size.
+        """
+        heap = self._deadline_heap
+        cutoff = (today or date.today()) + timedelta(days=days)
+        result = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            entry, i = heappop(frontier)
+            if entry[0] > cutoff:
+                break
+            if not self._is_stale(entry) and self.campaigns[entry[1]]['status'] == 'active':
+                result.append(entry[1])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heappush(frontier, (heap[child], child))
+        return result
+
+    def expire_due(self, today=None):
+        """Flip active campaigns past their deadline to 'expired'
+
+        Pops due heap entries, so calling this on every rerun costs a
+        heap peek when nothing has expired. Returns the expired ids.
+        """
+        today = today or date.today()
+        heap = self._deadline_heap
+        expired = []
+        while heap and heap[0][0] < today:
+            entry = heappop(heap)
+            if self._is_stale(entry):
+                continue
+            brand_name, campaign = self.get(entry[1])
+            if campaign['status'] == 'active':
+                self.upsert_campaign(brand_name, dict(campaign, status='expired'))
+                expired.append(entry[1])
+        return expired
@@ -1,10 +1,17 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import random
-from datetime import datetime, timedelta
 import time
 
+# Taken before the other imports so the first run includes their cost
+RUN_STARTED = time.perf_counter()
+
+import streamlit as st
+import os
+from collections import deque
+from views import load_page
+from views.common import CREATOR_ID, add_notification, get_css, get_store, init_session, refresh_session
+from assets import placeholder_image
+from money import to_taka
+from templates import render_notification
+
 # Page config
 st.set_page_config(
     page_title="CollabNet – Where Brands Meet Creators",
@@ -13,1044 +20,49 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Hind+Siliguri:wght@400;500;600;700&display=swap');
-    
-    * {
-        font-family: 'Hind Siliguri', sans-serif;
-    }
-    
-    .brand-card {
-        background: white;
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        border-left: 5px solid;
-        border-left-color: #3b82f6;
-    }
-    
-    .campaign-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 15px;
-        margin: 10px 0;
-    }
-    
-    .earning-card {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 15px;
-    }
-    
-    .bangla-text {
-        font-size: 1.1rem;
-        line-height: 1.8;
-    }
-    
-    .status-active { color: #10b981; font-weight: bold; }
-    .status-pending { color: #f59e0b; font-weight: bold; }
-    .status-completed { color: #6b7280; font-weight: bold; }
-    
-    .reach-badge {
-        background: #3b82f6;
-        color: white;
-        padding: 5px 10px;
-        border-radius: 20px;
-        font-size: 0.9rem;
-        display: inline-block;
-        margin: 5px;
-    }
-    
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 15px;
-        color: white;
-        margin-bottom: 30px;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if 'balance' not in st.session_state:
-    st.session_state.balance = 1250
-if 'active_campaigns' not in st.session_state:
-    st.session_state.active_campaigns = []
-if 'completed_campaigns' not in st.session_state:
-    st.session_state.completed_campaigns = []
-if 'content_created' not in st.session_state:
-    st.session_state.content_created = []
-if 'notifications' not in st.session_state:
-    st.session_state.notifications = []
+# Global stylesheet, built once per server process
+st.markdown(get_css(), unsafe_allow_html=True)
 
-# Brand Database
-BRANDS = {
-    'প্রাণ ফুডস': {
-        'logo': '🥘',
-        'color': '#FF6B6B',
-        'category': 'ফুড এন্ড বেভারেজ',
-        'rating': 4.8,
-        'campaigns': [
-            {
-                'id': 'pran1',
-                'title': 'প্রাণ জুস প্রমোশন',
-                'description': 'নতুন প্রাণ ম্যাঙ্গো জুসের প্রমোশনাল কন্টেন্ট তৈরি করুন',
-                'content_type': 'video',
-                'base_payment': 150,
-                'target_reach': 1000,
-                'per_engagement': 0.5,
-                'min_engagement': 200,
-                'deadline': '১৫ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            },
-            {
-                'id': 'pran2',
-                'title': 'প্রাণ নুডলস রেসিপি',
-                'description': 'প্রাণ নুডলস দিয়ে সহজ রেসিপি ভিডিও তৈরি করুন',
-                'content_type': 'text_image',
-                'base_payment': 100,
-                'target_reach': 500,
-                'per_engagement': 0.3,
-                'min_engagement': 150,
-                'deadline': '২০ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            }
-        ]
-    },
-    'আকিজ গ্রুপ': {
-        'logo': '👔',
-        'color': '#3b82f6',
-        'category': 'ফ্যাশন এন্ড টেক্সটাইল',
-        'rating': 4.6,
-        'campaigns': [
-            {
-                'id': 'akij1',
-                'title': 'আকিজ ফুটওয়্যার লঞ্চ',
-                'description': 'নতুন আকিজ জুতা কালেকশনের স্ট্যাটিক পোস্ট তৈরি করুন',
-                'content_type': 'static_post',
-                'base_payment': 120,
-                'target_reach': 800,
-                'per_engagement': 0.4,
-                'min_engagement': 200,
-                'deadline': '১২ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            }
-        ]
-    },
-    'ড্যানিশ ডেইরি': {
-        'logo': '🥛',
-        'color': '#10b981',
-        'category': 'ডেইরি প্রোডাক্ট',
-        'rating': 4.7,
-        'campaigns': [
-            {
-                'id': 'danish1',
-                'title': 'ড্যানিশ মিল্ক হেলথ ক্যাম্পেইন',
-                'description': 'ড্যানিশ মিল্কের স্বাস্থ্য উপকারিতা নিয়ে ভিডিও তৈরি করুন',
-                'content_type': 'video',
-                'base_payment': 180,
-                'target_reach': 1200,
-                'per_engagement': 0.6,
-                'min_engagement': 300,
-                'deadline': '১৮ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            }
-        ]
-    },
-    'বেস্টার্ন কম্পিউটার': {
-        'logo': '💻',
-        'color': '#8b5cf6',
-        'category': 'ইলেকট্রনিক্স',
-        'rating': 4.5,
-        'campaigns': [
-            {
-                'id': 'bestern1',
-                'title': 'বেস্টার্ন ল্যাপটপ রিভিউ',
-                'description': 'বেস্টার্ন ল্যাপটপের হ্যান্ডস-অন রিভিউ ভিডিও তৈরি করুন',
-                'content_type': 'video',
-                'base_payment': 200,
-                'target_reach': 1500,
-                'per_engagement': 0.7,
-                'min_engagement': 400,
-                'deadline': '২৫ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            }
-        ]
-    },
-    'লিজেন্ড ফার্মাসিউটিক্যাল': {
-        'logo': '💊',
-        'color': '#f59e0b',
-        'category': 'ফার্মাসিউটিক্যাল',
-        'rating': 4.9,
-        'campaigns': [
-            {
-                'id': 'legend1',
-                'title': 'লিজেন্ড ভিটামিন সচেতনতা',
-                'description': 'স্বাস্থ্য সচেতনতা বিষয়ক টেক্সট+ইমেজ কন্টেন্ট তৈরি করুন',
-                'content_type': 'text_image',
-                'base_payment': 90,
-                'target_reach': 600,
-                'per_engagement': 0.35,
-                'min_engagement': 180,
-                'deadline': '১০ ডিসেম্বর',
-                'status': 'active',
-                'created_content': None
-            }
-        ]
-    }
-}
+# Initialize session state from the store, then apply ingested engagement
+init_session()
+refresh_session()
 
-def get_content_type_name(content_type):
-    """Convert content type code to readable name"""
-    names = {
-        'static_post': 'স্ট্যাটিক পোস্ট',
-        'video': 'ভিডিও',
-        'text_image': 'টেক্সট+ইমেজ'
-    }
-    return names.get(content_type, content_type)
+@st.cache_resource
+def get_run_timings():
+    """Process-wide record of the first (cold) run and recent rerun times"""
+    return {'cold_start': None, 'reruns': deque(maxlen=100)}
 
-def generate_ai_content(brand, title):
-    """Generate AI content for brand campaigns"""
-    templates = {
-        'প্রাণ ফুডস': {
-            'headline': f'{brand} - {title}',
-            'body': 'বিশেষ অফার! সীমিত সময়ের জন্য সবচেয়ে ভালো দামে পাচ্ছেন। আজই অর্ডার করুন!',
-            'hashtags': f'#{brand.replace(" ", "")} #বাংলাদেশ #অফার #স্পেশাল'
-        },
-        'আকিজ গ্রুপ': {
-            'headline': f'{brand} এর নতুন কালেকশন',
-            'body': 'নতুন ডিজাইনের সাথে উপস্থিত! স্টাইলিশ এবং আরামদায়ক, আপনার জন্য বিশেষ দাম।',
-            'hashtags': f'#{brand.replace(" ", "")} #ফ্যাশন #নতুনকালেকশন #বাংলাদেশ'
-        },
-        'ড্যানিশ ডেইরি': {
-            'headline': f'{brand} - পুষ্টির উৎস',
-            'body': '১০০% বিশুদ্ধ ও পুষ্টিকর। পরিবারের স্বাস্থ্যের জন্য সেরা পছন্দ।',
-            'hashtags': f'#{brand.replace(" ", "")} #স্বাস্থ্য #পুষ্টি #ডেইরি'
-        }
-    }
-    
-    return templates.get(brand, {
-        'headline': f'{brand} - {title}',
-        'body': 'বিশেষ অফার! সীমিত সময়ের জন্য বিশেষ দাম। আজই কিনুন!',
-        'hashtags': f'#{brand.replace(" ", "")} #অফার #বাংলাদেশ #স্পেশাল'
-    })
-
-def generate_video_script(brand, title):
-    """Generate video script for brand campaigns"""
-    scripts = {
-        'প্রাণ ফুডস': f'আজ আমরা দেখবো {brand} এর নতুন প্রোডাক্ট। স্বাদের সাথে স্বাস্থ্যের পরিপূর্ণ সংমিশ্রণ।',
-        'আকিজ গ্রুপ': f'{brand} এর নতুন কালেকশন নিয়ে আজকের ভিডিও। স্টাইলিশ ডিজাইন আর আরামদায়ক ফিট।',
-        'ড্যানিশ ডেইরি': f'{brand} - বিশুদ্ধতার প্রতিশ্রুতি। পরিবারের প্রতিটি সদস্যের জন্য পুষ্টির উৎস।'
-    }
-    
-    return scripts.get(brand, f'{brand} এর {title} সম্পর্কে আজকের বিশেষ ভিডিও।')
-
-def add_notification(message, type='info'):
-    """Add notification to session state"""
-    st.session_state.notifications.append({
-        'message': message,
-        'type': type,
-        'time': datetime.now().strftime("%H:%M")
-    })
-
-def show_dashboard():
-    """Show main dashboard"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>💰 Chronos Bazaar - ব্র্যান্ড মার্কেটপ্লেস</h1>
-        <p>ব্র্যান্ড ক্যাম্পেইনে অংশগ্রহণ করুন, কন্টেন্ট তৈরি করুন এবং আয় করুন</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Stats Cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="earning-card">
-            <h3>💰 ব্যালেন্স</h3>
-            <h2>৳ {st.session_state.balance}</h2>
-            <p>বর্তমান আয়</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        active_count = len([c for c in st.session_state.active_campaigns if c['status'] != 'completed'])
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); color: white; padding: 20px; border-radius: 15px;">
-            <h3>🎯 সক্রিয় ক্যাম্পেইন</h3>
-            <h2>{active_count}</h2>
-            <p>চলমান কাজ</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        completed_count = len(st.session_state.completed_campaigns)
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%); color: white; padding: 20px; border-radius: 15px;">
-            <h3>✅ সম্পন্ন ক্যাম্পেইন</h3>
-            <h2>{completed_count}</h2>
-            <p>সম্পন্ন কাজ</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        total_earning = sum(c.get('estimated_earning', 0) for c in st.session_state.completed_campaigns)
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 20px; border-radius: 15px;">
-            <h3>📈 মোট আয়</h3>
-            <h2>৳ {total_earning}</h2>
-            <p>সর্বমোট উপার্জন</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Quick Actions
-    st.subheader("⚡ দ্রুত একশন")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🏢 ব্র্যান্ড ব্রাউজ করুন", use_container_width=True):
-            st.session_state.page = "marketplace"
-            st.rerun()
-    
-    with col2:
-        if st.button("🎨 কন্টেন্ট তৈরি করুন", use_container_width=True):
-            st.session_state.page = "create_content"
-            st.rerun()
-    
-    with col3:
-        if st.button("📊 পারফরম্যান্স দেখুন", use_container_width=True):
-            st.session_state.page = "performance"
-            st.rerun()
-    
-    st.markdown("---")
-    
-    # Recent Activity
-    st.subheader("📝 সাম্প্রতিক কার্যকলাপ")
-    
-    if not st.session_state.active_campaigns and not st.session_state.completed_campaigns:
-        st.info("ℹ️ আপনার কোনো সক্রিয় বা সম্পন্ন ক্যাম্পেইন নেই। প্রথমে ব্র্যান্ড মার্কেটপ্লেস থেকে ক্যাম্পেইন গ্রহণ করুন।")
-    
+def report_timing(elapsed):
+    """Record this run's duration and show it in the sidebar when enabled"""
+    timings = get_run_timings()
+    if timings['cold_start'] is None:
+        timings['cold_start'] = elapsed
     else:
-        # Show active campaigns
-        if st.session_state.active_campaigns:
-            st.markdown("#### 🎯 চলমান ক্যাম্পেইন")
-            for campaign in st.session_state.active_campaigns[-3:]:
-                status_text = "কন্টেন্ট তৈরি করতে হবে" if campaign['status'] == 'content_pending' else "পোস্ট করা হয়েছে"
-                status_color = "#f59e0b" if campaign['status'] == 'content_pending' else "#10b981"
-                
-                st.markdown(f"""
-                <div style="
-                    background: white;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-left: 4px solid {status_color};
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                ">
-                    <h4>{campaign['brand']} - {campaign['title']}</h4>
-                    <p><strong>স্ট্যাটাস:</strong> <span style="color: {status_color}">{status_text}</span></p>
-                    <p><strong>আনুমানিক আয়:</strong> ৳{campaign.get('estimated_earning', 0):.2f}</p>
-                    <p><strong>ডেডলাইন:</strong> {campaign.get('deadline', '১৫ ডিসেম্বর')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Show completed campaigns
-        if st.session_state.completed_campaigns:
-            st.markdown("#### ✅ সম্পন্ন ক্যাম্পেইন")
-            for campaign in st.session_state.completed_campaigns[-3:]:
-                st.markdown(f"""
-                <div style="
-                    background: white;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-left: 4px solid #10b981;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                ">
-                    <h4>{campaign['brand']} - {campaign['title']}</h4>
-                    <p><strong>আয়:</strong> ৳{campaign.get('actual_earning', campaign.get('estimated_earning', 0)):.2f}</p>
-                    <p><strong>রিচ:</strong> {campaign.get('actual_reach', 0)}</p>
-                    <p><strong>সম্পন্ন তারিখ:</strong> {campaign.get('completed_date', 'N/A')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-def show_marketplace():
-    """Show brand marketplace"""
-    st.title("🏢 ব্র্যান্ড মার্কেটপ্লেস")
-    
-    # Search and Filter
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        search_query = st.text_input("ব্র্যান্ড/ক্যাম্পেইন সার্চ করুন", "")
-    
-    with col2:
-        content_filter = st.selectbox(
-            "কন্টেন্ট টাইপ ফিল্টার",
-            ["সবগুলো", "ভিডিও", "স্ট্যাটিক পোস্ট", "টেক্সট+ইমেজ"]
-        )
-    
-    with col3:
-        payment_filter = st.selectbox(
-            "পেমেন্ট ফিল্টার",
-            ["সবগুলো", "৳১০০ এর নিচে", "৳১০০-৳১৫০", "৳১৫০ এর উপরে"]
-        )
-    
-    st.markdown("---")
-    
-    # Display Brands
-    for brand_name, brand_data in BRANDS.items():
-        st.markdown(f"""
-        <div style="
-            background: {brand_data['color']}20;
-            padding: 20px;
-            border-radius: 15px;
-            margin: 20px 0;
-            border-left: 5px solid {brand_data['color']};
-        ">
-            <h2>{brand_data['logo']} {brand_name}</h2>
-            <p><strong>ক্যাটাগরি:</strong> {brand_data['category']} | <strong>রেটিং:</strong> {brand_data['rating']} ⭐</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Show campaigns for this brand
-        for campaign in brand_data['campaigns']:
-            if campaign['status'] == 'active':
-                # Apply filters
-                content_type_name = get_content_type_name(campaign['content_type'])
-                if content_filter != "সবগুলো" and content_filter != content_type_name:
-                    continue
-                
-                if payment_filter == "৳১০০ এর নিচে" and campaign['base_payment'] >= 100:
-                    continue
-                elif payment_filter == "৳১০০-৳১৫০" and (campaign['base_payment'] < 100 or campaign['base_payment'] > 150):
-                    continue
-                elif payment_filter == "৳১৫০ এর উপরে" and campaign['base_payment'] <= 150:
-                    continue
-                
-                if search_query and search_query.lower() not in f"{brand_name} {campaign['title']}".lower():
-                    continue
-                
-                display_campaign_card(brand_name, brand_data, campaign)
-
-def display_campaign_card(brand_name, brand_data, campaign):
-    """Display individual campaign card"""
-    col1, col2, col3 = st.columns([3, 1, 1])
-    
-    with col1:
-        max_earning = campaign['base_payment'] + (campaign['target_reach'] * campaign['per_engagement'])
-        st.markdown(f"""
-        <div class="campaign-card">
-            <h3>{campaign['title']}</h3>
-            <p>{campaign['description']}</p>
-            
-            <div style="display: flex; gap: 20px; margin-top: 15px;">
-                <div>
-                    <strong>কন্টেন্ট টাইপ:</strong><br>
-                    {get_content_type_name(campaign['content_type'])}
-                </div>
-                <div>
-                    <strong>বেস পেমেন্ট:</strong><br>
-                    ৳{campaign['base_payment']}
-                </div>
-                <div>
-                    <strong>লক্ষ্য রিচ:</strong><br>
-                    {campaign['target_reach']}
-                </div>
-                <div>
-                    <strong>ন্যূনতম এঙ্গেজমেন্ট:</strong><br>
-                    {campaign['min_engagement']}
-                </div>
-            </div>
-            
-            <div style="margin-top: 15px;">
-                <strong>পেমেন্ট স্ট্রাকচার:</strong><br>
-                • বেস পেমেন্ট: ৳{campaign['base_payment']}<br>
-                • প্রতি এঙ্গেজমেন্ট: ৳{campaign['per_engagement']}<br>
-                • সর্বোচ্চ আয়: ৳{max_earning:.2f}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("#### 📅 ডেডলাইন")
-        st.markdown(f"**{campaign['deadline']}**")
-        
-        st.markdown("#### ⏱️ সময় বাকি")
-        days_left = random.randint(3, 14)
-        st.markdown(f"**{days_left} দিন**")
-    
-    with col3:
-        # Check if already accepted
-        already_accepted = any(
-            c['campaign_id'] == campaign['id'] 
-            for c in st.session_state.active_campaigns + st.session_state.completed_campaigns
+        timings['reruns'].append(elapsed)
+    if os.environ.get('COLLABNET_SHOW_TIMINGS'):
+        reruns = sorted(timings['reruns'])
+        median = f"{reruns[len(reruns) // 2] * 1000:.0f} ms" if reruns else "—"
+        st.sidebar.caption(
+            f"⏱️ কোল্ড স্টার্ট {timings['cold_start'] * 1000:.0f} ms · "
+            f"এই রান {elapsed * 1000:.0f} ms · রিরান মিডিয়ান {median}"
         )
-        
-        if not already_accepted:
-            if st.button("✅ ক্যাম্পেইন গ্রহণ করুন", key=f"accept_{campaign['id']}", use_container_width=True):
-                # Add to active campaigns
-                st.session_state.active_campaigns.append({
-                    'campaign_id': campaign['id'],
-                    'brand': brand_name,
-                    'title': campaign['title'],
-                    'content_type': campaign['content_type'],
-                    'base_payment': campaign['base_payment'],
-                    'target_reach': campaign['target_reach'],
-                    'min_engagement': campaign['min_engagement'],
-                    'per_engagement': campaign['per_engagement'],
-                    'deadline': campaign['deadline'],
-                    'accepted_date': datetime.now().strftime("%d %b %Y"),
-                    'status': 'content_pending',
-                    'created_content': None,
-                    'current_reach': 0,
-                    'current_engagement': 0,
-                    'estimated_earning': 0
-                })
-                add_notification(f"✅ '{campaign['title']}' ক্যাম্পেইন গ্রহণ করা হয়েছে!", 'success')
-                st.success(f"✅ '{campaign['title']}' ক্যাম্পেইন গ্রহণ করা হয়েছে!")
-                time.sleep(1)
-                st.rerun()
-        else:
-            st.info("⏳ ইতিমধ্যে গ্রহণ করা হয়েছে")
-        
-        # Quick Stats
-        st.markdown("---")
-        st.markdown("#### 📊 পরিসংখ্যান")
-        st.markdown(f"""
-        <small>
-        • গ্রহণ করেছে: {random.randint(50, 200)} জন<br>
-        • সফল হয়েছে: {random.randint(30, 80)} জন<br>
-        • গড় আয়: ৳{campaign['base_payment'] + random.randint(20, 80)}
-        </small>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-
-def create_content():
-    """Create content for campaigns"""
-    st.title("🎨 কন্টেন্ট তৈরি করুন")
-    
-    if not st.session_state.active_campaigns:
-        st.info("📭 আপনি এখনো কোনো ক্যাম্পেইন গ্রহণ করেননি। প্রথমে ব্র্যান্ড মার্কেটপ্লেস থেকে ক্যাম্পেইন গ্রহণ করুন।")
-        if st.button("🏢 ব্র্যান্ড মার্কেটপ্লেস দেখুন"):
-            st.session_state.page = "marketplace"
-            st.rerun()
-        return
-    
-    # Select campaign to create content for
-    pending_campaigns = [c for c in st.session_state.active_campaigns if c['status'] == 'content_pending']
-    
-    if not pending_campaigns:
-        st.success("✅ আপনার সব ক্যাম্পেইনের জন্য কন্টেন্ট তৈরি করা হয়েছে!")
-        return
-    
-    campaign_options = {f"{c['brand']} - {c['title']}": c for c in pending_campaigns}
-    selected_campaign_name = st.selectbox(
-        "কন্টেন্ট তৈরি করার জন্য ক্যাম্পেইন সিলেক্ট করুন",
-        list(campaign_options.keys())
-    )
-    
-    selected_campaign = campaign_options[selected_campaign_name]
-    
-    st.markdown(f"""
-    <div class="brand-card" style="border-left-color: {BRANDS[selected_campaign['brand']]['color']};">
-        <h3>{BRANDS[selected_campaign['brand']]['logo']} {selected_campaign['brand']}</h3>
-        <h4>{selected_campaign['title']}</h4>
-        <p><strong>কন্টেন্ট টাইপ:</strong> {get_content_type_name(selected_campaign['content_type'])}</p>
-        <p><strong>বেস পেমেন্ট:</strong> ৳{selected_campaign['base_payment']}</p>
-        <p><strong>লক্ষ্য:</strong> {selected_campaign['target_reach']} রিচ, {selected_campaign['min_engagement']} এঙ্গেজমেন্ট</p>
-        <p><strong>ডেডলাইন:</strong> {selected_campaign.get('deadline', '১৫ ডিসেম্বর')}</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Content Creation Based on Type
-    content_type = selected_campaign['content_type']
-    
-    if content_type == 'static_post':
-        create_static_post_content(selected_campaign)
-    elif content_type == 'video':
-        create_video_content(selected_campaign)
-    elif content_type == 'text_image':
-        create_text_image_content(selected_campaign)
-
-def create_static_post_content(campaign):
-    """Create static post content"""
-    st.subheader("🖼️ স্ট্যাটিক পোস্ট তৈরি করুন")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Image Upload or Generation
-        st.markdown("#### ১. ইমেজ তৈরি/আপলোড করুন")
-        image_option = st.radio(
-            "ইমেজ অপশন",
-            ["AI দিয়ে জেনারেট করুন", "আপলোড করুন", "টেমপ্লেট ব্যবহার করুন"]
-        )
-        
-        if image_option == "AI দিয়ে জেনারেট করুন":
-            prompt = st.text_area("AI প্রম্পট লিখুন", 
-                                 f"{campaign['brand']} এর {campaign['title']} এর জন্য আকর্ষণীয় সোশ্যাল মিডিয়া পোস্ট")
-            if st.button("🖼️ AI ইমেজ জেনারেট করুন"):
-                st.info("AI ইমেজ জেনারেট হচ্ছে... (ডেমো)")
-                # Mock image generation
-                st.image("https://via.placeholder.com/600x400/3b82f6/ffffff?text=AI+Generated+Post", 
-                        caption="AI জেনারেটেড ইমেজ")
-        
-        elif image_option == "আপলোড করুন":
-            uploaded_file = st.file_uploader("ছবি আপলোড করুন", type=['jpg', 'png', 'jpeg'])
-            if uploaded_file:
-                st.image(uploaded_file, caption="আপলোডেড ইমেজ")
-        
-        else:  # Template
-            template = st.selectbox("টেমপ্লেট সিলেক্ট করুন", ["ডিজাইন ১", "ডিজাইন ২", "ডিজাইন ৩"])
-            st.image(f"https://via.placeholder.com/600x400/{BRANDS[campaign['brand']]['color'][1:]}/ffffff?text={campaign['brand']}+{template}", 
-                    caption=f"{template} টেমপ্লেট")
-    
-    with col2:
-        st.markdown("#### ২. টেক্সট কন্টেন্ট")
-        
-        # AI Text Generation
-        if st.button("🤖 AI টেক্সট জেনারেট করুন"):
-            generated_text = generate_ai_content(campaign['brand'], campaign['title'])
-            st.session_state.generated_text = generated_text
-        
-        if 'generated_text' in st.session_state:
-            headline = st.text_input("হেডলাইন", st.session_state.generated_text['headline'])
-            body = st.text_area("বডি টেক্সট", st.session_state.generated_text['body'], height=150)
-            hashtags = st.text_input("হ্যাশট্যাগ", st.session_state.generated_text['hashtags'])
-        else:
-            headline = st.text_input("হেডলাইন", f"{campaign['brand']} - {campaign['title']}")
-            body = st.text_area("বডি টেক্সট", "বিশেষ অফার! সীমিত সময়ের জন্য...", height=150)
-            hashtags = st.text_input("হ্যাশট্যাগ", f"#{campaign['brand'].replace(' ', '')} #অফার #বাংলাদেশ")
-        
-        st.markdown("#### ৩. প্ল্যাটফর্ম")
-        platforms = st.multiselect(
-            "পোস্ট করার প্ল্যাটফর্ম",
-            ["Facebook", "Instagram", "Twitter", "LinkedIn"],
-            default=["Facebook", "Instagram"]
-        )
-    
-    st.markdown("---")
-    
-    # Preview and Submit
-    st.subheader("👁️ পোস্ট প্রিভিউ")
-    
-    preview_col1, preview_col2 = st.columns([2, 1])
-    
-    with preview_col1:
-        st.markdown(f"""
-        <div style="
-            border: 2px solid #e5e7eb;
-            border-radius: 10px;
-            padding: 20px;
-            background: white;
-            margin: 10px 0;
-        ">
-            <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                <div style="
-                    width: 40px;
-                    height: 40px;
-                    background: {BRANDS[campaign['brand']]['color']};
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: white;
-                    font-size: 1.5rem;
-                    margin-right: 10px;
-                ">{BRANDS[campaign['brand']]['logo']}</div>
-                <div>
-                    <strong>আপনার পেজ</strong><br>
-                    <small>Sponsored • Just now</small>
-                </div>
-            </div>
-            
-            <p><strong>{headline}</strong></p>
-            <p>{body}</p>
-            
-            <div style="
-                background: #f3f4f6;
-                height: 300px;
-                border-radius: 10px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: #6b7280;
-                margin: 15px 0;
-            ">
-                🖼️ পোস্ট ইমেজ
-            </div>
-            
-            <p><small>{hashtags}</small></p>
-            
-            <div style="display: flex; gap: 20px; color: #6b7280; margin-top: 15px;">
-                <span>❤️ লাইক</span>
-                <span>💬 কমেন্ট</span>
-                <span>🔄 শেয়ার</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with preview_col2:
-        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
-        
-        estimated_reach = random.randint(300, 1200)
-        estimated_engagement = random.randint(50, 400)
-        
-        st.metric("আনুমানিক রিচ", f"{estimated_reach}")
-        st.metric("আনুমানিক এঙ্গেজমেন্ট", f"{estimated_engagement}")
-        
-        # Calculate estimated earning
-        base_earning = campaign['base_payment'] if estimated_engagement >= campaign['min_engagement'] else 0
-        engagement_earning = estimated_engagement * campaign['per_engagement']
-        total_estimated = base_earning + engagement_earning
-        
-        st.metric("আনুমানিক আয়", f"৳{total_estimated:.2f}")
-        
-        if st.button("✅ কন্টেন্ট সাবমিট করুন", type="primary", use_container_width=True):
-            # Update campaign
-            for i, c in enumerate(st.session_state.active_campaigns):
-                if c['campaign_id'] == campaign['campaign_id']:
-                    st.session_state.active_campaigns[i]['status'] = 'posted'
-                    st.session_state.active_campaigns[i]['created_content'] = {
-                        'headline': headline,
-                        'body': body,
-                        'hashtags': hashtags,
-                        'platforms': platforms,
-                        'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p")
-                    }
-                    st.session_state.active_campaigns[i]['current_reach'] = estimated_reach
-                    st.session_state.active_campaigns[i]['current_engagement'] = estimated_engagement
-                    st.session_state.active_campaigns[i]['estimated_earning'] = total_estimated
-            
-            # Add to content created
-            st.session_state.content_created.append({
-                'campaign_id': campaign['campaign_id'],
-                'brand': campaign['brand'],
-                'title': campaign['title'],
-                'content_type': campaign['content_type'],
-                'content': {'headline': headline, 'body': body, 'hashtags': hashtags},
-                'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p"),
-                'estimated_earning': total_estimated
-            })
-            
-            add_notification(f"✅ '{campaign['title']}' এর কন্টেন্ট সাবমিট করা হয়েছে!", 'success')
-            st.success("✅ কন্টেন্ট সাবমিট করা হয়েছে! পারফরম্যান্স ট্র্যাকিং শুরু হয়েছে।")
-            st.balloons()
-            time.sleep(2)
-            st.rerun()
-
-def create_video_content(campaign):
-    """Create video content section"""
-    st.subheader("🎥 ভিডিও কন্টেন্ট তৈরি করুন")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("#### ১. ভিডিও স্ক্রিপ্ট")
-        
-        if st.button("🤖 AI স্ক্রিপ্ট জেনারেট করুন"):
-            script = generate_video_script(campaign['brand'], campaign['title'])
-            st.session_state.video_script = script
-        
-        if 'video_script' in st.session_state:
-            script_text = st.text_area("স্ক্রিপ্ট", st.session_state.video_script, height=200)
-        else:
-            script_text = st.text_area("স্ক্রিপ্ট", f"{campaign['brand']} এর {campaign['title']} সম্পর্কে ভিডিও স্ক্রিপ্ট...", height=200)
-        
-        st.markdown("#### ২. ভিডিও সেটিংস")
-        
-        duration = st.slider("ভিডিও দৈর্ঘ্য (সেকেন্ড)", 15, 60, 30)
-        aspect_ratio = st.selectbox("অ্যাসপেক্ট রেশিও", ["9:16 (Reels/TikTok)", "1:1 (Instagram)", "16:9 (YouTube)"])
-        music = st.selectbox("ব্যাকগ্রাউন্ড মিউজিক", ["Upbeat", "Calm", "Trending", "No Music"])
-        voiceover = st.selectbox("ভয়েসওভার", ["পুরুষ (বাংলা)", "মহিলা (বাংলা)", "ইংরেজি", "No Voiceover"])
-    
-    with col2:
-        st.markdown("#### ৩. মিডিয়া আপলোড")
-        
-        uploaded_files = st.file_uploader(
-            "ছবি/ভিডিও ক্লিপ আপলোড করুন",
-            type=['jpg', 'png', 'mp4', 'mov'],
-            accept_multiple_files=True
-        )
-        
-        if uploaded_files:
-            st.success(f"{len(uploaded_files)} টি ফাইল আপলোড হয়েছে")
-        
-        st.markdown("#### ৪. AI ভিডিও জেনারেশন")
-        
-        if st.button("🎬 AI ভিডিও জেনারেট করুন"):
-            st.info("AI ভিডিও জেনারেট হচ্ছে... (ডেমো)")
-            # Mock video generation
-            st.markdown("""
-            <div style="
-                background: linear-gradient(45deg, #667eea, #764ba2);
-                height: 300px;
-                border-radius: 10px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: white;
-                font-size: 1.5rem;
-                margin: 15px 0;
-            ">
-                🎥 AI Generated Video Preview
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Preview and Submit
-        st.markdown("---")
-        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
-        
-        estimated_reach = random.randint(300, 1500)
-        estimated_engagement = random.randint(50, 500)
-        
-        st.metric("আনুমানিক রিচ", f"{estimated_reach}")
-        st.metric("আনুমানিক এঙ্গেজমেন্ট", f"{estimated_engagement}")
-        
-        # Calculate estimated earning
-        base_earning = campaign['base_payment'] if estimated_engagement >= campaign['min_engagement'] else 0
-        engagement_earning = estimated_engagement * campaign['per_engagement']
-        total_estimated = base_earning + engagement_earning
-        
-        st.metric("আনুমানিক আয়", f"৳{total_estimated:.2f}")
-        
-        if st.button("✅ ভিডিও সাবমিট করুন", type="primary", use_container_width=True):
-            # Update campaign
-            for i, c in enumerate(st.session_state.active_campaigns):
-                if c['campaign_id'] == campaign['campaign_id']:
-                    st.session_state.active_campaigns[i]['status'] = 'posted'
-                    st.session_state.active_campaigns[i]['created_content'] = {
-                        'script': script_text,
-                        'duration': duration,
-                        'aspect_ratio': aspect_ratio,
-                        'music': music,
-                        'voiceover': voiceover,
-                        'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p")
-                    }
-                    st.session_state.active_campaigns[i]['current_reach'] = estimated_reach
-                    st.session_state.active_campaigns[i]['current_engagement'] = estimated_engagement
-                    st.session_state.active_campaigns[i]['estimated_earning'] = total_estimated
-            
-            # Add to content created
-            st.session_state.content_created.append({
-                'campaign_id': campaign['campaign_id'],
-                'brand': campaign['brand'],
-                'title': campaign['title'],
-                'content_type': campaign['content_type'],
-                'content': {'script': script_text, 'duration': duration},
-                'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p"),
-                'estimated_earning': total_estimated
-            })
-            
-            add_notification(f"✅ '{campaign['title']}' এর ভিডিও সাবমিট করা হয়েছে!", 'success')
-            st.success("✅ ভিডিও সাবমিট করা হয়েছে! পারফরম্যান্স ট্র্যাকিং শুরু হয়েছে।")
-            st.balloons()
-            time.sleep(2)
-            st.rerun()
-
-def create_text_image_content(campaign):
-    """Create text+image content section"""
-    st.subheader("📝 টেক্সট+ইমেজ কন্টেন্ট তৈরি করুন")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("#### ১. টেক্সট কন্টেন্ট")
-        
-        if st.button("🤖 AI টেক্সট জেনারেট করুন"):
-            generated_text = generate_ai_content(campaign['brand'], campaign['title'])
-            st.session_state.generated_text = generated_text
-        
-        if 'generated_text' in st.session_state:
-            headline = st.text_input("হেডলাইন", st.session_state.generated_text['headline'])
-            body = st.text_area("বডি টেক্সট", st.session_state.generated_text['body'], height=150)
-            hashtags = st.text_input("হ্যাশট্যাগ", st.session_state.generated_text['hashtags'])
-        else:
-            headline = st.text_input("হেডলাইন", f"{campaign['brand']} - {campaign['title']}")
-            body = st.text_area("বডি টেক্সট", "বিশেষ অফার! সীমিত সময়ের জন্য...", height=150)
-            hashtags = st.text_input("হ্যাশট্যাগ", f"#{campaign['brand'].replace(' ', '')} #অফার #বাংলাদেশ")
-    
-    with col2:
-        st.markdown("#### ২. ইমেজ সিলেক্ট করুন")
-        
-        image_option = st.radio(
-            "ইমেজ অপশন",
-            ["AI দিয়ে জেনারেট করুন", "আপলোড করুন", "স্টক ইমেজ ব্যবহার করুন"]
-        )
-        
-        if image_option == "AI দিয়ে জেনারেট করুন":
-            prompt = st.text_input("AI প্রম্পট লিখুন", f"{campaign['brand']} {campaign['title']}")
-            if st.button("🖼️ জেনারেট ইমেজ"):
-                st.info("AI ইমেজ জেনারেট হচ্ছে... (ডেমো)")
-        
-        elif image_option == "আপলোড করুন":
-            uploaded_file = st.file_uploader("ছবি আপলোড করুন", type=['jpg', 'png', 'jpeg'])
-            if uploaded_file:
-                st.image(uploaded_file, caption="আপলোডেড ইমেজ", width=200)
-        
-        else:
-            st.info("স্টক ইমেজ লাইব্রেরি থেকে সিলেক্ট করুন")
-        
-        # Preview and Submit
-        st.markdown("---")
-        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
-        
-        estimated_reach = random.randint(200, 1000)
-        estimated_engagement = random.randint(40, 300)
-        
-        st.metric("আনুমানিক রিচ", f"{estimated_reach}")
-        st.metric("আনুমানিক এঙ্গেজমেন্ট", f"{estimated_engagement}")
-        
-        # Calculate estimated earning
-        base_earning = campaign['base_payment'] if estimated_engagement >= campaign['min_engagement'] else 0
-        engagement_earning = estimated_engagement * campaign['per_engagement']
-        total_estimated = base_earning + engagement_earning
-        
-        st.metric("আনুমানিক আয়", f"৳{total_estimated:.2f}")
-        
-        if st.button("✅ কন্টেন্ট সাবমিট করুন", type="primary", use_container_width=True):
-            # Update campaign
-            for i, c in enumerate(st.session_state.active_campaigns):
-                if c['campaign_id'] == campaign['campaign_id']:
-                    st.session_state.active_campaigns[i]['status'] = 'posted'
-                    st.session_state.active_campaigns[i]['created_content'] = {
-                        'headline': headline,
-                        'body': body,
-                        'hashtags': hashtags,
-                        'image_option': image_option,
-                        'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p")
-                    }
-                    st.session_state.active_campaigns[i]['current_reach'] = estimated_reach
-                    st.session_state.active_campaigns[i]['current_engagement'] = estimated_engagement
-                    st.session_state.active_campaigns[i]['estimated_earning'] = total_estimated
-            
-            # Add to content created
-            st.session_state.content_created.append({
-                'campaign_id': campaign['campaign_id'],
-                'brand': campaign['brand'],
-                'title': campaign['title'],
-                'content_type': campaign['content_type'],
-                'content': {'headline': headline, 'body': body, 'hashtags': hashtags},
-                'created_date': datetime.now().strftime("%d %b %Y, %I:%M %p"),
-                'estimated_earning': total_estimated
-            })
-            
-            add_notification(f"✅ '{campaign['title']}' এর টেক্সট+ইমেজ কন্টেন্ট সাবমিট করা হয়েছে!", 'success')
-            st.success("✅ কন্টেন্ট সাবমিট করা হয়েছে! পারফরম্যান্স ট্র্যাকিং শুরু হয়েছে।")
-            st.balloons()
-            time.sleep(2)
-            st.rerun()
-
-def show_performance():
-    """Show performance tracking"""
-    st.title("📊 পারফরম্যান্স ট্র্যাকিং")
-    
-    # Filter options
-    col1, col2 = st.columns(2)
-    with col1:
-        time_filter = st.selectbox("সময়ফিল্টার", ["সব সময়", "সর্বশেষ ৭ দিন", "সর্বশেষ ৩০ দিন", "এই মাস"])
-    with col2:
-        campaign_filter = st.selectbox(
-            "ক্যাম্পেইন ফিল্টার",
-            ["সব ক্যাম্পেইন"] + [c['title'] for c in st.session_state.active_campaigns + st.session_state.completed_campaigns]
-        )
-    
-    st.markdown("---")
-    
-    # Performance Metrics
-    st.subheader("📈 পারফরম্যান্স মেট্রিক্স")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    total_reach = sum(c.get('current_reach', 0) for c in st.session_state.active_campaigns + st.session_state.completed_campaigns)
-    total_engagement = sum(c.get('current_engagement', 0) for c in st.session_state.active_campaigns + st.session_state.completed_campaigns)
-    total_earning = sum(c.get('estimated_earning', 0) for c in st.session_state.completed_campaigns) + \
-                   sum(c.get('estimated_earning', 0) for c in st.session_state.active_campaigns if c['status'] == 'posted')
-    campaign_count = len(st.session_state.active_campaigns) + len(st.session_state.completed_campaigns)
-    
-    with col1:
-        st.metric("মোট রিচ", f"{total_reach}")
-    with col2:
-        st.metric("মোট এঙ্গেজমেন্ট", f"{total_engagement}")
-    with col3:
-        st.metric("মোট আয়", f"৳{total_earning:.2f}")
-    with col4:
-        st.metric("মোট ক্যাম্পেইন", f"{campaign_count}")
-    
-    st.markdown("---")
-    
-    # Detailed Campaign Performance
-    st.subheader("🎯 ক্যাম্পেইন পারফরম্যান্স")
-    
-    if not st.session_state.active_campaigns and not st.session_state.completed_campaigns:
-        st.info("📭 কোনো ক্যাম্পেইন ডেটা নেই। প্রথমে কিছু ক্যাম্পেইন গ্রহণ করুন।")
-    else:
-        # Create performance table
-        performance_data = []
-        
-        for campaign in st.session_state.active_campaigns + st.session_state.completed_campaigns:
-            if campaign_filter != "সব ক্যাম্পেইন" and campaign['title'] != campaign_filter:
-                continue
-            
-            performance_data.append({
-                'ব্র্যান্ড': campaign['brand'],
-                'ক্যাম্পেইন': campaign['title'],
-                'স্ট্যাটাস': 'সম্পন্ন' if campaign in st.session_state.completed_campaigns else 'চলমান',
-                'রিচ': campaign.get('current_reach', 0),
-                'এঙ্গেজমেন্ট': campaign.get('current_engagement', 0),
-                'আনুমানিক আয়': f"৳{campaign.get('estimated_earning', 0):.2f}",
-                'শুরু তারিখ': campaign.get('accepted_date', 'N/A')
-            })
-        
-        if performance_data:
-            st.dataframe(pd.DataFrame(performance_data), use_container_width=True)
-        else:
-            st.info("ফিল্টারের সাথে মিলছে না এমন কোনো ক্যাম্পেইন নেই।")
 
 def show_notifications():
     """Show notifications panel"""
-    st.sidebar.markdown("### 🔔 নোটিফিকেশন")
+    feed = st.session_state.notifications
+    unread = f" ({feed.unread} নতুন)" if feed.unread else ""
+    st.sidebar.markdown(f"### 🔔 নোটিফিকেশন{unread}")
     
-    if not st.session_state.notifications:
+    if not len(feed):
         st.sidebar.info("কোনো নোটিফিকেশন নেই")
     else:
-        for notif in reversed(st.session_state.notifications[-5:]):
+        for notif in feed.latest(5):
             color = "#10b981" if notif['type'] == 'success' else "#3b82f6"
-            st.sidebar.markdown(f"""
-            <div style="
-                background: {color}10;
-                border-left: 3px solid {color};
-                padding: 10px;
-                margin: 5px 0;
-                border-radius: 5px;
-                font-size: 0.9rem;
-            ">
-                <div style="display: flex; justify-content: space-between;">
-                    <span>{notif['message']}</span>
-                    <small>{notif['time']}</small>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.sidebar.markdown(render_notification(notif, color), unsafe_allow_html=True)
+        feed.mark_read()
     
     if st.sidebar.button("নোটিফিকেশন পরিষ্কার করুন"):
-        st.session_state.notifications = []
+        feed.clear()
         st.rerun()
 
 def main():
@@ -1059,7 +71,7 @@ def main():
         st.session_state.page = "dashboard"
     
     # Sidebar Navigation
-    st.sidebar.image("https://via.placeholder.com/150x50/667eea/ffffff?text=Chronos+Bazaar", use_column_width=True)
+    st.sidebar.image(placeholder_image(150, 50, '#667eea', "Chronos Bazaar"), use_column_width=True)
     
     st.sidebar.markdown("---")
     st.sidebar.title("📱 নেভিগেশন")
@@ -1090,28 +102,32 @@ def main():
     
     # User info
     st.sidebar.markdown("### 👤 আপনার তথ্য")
-    st.sidebar.markdown(f"**ব্যালেন্স:** ৳{st.session_state.balance}")
-    st.sidebar.markdown(f"**সক্রিয় ক্যাম্পেইন:** {len([c for c in st.session_state.active_campaigns if c['status'] != 'completed'])}")
+    st.sidebar.markdown(f"**ব্যালেন্স:** ৳{to_taka(st.session_state.balance_paisa)}")
+    st.sidebar.markdown(f"**সক্রিয় ক্যাম্পেইন:** {st.session_state.ledger.active_count}")
     
     if st.sidebar.button("💰 উইথড্র করুন"):
-        if st.session_state.balance > 0:
-            st.sidebar.success(f"৳{st.session_state.balance} উইথড্র করা হয়েছে!")
-            st.session_state.balance = 0
+        amount = st.session_state.balance_paisa
+        # Debit only the amount shown, so payouts credited meanwhile stay in the balance
+        remaining = get_store().debit_balance(CREATOR_ID, amount) if amount > 0 else None
+        if remaining is not None:
+            st.sidebar.success(f"৳{to_taka(amount)} উইথড্র করা হয়েছে!")
+            st.session_state.balance_paisa = remaining
             add_notification("✅ উইথড্র সফল হয়েছে!", 'success')
         else:
             st.sidebar.warning("উইথড্র করার জন্য পর্যাপ্ত ব্যালেন্স নেই")
     
     st.sidebar.markdown("---")
     
-    # Page selection
-    if st.session_state.page == "dashboard":
-        show_dashboard()
-    elif st.session_state.page == "marketplace":
-        show_marketplace()
-    elif st.session_state.page == "create_content":
-        create_content()
-    elif st.session_state.page == "performance":
-        show_performance()
+    # Message queued by the previous run (e.g. a content submission)
+    flash = st.session_state.pop('flash', None)
+    if flash:
+        st.success(flash)
+        st.balloons()
+    
+    # Page selection; each page module is imported on its first visit
+    load_page(st.session_state.page)()
+    
+    report_timing(time.perf_counter() - RUN_STARTED)
 
 if __name__ == "__main__":
     main()
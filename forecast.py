@@ -0,0 +1,71 @@
+"""Seeded Monte Carlo performance forecasts per (creator, campaign)"""
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+
+from payouts import PAISA_PER_TAKA, compute_payouts
+
+# Typical (reach, engagement) ranges per content type, as (low, high)
+CONTENT_TYPE_RANGES = {
+    'static_post': ((300, 1200), (50, 400)),
+    'video': ((300, 1500), (50, 500)),
+    'text_image': ((200, 1000), (40, 300))
+}
+
+PERCENTILES = (10, 50, 90)
+
+# Spread of the engagement rate; higher means tighter around the mean
+RATE_CONCENTRATION = 20.0
+
+
+def forecast_seed(creator_id, campaign_id):
+    """Stable 64-bit seed for a (creator, campaign) pair"""
+    digest = hashlib.blake2b(f"{creator_id}:{campaign_id}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+@lru_cache(maxsize=4096)
+def _simulate(seed, content_type, base_payment, target_reach, per_engagement, min_engagement, samples):
+    (reach_lo, reach_hi), (eng_lo, eng_hi) = CONTENT_TYPE_RANGES.get(content_type, CONTENT_TYPE_RANGES['static_post'])
+    rng = np.random.default_rng(seed)
+
+    # Log-normal reach whose 10th-90th percentile band spans the typical range
+    median = np.sqrt(reach_lo * reach_hi)
+    sigma = np.log(reach_hi / reach_lo) / (2 * 1.2816)
+    reach = np.rint(rng.lognormal(np.log(median), sigma, samples)).astype(np.int64)
+
+    # Engagement is a Beta-distributed share of the reached audience
+    mean_rate = ((eng_lo + eng_hi) / 2) / ((reach_lo + reach_hi) / 2)
+    rate = rng.beta(mean_rate * RATE_CONCENTRATION, (1 - mean_rate) * RATE_CONCENTRATION, samples)
+    engagement = rng.binomial(reach, rate)
+
+    earning = compute_payouts(
+        base_payment, target_reach, per_engagement, min_engagement, engagement
+    )['total'] / PAISA_PER_TAKA
+
+    result = {}
+    for name, values in (('reach', reach), ('engagement', engagement), ('earning', earning)):
+        p = np.percentile(values, PERCENTILES)
+        if name == 'earning':
+            result[name] = {f"p{q}": round(float(v), 2) for q, v in zip(PERCENTILES, p)}
+        else:
+            result[name] = {f"p{q}": int(round(v)) for q, v in zip(PERCENTILES, p)}
+    return result
+
+
+def forecast_campaign(creator_id, campaign, samples=4000):
+    """Forecast reach, engagement and earning percentiles for an accepted campaign
+
+    The same creator and campaign always get the same forecast, and the
+    result is memoized, so it is safe to call on every render.
+    """
+    return _simulate(
+        forecast_seed(creator_id, campaign['campaign_id']),
+        campaign['content_type'],
+        campaign['base_payment'],
+        campaign['target_reach'],
+        campaign['per_engagement'],
+        campaign['min_engagement'],
+        samples
+    )
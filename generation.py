@@ -0,0 +1,129 @@
+"""Background generation service for AI captions and video scripts"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from generation_cache import cache_key
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class GenerationJob:
+    """One generation request and its outcome"""
+
+    def __init__(self, kind, args, key=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.args = args
+        self.key = key
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.future = None
+
+
+class GenerationService:
+    """Job queue in front of a generation model
+
+    Jobs run on a bounded worker pool, so at most `max_workers`
+    generations run at once no matter how many sessions submit work,
+    and no Streamlit script thread ever waits on the model. Finished
+    jobs are kept for polling until `max_jobs` newer ones push them out.
+
+    With a GenerationCache, repeat requests for the same campaign are
+    answered from the cache as already-finished jobs without calling
+    the model.
+    """
+
+    def __init__(self, model, max_workers=4, max_jobs=1000, cache=None):
+        self.model = model
+        self.cache = cache
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='generation')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, brand, title, campaign_id=None, content_type=None, prompt=None):
+        """Queue a generation ('caption' or 'script') and return its job id"""
+        handler = getattr(self.model, kind)
+        key = None
+        if self.cache is not None:
+            key = cache_key(kind, brand, campaign_id, content_type, title if prompt is None else prompt)
+        job = GenerationJob(kind, (brand, title), key)
+
+        cached = self.cache.get(key) if key is not None else None
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict()
+            if cached is not None:
+                job.status, job.result = DONE, cached
+        if cached is None:
+            job.future = self._executor.submit(self._run, job, handler)
+        return job.id
+
+    def _run(self, job, handler):
+        with self._lock:
+            if job.status == CANCELLED:
+                return
+            job.status = RUNNING
+        try:
+            result = handler(*job.args)
+        except Exception as exc:
+            with self._lock:
+                if job.status != CANCELLED:
+                    job.status, job.error = FAILED, str(exc)
+            return
+        with self._lock:
+            # A job cancelled while running finishes, but its result is dropped
+            if job.status != CANCELLED:
+                job.status, job.result = DONE, result
+        if job.key is not None:
+            # Caching is an optimization; the job already has its result
+            try:
+                self.cache.put(job.key, result)
+            except Exception:
+                pass
+
+    def _evict(self):
+        while len(self._jobs) > self.max_jobs:
+            oldest_id = next(iter(self._jobs))
+            if self._jobs[oldest_id].status not in FINISHED:
+                break
+            del self._jobs[oldest_id]
+
+    def get(self, job_id):
+        """Return the job for an id, or None if unknown or evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id, timeout):
+        """Block for at most timeout seconds for a job to finish"""
+        job = self.get(job_id)
+        if job is not None and job.future is not None:
+            wait([job.future], timeout=timeout)
+        return job
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED:
+                return False
+            job.status = CANCELLED
+            future = job.future
+        if future is not None:
+            future.cancel()
+        return True
+
+    def shutdown(self):
+        """Stop the worker pool, dropping queued jobs"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,125 @@
+"""Memoized AI generation results shared across creators"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Normalize text for cache keys: NFC, case-folded, single-spaced"""
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def cache_key(kind, brand, campaign_id, content_type, prompt):
+    """Build the cache key for one generation request"""
+    return (kind, normalize_text(brand), campaign_id, content_type, normalize_text(prompt))
+
+
+class GenerationCache:
+    """LRU cache with TTL and hit/miss counters, plus an optional on-disk tier
+
+    The memory tier holds at most `maxsize` entries. With `disk_dir` set,
+    every stored entry is also written as one JSON file, so results
+    survive restarts and are shared with other worker processes; a
+    memory miss then checks the disk before counting as a miss. The disk
+    tier is best effort: a failed write only loses that entry's disk
+    copy, and expired files are deleted when they are read.
+    """
+
+    def __init__(self, maxsize=1024, ttl=24 * 3600, disk_dir=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha256(json.dumps(key, ensure_ascii=False).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.json")
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss or expiry"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, entry)
+            return entry[1]
+
+    def put(self, key, value):
+        """Store a value under key for the configured TTL"""
+        entry = (time.time() + self.ttl, value)
+        with self._lock:
+            self._store(key, entry)
+        if self.disk_dir:
+            self._write_disk(key, entry)
+
+    def _write_disk(self, key, entry):
+        tmp_path = None
+        try:
+            # A unique temp file per writer, since several processes share the directory
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'expires_at': entry[0], 'value': entry[1]}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key, now):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            expires_at, value = data['expires_at'], data['value']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if expires_at <= now:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        return expires_at, value
+
+    def stats(self):
+        """Return hit/miss counters and the current memory size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries)
+            }
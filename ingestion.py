@@ -0,0 +1,282 @@
+"""Streaming ingestion of post engagement events
+
+Usage:
+    python ingestion.py FILE [--follow] [--batch-size N] [--max-delay SECONDS] [--db PATH]
+
+FILE is a .jsonl file with one event per line, or "-" for stdin:
+
+    {"creator_id": "demo", "campaign_id": "gp_001", "reach": 120,
+     "likes": 14, "comments": 2, "shares": 1}
+
+Counts are increments since the previous event for the same post, so a
+platform webhook can forward its deltas unchanged. Likes, comments and
+shares together make up a campaign's engagement.
+"""
+import argparse
+import json
+import os
+import queue
+import sys
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+from bn_dates import parse_bengali_date
+from money import PAISA_PER_TAKA, to_taka
+from payouts import campaign_arrays, compute_payouts
+from storage import SQLiteCreatorStore
+from timeseries import RETENTION, STEPS, rollup_rows
+
+ENGAGEMENT_FIELDS = ('likes', 'comments', 'shares')
+
+# Put on an event queue to make queue_events stop
+STOP = object()
+
+
+def read_events(stream, follow=False, poll_interval=0.5):
+    """Yield events from a JSONL stream; invalid lines come through as ValueError
+
+    With `follow` the stream is tailed like `tail -f`, and None is yielded
+    whenever it runs dry so the consumer can flush a partial batch.
+    """
+    while True:
+        line = stream.readline()
+        if not line:
+            if not follow:
+                return
+            yield None
+            time.sleep(poll_interval)
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as exc:
+            yield exc
+
+
+def queue_events(events, poll_interval=0.5):
+    """Yield events from a queue.Queue until STOP, and None while it is idle"""
+    while True:
+        try:
+            event = events.get(timeout=poll_interval)
+        except queue.Empty:
+            yield None
+            continue
+        if event is STOP:
+            return
+        yield event
+
+
+class IngestReport:
+    """Running totals of an ingestion run"""
+
+    def __init__(self):
+        self.events = 0
+        self.rejected = 0
+        self.batches = 0
+        self.completed = 0
+        self.paid_paisa = 0
+
+
+class EngagementIngestor:
+    """Micro-batches engagement events into per-campaign counters and settles campaigns
+
+    Events are summed per (creator, campaign) in memory and written as one
+    additive upsert per batch, so a batch costs one transaction however
+    many events it holds. A batch is flushed after `batch_size` events or
+    once its oldest event is `max_delay` seconds old.
+
+    After each flush the posted campaigns it touched get their current
+    reach, engagement and estimated earning. A campaign completes when its
+    reach meets the target or its deadline has passed; its payout is then
+    credited to the creator's balance in the same transaction, once only
+    even if several ingestors settle the same campaign. Campaigns
+    without new events are checked against their deadlines every
+    `sweep_interval` seconds.
+
+    Each flush also records the posted campaigns' new totals in their
+    hourly and daily rollups (see timeseries.py) for trend charts.
+    """
+
+    def __init__(self, store, batch_size=20000, max_delay=1.0, sweep_interval=60.0):
+        self.store = store
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.sweep_interval = sweep_interval
+        self.report = IngestReport()
+        self._swept_at = None
+
+    def run(self, events):
+        """Consume an event iterable until it ends; returns the IngestReport"""
+        report = self.report
+        batch = {}
+        pending = 0
+        # Monotonic time by which the current batch must be flushed
+        due = None
+        try:
+            for event in events:
+                if event is not None:
+                    try:
+                        key = (event['creator_id'], event['campaign_id'])
+                        reach = int(event.get('reach', 0))
+                        engagement = sum(int(event.get(field, 0)) for field in ENGAGEMENT_FIELDS)
+                    except (TypeError, ValueError, KeyError, AttributeError):
+                        report.rejected += 1
+                        continue
+                    if reach < 0 or engagement < 0:
+                        report.rejected += 1
+                        continue
+                    totals = batch.get(key)
+                    if totals is None:
+                        batch[key] = [reach, engagement]
+                    else:
+                        totals[0] += reach
+                        totals[1] += engagement
+                    pending += 1
+                    now = time.monotonic()
+                    if due is None:
+                        due = now + self.max_delay
+                    if pending < self.batch_size and now < due:
+                        continue
+
+                if pending and (pending >= self.batch_size or time.monotonic() >= due):
+                    full, count = batch, pending
+                    batch, pending, due = {}, 0, None
+                    self.flush(full, count)
+                elif event is None:
+                    self._maybe_sweep()
+        except KeyboardInterrupt:
+            # Stop cleanly, keeping the events read so far
+            pass
+
+        if pending:
+            self.flush(batch, pending)
+        return report
+
+    def flush(self, batch, event_count=0):
+        """Write one batch of {(creator_id, campaign_id): [reach, engagement]} and settle it"""
+        rows = self.store.add_engagement(
+            (creator_id, campaign_id, reach, engagement)
+            for (creator_id, campaign_id), (reach, engagement) in batch.items()
+        )
+        now = time.time()
+        self.store.save_engagement_series([
+            (creator_id,) + row
+            for creator_id, record, reach, engagement in rows
+            for row in rollup_rows(record['campaign_id'], now, reach, engagement)
+        ])
+        self.report.events += event_count
+        self.report.batches += 1
+        self.settle(rows)
+        self._maybe_sweep()
+
+    def _maybe_sweep(self):
+        now = time.monotonic()
+        if self._swept_at is None or now - self._swept_at >= self.sweep_interval:
+            self._swept_at = now
+            self.sweep()
+
+    def sweep(self, today=None):
+        """Settle every posted campaign, completing those past their deadline, and apply rollup retention"""
+        now = time.time()
+        self.store.prune_engagement_series({step: now - RETENTION[step] for step in STEPS})
+        return self.settle(self.store.load_posted_campaigns(), today, only_changed=True)
+
+    def settle(self, rows, today=None, only_changed=False):
+        """Update (creator_id, record, reach, engagement) rows and complete the due ones
+
+        Payouts for the whole batch are computed in one vectorized call.
+        With `only_changed`, records that neither complete nor change are
+        not written back. Earnings are kept as exact integer paisa in
+        `earning_paisa`; `estimated_earning` is its Taka value for display.
+        Returns the number of campaigns this call completed.
+        """
+        if not rows:
+            return 0
+        today = today or date.today()
+        records = [record for _, record, _, _ in rows]
+        reach = np.array([r or 0 for _, _, r, _ in rows], dtype=np.int64)
+        engagement = np.array([e or 0 for _, _, _, e in rows], dtype=np.int64)
+        terms = campaign_arrays(records)
+        totals = compute_payouts(
+            terms['base_payment'], terms['target_reach'], terms['per_engagement'],
+            terms['min_engagement'], engagement
+        )['total']
+
+        # Deadlines carry their year since they are pinned when set; older
+        # ones without a year count from the day the campaign was accepted
+        deadlines = {}
+        keys = []
+        for record in records:
+            accepted_at = record.get('accepted_at')
+            key = (record.get('deadline'), date.fromtimestamp(accepted_at) if accepted_at else None)
+            if key not in deadlines:
+                try:
+                    deadlines[key] = parse_bengali_date(key[0], key[1]) < today
+                except (TypeError, ValueError):
+                    deadlines[key] = False
+            keys.append(key)
+        due = np.array([deadlines[key] for key in keys], dtype=bool)
+        done = (reach >= terms['target_reach']) | due
+
+        now = time.time()
+        completed_date = datetime.fromtimestamp(now).strftime("%d %b %Y")
+        updates = []
+        for i, (creator_id, record, measured, _) in enumerate(rows):
+            # Until its first event a post keeps the estimate from submission
+            if measured is None and not due[i]:
+                continue
+            changes = {
+                'current_reach': int(reach[i]),
+                'current_engagement': int(engagement[i]),
+                'earning_paisa': int(totals[i]),
+                'estimated_earning': int(totals[i]) / PAISA_PER_TAKA
+            }
+            if done[i]:
+                changes.update(
+                    status='completed', completed_at=now, completed_date=completed_date,
+                    actual_reach=changes['current_reach'], actual_earning=changes['estimated_earning']
+                )
+            elif only_changed and all(record.get(k) == v for k, v in changes.items()):
+                continue
+            record.update(changes)
+            updates.append((creator_id, record))
+
+        if not updates:
+            return 0
+        completed = self.store.settle_campaigns(updates)
+        self.report.completed += len(completed)
+        self.report.paid_paisa += sum(record['earning_paisa'] for _, record in completed)
+        return len(completed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest post engagement events")
+    parser.add_argument('file', help="JSONL event file, or - for stdin")
+    parser.add_argument('--follow', action='store_true', help="keep reading as the file grows")
+    parser.add_argument('--batch-size', type=int, default=20000)
+    parser.add_argument('--max-delay', type=float, default=1.0)
+    parser.add_argument('--db', default=os.environ.get('COLLABNET_DB_PATH', 'collabnet.db'))
+    args = parser.parse_args(argv)
+
+    ingestor = EngagementIngestor(SQLiteCreatorStore(args.db), args.batch_size, args.max_delay)
+    stream = sys.stdin if args.file == '-' else open(args.file, encoding='utf-8')
+    started = time.perf_counter()
+    try:
+        report = ingestor.run(read_events(stream, args.follow))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{report.events} events in {report.batches} batches ({report.events / max(elapsed, 1e-9):,.0f}/s), "
+        f"{report.rejected} rejected, {report.completed} campaigns completed, ৳{to_taka(report.paid_paisa)} paid",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
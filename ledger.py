@@ -0,0 +1,148 @@
+"""Per-creator campaign bookkeeping kept in the Streamlit session"""
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+from money import PAISA_PER_TAKA
+
+
+def accepted_timestamp(record):
+    """Return a record's acceptance time as a UNIX timestamp
+
+    Records saved before timestamps were stored only carry the
+    "%d %b %Y" display string, which is parsed here once on load.
+    """
+    if 'accepted_at' in record:
+        return record['accepted_at']
+    try:
+        return datetime.strptime(record['accepted_date'], "%d %b %Y").timestamp()
+    except (KeyError, ValueError):
+        return 0.0
+
+
+def earning_paisa(record):
+    """A record's earning in exact paisa
+
+    Records settled or submitted before `earning_paisa` was stored only
+    carry the Taka `estimated_earning`, which is rounded once here.
+    """
+    if 'earning_paisa' in record:
+        return record['earning_paisa']
+    return round(record.get('estimated_earning', 0) * PAISA_PER_TAKA)
+
+
+class CreatorLedger:
+    """Active and completed campaigns of one creator with O(1) membership checks
+
+    When a store is given every change is written through to it, so the
+    ledger can be rebuilt after a restart or on another worker.
+
+    Dashboard and performance totals are running counters: each event
+    subtracts a record's old contribution and adds its new one, so the
+    totals never need a full recount and cannot drift apart. Earnings
+    are summed in integer paisa, like the balance, so they stay exact.
+    """
+
+    def __init__(self, store=None, creator_id=None, active_campaigns=(), completed_campaigns=(),
+                 content_created=(), stats=None):
+        self.store = store
+        self.creator_id = creator_id
+        self.stats = stats
+        # Bumped on every change so derived views know when to rebuild
+        self.revision = 0
+        self._load(active_campaigns, completed_campaigns, content_created)
+
+    def _load(self, active_campaigns, completed_campaigns, content_created):
+        self.active_campaigns = list(active_campaigns)
+        self.completed_campaigns = list(completed_campaigns)
+        self.content_created = list(content_created)
+        self._by_id = {c['campaign_id']: c for c in self.active_campaigns + self.completed_campaigns}
+        self.accepted_ids = self._by_id.keys()
+
+        # Sorted acceptance timeline for range queries by bisect
+        self._timeline = sorted(
+            (accepted_timestamp(c), c['campaign_id'])
+            for c in self.active_campaigns + self.completed_campaigns
+        )
+
+        self.total_reach = 0
+        self.total_engagement = 0
+        self.completed_earning_paisa = 0
+        self.posted_earning_paisa = 0
+        for record in self.active_campaigns + self.completed_campaigns:
+            self._count(record, 1)
+
+    def reload(self, active_campaigns, completed_campaigns, content_created):
+        """Replace all records with a fresh copy from the store (e.g. after ingestion)"""
+        self._load(active_campaigns, completed_campaigns, content_created)
+        self.revision += 1
+
+    @property
+    def active_count(self):
+        return len(self.active_campaigns)
+
+    @property
+    def completed_count(self):
+        return len(self.completed_campaigns)
+
+    @property
+    def campaign_count(self):
+        return len(self.active_campaigns) + len(self.completed_campaigns)
+
+    @property
+    def total_earning_paisa(self):
+        """Earnings of completed campaigns plus estimates for posted ones, in paisa"""
+        return self.completed_earning_paisa + self.posted_earning_paisa
+
+    def _count(self, record, sign):
+        self.total_reach += sign * record.get('current_reach', 0)
+        self.total_engagement += sign * record.get('current_engagement', 0)
+        if record['status'] == 'completed':
+            self.completed_earning_paisa += sign * earning_paisa(record)
+        elif record['status'] == 'posted':
+            self.posted_earning_paisa += sign * earning_paisa(record)
+
+    def accepted_between(self, start=None, end=None):
+        """Return ids of campaigns accepted in [start, end] (UNIX timestamps)"""
+        lo = 0 if start is None else bisect_left(self._timeline, (start,))
+        hi = len(self._timeline) if end is None else bisect_right(self._timeline, (end, '\uffff'))
+        return [campaign_id for _, campaign_id in self._timeline[lo:hi]]
+
+    def is_accepted(self, campaign_id):
+        """Check whether a campaign is already active or completed"""
+        return campaign_id in self._by_id
+
+    def get(self, campaign_id):
+        """Return the tracked record for a campaign id"""
+        return self._by_id[campaign_id]
+
+    def save(self, record):
+        """Write a campaign record through to the store"""
+        if self.store is not None:
+            self.store.save_campaign(self.creator_id, record)
+
+    def accept(self, record):
+        """Add an accepted campaign record to the active list"""
+        self.active_campaigns.append(record)
+        self._by_id[record['campaign_id']] = record
+        insort(self._timeline, (accepted_timestamp(record), record['campaign_id']))
+        self._count(record, 1)
+        self.revision += 1
+        self.save(record)
+        if self.stats is not None:
+            self.stats.record_accept(record['campaign_id'])
+
+    def submit(self, campaign_id, content_record, **updates):
+        """Record submitted content for an active campaign in one step
+
+        The campaign fields, the content record and the totals change
+        together, and the store writes both records in one transaction.
+        """
+        record = self._by_id[campaign_id]
+        self._count(record, -1)
+        record.update(updates)
+        self._count(record, 1)
+        self.content_created.append(content_record)
+        self.revision += 1
+        if self.store is not None:
+            self.store.save_submission(self.creator_id, record, content_record)
+        return record
@@ -0,0 +1,13 @@
+"""Exact money amounts held as integer paisa
+
+Kept free of NumPy so pages that only display balances stay cheap to
+import; payouts.py builds on these.
+"""
+from decimal import Decimal
+
+PAISA_PER_TAKA = 100
+
+
+def to_taka(paisa):
+    """Convert an integer paisa amount to an exact Decimal Taka amount"""
+    return Decimal(int(paisa)).scaleb(-2)
@@ -0,0 +1,44 @@
+"""Bounded per-session notification feed"""
+from collections import deque
+
+
+class NotificationFeed:
+    """Fixed-capacity ring buffer of notifications with a running unread count
+
+    Only the newest `capacity` entries stay in session memory. With a
+    store, every entry is also written through to it, so entries pushed
+    out of the ring remain available from the store (which applies its
+    own per-creator retention).
+    """
+
+    def __init__(self, capacity=20, store=None, creator_id=None, initial=()):
+        self.store = store
+        self.creator_id = creator_id
+        self._ring = deque(initial, maxlen=capacity)
+        self.unread = 0
+
+    def __len__(self):
+        return len(self._ring)
+
+    def push(self, notif):
+        """Append a notification, evicting the oldest one when full"""
+        self._ring.append(notif)
+        self.unread += 1
+        if self.store is not None:
+            self.store.add_notification(self.creator_id, notif)
+
+    def latest(self, n):
+        """Return up to n newest notifications, newest first"""
+        n = min(n, len(self._ring))
+        return [self._ring[-i] for i in range(1, n + 1)]
+
+    def mark_read(self):
+        """Reset the unread counter"""
+        self.unread = 0
+
+    def clear(self):
+        """Drop all notifications from the ring and the store"""
+        self._ring.clear()
+        self.unread = 0
+        if self.store is not None:
+            self.store.clear_notifications(self.creator_id)
@@ -0,0 +1,75 @@
+"""Vectorized campaign payout engine
+
+Amounts are computed in integer paisa (1/100 Taka) so totals are exact:
+per-engagement rates are held in 1/10000 Taka, multiplied by integer
+engagement counts and rounded half-up to whole paisa once per payout.
+
+Payout rule, shared by every campaign flow:
+    base  = base_payment if engagement >= min_engagement else 0
+    bonus = engagement * per_engagement, capped at target_reach * per_engagement
+    total = base + bonus
+"""
+import numpy as np
+
+from money import PAISA_PER_TAKA
+
+RATE_SCALE = 10_000
+
+
+def _scaled(values, scale):
+    return np.rint(np.asarray(values, dtype=np.float64) * scale).astype(np.int64)
+
+
+def _round_to_paisa(rate_units):
+    # rate_units are 1/10000 Taka; round half-up to 1/100 Taka
+    return (rate_units + RATE_SCALE // PAISA_PER_TAKA // 2) // (RATE_SCALE // PAISA_PER_TAKA)
+
+
+def campaign_arrays(campaigns):
+    """Collect payout terms of campaign dicts into NumPy columns"""
+    return {
+        'base_payment': np.array([c['base_payment'] for c in campaigns], dtype=np.float64),
+        'target_reach': np.array([c['target_reach'] for c in campaigns], dtype=np.int64),
+        'per_engagement': np.array([c['per_engagement'] for c in campaigns], dtype=np.float64),
+        'min_engagement': np.array([c['min_engagement'] for c in campaigns], dtype=np.int64)
+    }
+
+
+def compute_payouts(base_payment, target_reach, per_engagement, min_engagement, engagement, cap=True):
+    """Compute base, bonus and total payouts in paisa for whole portfolios
+
+    All arguments are array-likes of equal length (or scalars, which
+    broadcast). Returns a dict of int64 paisa arrays.
+    """
+    base_paisa = _scaled(base_payment, PAISA_PER_TAKA)
+    rate = _scaled(per_engagement, RATE_SCALE)
+    engagement = np.asarray(engagement, dtype=np.int64)
+
+    base = np.where(engagement >= np.asarray(min_engagement, dtype=np.int64), base_paisa, 0)
+    bonus = _round_to_paisa(engagement * rate)
+    if cap:
+        max_bonus = _round_to_paisa(np.asarray(target_reach, dtype=np.int64) * rate)
+        bonus = np.minimum(bonus, max_bonus)
+    return {'base': base, 'bonus': bonus, 'total': base + bonus}
+
+
+def max_payouts(base_payment, target_reach, per_engagement):
+    """Highest possible payout in paisa: base plus the capped bonus"""
+    return _scaled(base_payment, PAISA_PER_TAKA) + _round_to_paisa(
+        np.asarray(target_reach, dtype=np.int64) * _scaled(per_engagement, RATE_SCALE)
+    )
+
+
+def campaign_payout(campaign, engagement):
+    """Total payout in Taka for one campaign and engagement count"""
+    total = compute_payouts(
+        campaign['base_payment'], campaign['target_reach'], campaign['per_engagement'],
+        campaign['min_engagement'], engagement
+    )['total']
+    return int(total) / PAISA_PER_TAKA
+
+
+def campaign_max_payout(campaign):
+    """Highest possible payout in Taka for one campaign"""
+    paisa = max_payouts(campaign['base_payment'], campaign['target_reach'], campaign['per_engagement'])
+    return int(paisa) / PAISA_PER_TAKA
@@ -0,0 +1,111 @@
+"""Columnar performance model built from a creator ledger"""
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+
+from timeseries import MAX_CHART_POINTS, downsample
+
+STATUS_LABELS = ['চলমান', 'সম্পন্ন']
+
+# Internal column name -> table header shown on the performance page
+COLUMN_LABELS = {
+    'brand': 'ব্র্যান্ড',
+    'title': 'ক্যাম্পেইন',
+    'status': 'স্ট্যাটাস',
+    'reach': 'রিচ',
+    'engagement': 'এঙ্গেজমেন্ট',
+    'earning': 'আনুমানিক আয়',
+    'accepted_date': 'শুরু তারিখ'
+}
+
+TREND_LABELS = {
+    'reach': 'রিচ',
+    'engagement': 'এঙ্গেজমেন্ট'
+}
+
+TIME_FILTERS = {
+    "সব সময়": None,
+    "সর্বশেষ ৭ দিন": 'last_7_days',
+    "সর্বশেষ ৩০ দিন": 'last_30_days',
+    "এই মাস": 'this_month',
+    "কাস্টম": 'custom'
+}
+
+
+def build_frame(ledger):
+    """Build one row per accepted campaign with status as a categorical column"""
+    records = ledger.active_campaigns + ledger.completed_campaigns
+    frame = pd.DataFrame({
+        'campaign_id': [r['campaign_id'] for r in records],
+        'brand': [r['brand'] for r in records],
+        'title': [r['title'] for r in records],
+        'reach': np.array([r.get('current_reach', 0) for r in records], dtype=np.int64),
+        'engagement': np.array([r.get('current_engagement', 0) for r in records], dtype=np.int64),
+        'earning': np.array([r.get('estimated_earning', 0) for r in records], dtype=np.float64),
+        'accepted_date': [r.get('accepted_date', 'N/A') for r in records]
+    })
+    # Active rows come first, so status codes are two runs
+    codes = np.repeat([0, 1], [len(ledger.active_campaigns), len(ledger.completed_campaigns)])
+    frame.insert(3, 'status', pd.Categorical.from_codes(codes, categories=STATUS_LABELS))
+    return frame
+
+
+def window_bounds(window, now, custom_range=None):
+    """Resolve a TIME_FILTERS window to (start, end) UNIX timestamps"""
+    if window is None:
+        return None, None
+    today = datetime.combine(now.date(), time.min)
+    if window == 'last_7_days':
+        return (today - timedelta(days=7)).timestamp(), None
+    if window == 'last_30_days':
+        return (today - timedelta(days=30)).timestamp(), None
+    if window == 'this_month':
+        return today.replace(day=1).timestamp(), None
+    if window == 'custom':
+        start, end = custom_range
+        return (datetime.combine(start, time.min).timestamp(),
+                datetime.combine(end, time.max).timestamp())
+    raise ValueError(f"Unknown time window: {window}")
+
+
+def filter_frame(frame, campaign_ids=None, title=None):
+    """Apply the time window (as resolved ids) and campaign filters as vectorized masks"""
+    mask = np.ones(len(frame), dtype=bool)
+    if campaign_ids is not None:
+        mask &= frame['campaign_id'].isin(campaign_ids).to_numpy()
+    if title is not None:
+        mask &= (frame['title'] == title).to_numpy()
+    return frame[mask]
+
+
+def trend_frame(series, campaign_ids=None, since=None, until=None, max_points=MAX_CHART_POINTS):
+    """Total reach and engagement over time for the given campaigns, indexed by local time
+
+    `series` maps campaign ids to CampaignSeries. Each campaign's
+    downsampled history is carried forward between its samples (the
+    counters are cumulative) before the campaigns are summed.
+    """
+    parts = []
+    for campaign_id in (series if campaign_ids is None else campaign_ids):
+        campaign = series.get(campaign_id)
+        if campaign is None:
+            continue
+        times, reach, engagement = campaign.history(since, max_points=max_points)
+        if len(times):
+            parts.append(pd.DataFrame({'reach': reach, 'engagement': engagement}, index=times))
+    if not parts:
+        return pd.DataFrame(columns=list(TREND_LABELS), dtype=np.int64)
+
+    index = np.unique(np.concatenate([part.index.to_numpy() for part in parts]))
+    if until is not None:
+        index = index[index <= until]
+    totals = sum(part.reindex(index, method='ffill').fillna(0) for part in parts)
+    times, reach, engagement = downsample(
+        index, totals['reach'].to_numpy(np.int64), totals['engagement'].to_numpy(np.int64),
+        max_points=max_points
+    )
+    return pd.DataFrame(
+        {'reach': reach, 'engagement': engagement},
+        index=pd.DatetimeIndex([datetime.fromtimestamp(t) for t in times])
+    )
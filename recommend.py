@@ -0,0 +1,112 @@
+"""Content-based campaign recommendations over precomputed feature vectors"""
+import threading
+
+import numpy as np
+
+from catalog import PAYMENT_BUCKETS, payment_bucket
+
+
+class CampaignRecommender:
+    """Scores catalog campaigns against a creator's campaign history
+
+    Every campaign becomes a unit-length vector of one-hot brand
+    category, content type and payment bucket plus max-scaled
+    per-engagement rate and minimum engagement. A creator's profile is
+    the mean vector of the campaigns they accepted, and all candidates
+    are scored with one matrix-vector product. The matrix is rebuilt
+    lazily whenever `catalog` is replaced by a newer snapshot or its
+    revision changes.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        # (catalog, revision, ids, matrix, {campaign_id: row}), swapped as one
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        catalog = self.catalog
+        model = self._model
+        if model is not None and model[0] is catalog and model[1] == catalog.revision:
+            return model
+        with self._lock:
+            model = self._model
+            if model is None or model[0] is not catalog or model[1] != catalog.revision:
+                revision = catalog.revision
+                ids, matrix = self._build(catalog)
+                model = self._model = (
+                    catalog, revision, ids, matrix, {campaign_id: i for i, campaign_id in enumerate(ids)}
+                )
+            return model
+
+    def _build(self, catalog):
+        ids = list(catalog.campaigns)
+        campaigns = [catalog.campaigns[campaign_id] for campaign_id in ids]
+        categories = [catalog.brands[catalog.brand_of[campaign_id]].get('category') for campaign_id in ids]
+
+        blocks = []
+        for values, vocabulary in (
+            (categories, sorted(set(categories), key=str)),
+            ([c['content_type'] for c in campaigns], sorted({c['content_type'] for c in campaigns})),
+            ([payment_bucket(c['base_payment']) for c in campaigns], PAYMENT_BUCKETS)
+        ):
+            column = {value: j for j, value in enumerate(vocabulary)}
+            one_hot = np.zeros((len(ids), len(vocabulary)), dtype=np.float32)
+            one_hot[np.arange(len(ids)), [column[v] for v in values]] = 1.0
+            blocks.append(one_hot)
+
+        for name in ('per_engagement', 'min_engagement'):
+            values = np.array([c[name] for c in campaigns], dtype=np.float32)
+            scale = values.max() if len(values) and values.max() > 0 else 1.0
+            blocks.append((values / scale)[:, None])
+
+        matrix = np.hstack(blocks) if ids else np.zeros((0, 0), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1.0)
+        return np.array(ids, dtype=object), matrix
+
+    def profile(self, history_ids):
+        """Mean feature vector of the history campaigns still in the catalog"""
+        return self._profile(self._refresh(), history_ids)
+
+    @staticmethod
+    def _profile(model, history_ids):
+        _, _, _, matrix, row = model
+        rows = [row[campaign_id] for campaign_id in history_ids if campaign_id in row]
+        if not rows:
+            return None
+        return matrix[rows].mean(axis=0)
+
+    def rank(self, history_ids, candidate_ids=None, limit=None):
+        """Candidate ids ordered by similarity to the history, best first
+
+        Campaigns already in the history sink to the end. Returns None
+        when the history has no campaigns in the catalog, so callers can
+        fall back to their default order. With a limit only the top
+        `limit` are selected (argpartition) before sorting them.
+        """
+        model = self._refresh()
+        _, _, ids, matrix, row = model
+        profile = self._profile(model, history_ids)
+        if profile is None:
+            return None
+
+        if candidate_ids is None:
+            rows = np.arange(len(ids))
+        else:
+            rows = np.fromiter(
+                (row[campaign_id] for campaign_id in candidate_ids if campaign_id in row),
+                dtype=np.int64
+            )
+        scores = matrix[rows] @ profile
+        seen = [row[campaign_id] for campaign_id in history_ids if campaign_id in row]
+        if seen:
+            scores[np.isin(rows, seen)] = -np.inf
+
+        if limit is not None and limit < len(rows):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(rows))
+        # Ties keep catalog row order so the ranking is stable across reruns
+        top = top[np.lexsort((rows[top], -scores[top]))]
+        return ids[rows[top]].tolist()
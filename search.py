@@ -0,0 +1,259 @@
+"""Bengali-aware full-text search with BM25F ranking"""
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from heapq import nsmallest
+
+from bn_dates import to_ascii_digits
+
+# Bengali letters carry vowel signs and virama that `\w` does not match,
+# so the whole Bengali block is listed explicitly
+TOKEN_PATTERN = re.compile(r'[\w\u0980-\u09FF]+')
+
+# Zero-width (non-)joiners only change glyph shaping, never meaning
+JOINERS = ('\u200c', '\u200d')
+BENGALI_DIGIT = re.compile(r'[\u09E6-\u09EF]')
+
+NGRAM_SIZE = 3
+
+# Field boosts for BM25F; a title hit outweighs one in the description
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'brand': 2.0,
+    'category': 1.5,
+    'description': 1.0
+}
+FIELDS = tuple(FIELD_WEIGHTS)
+
+# Share of a query word's n-grams a vocabulary word must contain to count
+# as a near spelling, and how much such a match scores against an exact one
+FUZZY_MATCH = 0.5
+FUZZY_WEIGHT = 0.5
+
+# Expansions of one query word that contribute to its score; matching
+# always uses the whole prefix range so no document is dropped
+MAX_EXPANSIONS = 50
+
+K1 = 1.2
+B = 0.75
+
+# Cached term weights are recomputed once average field lengths drift this much
+LENGTH_DRIFT = 0.2
+
+
+def normalize(text):
+    """Canonical search form: NFC, no joiners, ASCII digits, casefolded"""
+    text = unicodedata.normalize('NFC', text)
+    for joiner in JOINERS:
+        text = text.replace(joiner, '')
+    if BENGALI_DIGIT.search(text):
+        text = to_ascii_digits(text)
+    return text.casefold()
+
+
+@lru_cache(maxsize=8192)
+def tokenize(text):
+    """Split Bengali/English text into normalized word tokens"""
+    return tuple(TOKEN_PATTERN.findall(normalize(text)))
+
+
+def ngrams(word, n=NGRAM_SIZE):
+    """Character n-grams of a word padded with boundary spaces"""
+    padded = f" {word} "
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+class SearchIndex:
+    """Inverted index over weighted document fields
+
+    Documents are dicts of field name to text. Query words match indexed
+    words exactly, by prefix while typing, or, when neither hits, by
+    character n-gram overlap with the vocabulary (e.g. ী/ি spellings).
+    Postings hold each document's saturated BM25F term weight, so a
+    query only sums idf-scaled weights over the postings of its terms.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._doc_terms = {}
+        self._lengths = {}
+        self._total_lengths = [0] * len(FIELDS)
+        self._avg = [1.0] * len(FIELDS)
+        self._sorted_words = None
+        self._word_grams = {}
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def copy(self):
+        """Independent copy; changes to either index leave the other untouched"""
+        clone = SearchIndex.__new__(SearchIndex)
+        clone._postings = {word: dict(postings) for word, postings in self._postings.items()}
+        clone._doc_terms = dict(self._doc_terms)
+        clone._lengths = dict(self._lengths)
+        clone._total_lengths = list(self._total_lengths)
+        clone._avg = list(self._avg)
+        clone._sorted_words = self._sorted_words
+        clone._word_grams = {gram: set(words) for gram, words in self._word_grams.items()}
+        return clone
+
+    def __contains__(self, doc_id):
+        return doc_id in self._lengths
+
+    def _weight(self, tf, lengths):
+        weighted = 0.0
+        for f, count in enumerate(tf):
+            if count:
+                norm = 1 - B + B * lengths[f] / self._avg[f]
+                weighted += FIELD_WEIGHTS[FIELDS[f]] * count / norm
+        return weighted * (K1 + 1) / (K1 + weighted)
+
+    def _check_drift(self):
+        count = len(self._lengths)
+        if not count:
+            return
+        current = [max(total / count, 1.0) for total in self._total_lengths]
+        if all(abs(c - a) <= LENGTH_DRIFT * a for c, a in zip(current, self._avg)):
+            return
+        self._avg = current
+        for doc_id, terms in self._doc_terms.items():
+            lengths = self._lengths[doc_id]
+            for word, tf in terms.items():
+                self._postings[word][doc_id] = self._weight(tf, lengths)
+
+    def add(self, doc_id, fields):
+        """Index a document, replacing any previous version"""
+        if doc_id in self._lengths:
+            self.remove(doc_id)
+
+        terms = {}
+        lengths = []
+        for f, name in enumerate(FIELDS):
+            words = tokenize(fields.get(name) or '')
+            lengths.append(len(words))
+            for word in words:
+                terms.setdefault(word, [0] * len(FIELDS))[f] += 1
+        lengths = tuple(lengths)
+
+        self._lengths[doc_id] = lengths
+        self._doc_terms[doc_id] = terms
+        for f, length in enumerate(lengths):
+            self._total_lengths[f] += length
+        for word, tf in terms.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                self._sorted_words = None
+                for gram in ngrams(word):
+                    self._word_grams.setdefault(gram, set()).add(word)
+            postings[doc_id] = self._weight(tf, lengths)
+        self._check_drift()
+
+    def remove(self, doc_id):
+        """Drop a document from the index"""
+        lengths = self._lengths.pop(doc_id)
+        for word in self._doc_terms.pop(doc_id):
+            postings = self._postings[word]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[word]
+                self._sorted_words = None
+                for gram in ngrams(word):
+                    words = self._word_grams[gram]
+                    words.discard(word)
+                    if not words:
+                        del self._word_grams[gram]
+        for f, length in enumerate(lengths):
+            self._total_lengths[f] -= length
+
+    def _prefix_words(self, word):
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._postings)
+        words = self._sorted_words
+        # The exact word, when indexed, sorts first in its prefix range
+        return words[bisect_left(words, word):bisect_left(words, word + '\U0010ffff')]
+
+    def _similar_words(self, word):
+        grams = set(ngrams(word))
+        needed = math.ceil(len(grams) * FUZZY_MATCH)
+        hits = {}
+        for gram in grams:
+            for candidate in self._word_grams.get(gram, ()):
+                hits[candidate] = hits.get(candidate, 0) + 1
+        similar = [candidate for candidate, count in hits.items() if count >= needed]
+        similar.sort(key=hits.__getitem__, reverse=True)
+        return similar[:MAX_EXPANSIONS]
+
+    def _expand(self, word):
+        """Indexed words a query word stands for, as (word, boost) pairs"""
+        prefixed = self._prefix_words(word)
+        if prefixed:
+            return [(w, 1.0) for w in prefixed]
+        return [(w, FUZZY_WEIGHT) for w in self._similar_words(word)]
+
+    def _matches(self, expansions):
+        matched = set()
+        for word, _ in expansions:
+            matched.update(self._postings[word])
+        return matched
+
+    def match(self, text):
+        """Ids of documents matching every query word, or None for an empty query"""
+        words = tokenize(text)
+        if not words:
+            return None
+        matched = None
+        for word in words:
+            docs = self._matches(self._expand(word))
+            matched = docs if matched is None else matched & docs
+            if not matched:
+                break
+        return matched
+
+    def scores(self, text, candidate_ids=None):
+        """BM25F scores of documents matching every query word, optionally within `candidate_ids`"""
+        words = tokenize(text)
+        if not words:
+            return {}
+
+        expanded = [self._expand(word) for word in words]
+        matched = None
+        for expansions in expanded:
+            docs = self._matches(expansions)
+            matched = docs if matched is None else matched & docs
+        # Long prefix ranges still match fully but only the first words are scored
+        expanded = [expansions[:MAX_EXPANSIONS] for expansions in expanded]
+        if candidate_ids is not None:
+            matched &= set(candidate_ids)
+
+        count = len(self._lengths)
+        scores = dict.fromkeys(matched, 0.0)
+        for expansions in expanded:
+            for word, boost in expansions:
+                postings = self._postings[word]
+                idf = boost * math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                if len(scores) < len(postings):
+                    for doc_id in scores:
+                        weight = postings.get(doc_id)
+                        if weight is not None:
+                            scores[doc_id] += idf * weight
+                else:
+                    for doc_id, weight in postings.items():
+                        if doc_id in scores:
+                            scores[doc_id] += idf * weight
+        return scores
+
+    def rank(self, text, candidate_ids=None, limit=None, tiebreak=None):
+        """Matching ids, best BM25F score first; ties ordered by `tiebreak(id)`"""
+        scores = self.scores(text, candidate_ids)
+        if tiebreak is None:
+            key = lambda doc_id: -scores[doc_id]
+        else:
+            key = lambda doc_id: (-scores[doc_id], tiebreak(doc_id))
+        if limit is not None and limit < len(scores):
+            return nsmallest(limit, scores, key=key)
+        return sorted(scores, key=key)
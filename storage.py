@@ -0,0 +1,506 @@
+"""Persistent storage backends for creator state"""
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class CreatorStore:
+    """Storage interface for balances, campaigns, content and notifications"""
+
+    def load_creator(self, creator_id, default_balance=0, notification_limit=20):
+        """Return a creator's balance (integer paisa), campaign records, content and newest notifications"""
+        raise NotImplementedError
+
+    def save_campaign(self, creator_id, record):
+        """Insert or update one accepted campaign record"""
+        raise NotImplementedError
+
+    def save_submission(self, creator_id, record, content_record):
+        """Update a campaign record and append its content record atomically"""
+        raise NotImplementedError
+
+    def add_notification(self, creator_id, notif):
+        """Append a notification, dropping the oldest beyond the retention limit"""
+        raise NotImplementedError
+
+    def load_notifications(self, creator_id, limit):
+        """Return up to limit newest notifications, oldest first"""
+        raise NotImplementedError
+
+    def clear_notifications(self, creator_id):
+        """Delete all notifications of a creator"""
+        raise NotImplementedError
+
+    def debit_balance(self, creator_id, amount):
+        """Subtract `amount` paisa if the balance covers it; returns the new balance or None"""
+        raise NotImplementedError
+
+    def load_campaign_stats(self):
+        """Return {campaign_id: [accept_count, success_count, earning_sum]}"""
+        raise NotImplementedError
+
+    def bump_campaign_stats(self, campaign_id, accepts=0, successes=0, earning=0.0):
+        """Increment a campaign's counters"""
+        raise NotImplementedError
+
+    def save_catalog(self, brands=(), campaigns=()):
+        """Upsert (brand_name, data) and (brand_name, campaign) pairs atomically; returns the last seq"""
+        raise NotImplementedError
+
+    def load_catalog_changes(self, since=0):
+        """Return brands and campaigns changed after `since`, in change order, and the latest seq"""
+        raise NotImplementedError
+
+    def catalog_campaign_owners(self, campaign_ids):
+        """Return {campaign_id: (brand_name, status)} for the given ids that exist"""
+        raise NotImplementedError
+
+    def load_catalog_campaign(self, campaign_id):
+        """Return (brand_name, campaign) or None"""
+        raise NotImplementedError
+
+    def catalog_brand_names(self):
+        """Return the set of brand names in the catalog"""
+        raise NotImplementedError
+
+    def add_engagement(self, deltas):
+        """Add (creator_id, campaign_id, reach, engagement) deltas to the engagement counters
+
+        Returns (creator_id, record, reach, engagement) with the new totals
+        for every posted campaign among them.
+        """
+        raise NotImplementedError
+
+    def load_posted_campaigns(self):
+        """Return (creator_id, record, reach, engagement) for all posted campaigns
+
+        reach and engagement are None when no events arrived yet.
+        """
+        raise NotImplementedError
+
+    def settle_campaigns(self, records):
+        """Save (creator_id, record) pairs of posted campaigns atomically; returns those newly completed
+
+        Only records still posted in the store are written. A record with
+        status 'completed' has its `earning_paisa` credited to the
+        creator's balance and counted as a campaign success, so a campaign
+        is paid at most once however many ingestors settle it. Every
+        creator written to has its ingest_seq bumped.
+        """
+        raise NotImplementedError
+
+    def creator_ingest_seq(self, creator_id):
+        """Return a counter bumped whenever ingestion changes a creator's campaigns or balance"""
+        raise NotImplementedError
+
+    def save_engagement_series(self, rows):
+        """Upsert (creator_id, campaign_id, step, bucket, reach, engagement) rollup rows"""
+        raise NotImplementedError
+
+    def load_engagement_series(self, creator_id):
+        """Return a creator's (campaign_id, step, bucket, reach, engagement) rows in bucket order"""
+        raise NotImplementedError
+
+    def prune_engagement_series(self, cutoffs):
+        """Delete rollup buckets older than {step: cutoff timestamp}"""
+        raise NotImplementedError
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS creators (
+    creator_id TEXT PRIMARY KEY,
+    balance_paisa INTEGER NOT NULL,
+    ingest_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS creator_campaigns (
+    creator_id TEXT NOT NULL,
+    campaign_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    record TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (creator_id, campaign_id)
+);
+CREATE INDEX IF NOT EXISTS idx_creator_campaigns_campaign ON creator_campaigns (campaign_id);
+CREATE INDEX IF NOT EXISTS idx_creator_campaigns_status ON creator_campaigns (creator_id, status);
+CREATE TABLE IF NOT EXISTS content (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    creator_id TEXT NOT NULL,
+    campaign_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_content_creator ON content (creator_id);
+CREATE INDEX IF NOT EXISTS idx_content_campaign ON content (campaign_id);
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    creator_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_creator ON notifications (creator_id);
+CREATE TABLE IF NOT EXISTS campaign_stats (
+    campaign_id TEXT PRIMARY KEY,
+    accept_count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    earning_sum REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS catalog_brands (
+    brand_name TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_brands_seq ON catalog_brands (seq);
+CREATE TABLE IF NOT EXISTS catalog_campaigns (
+    campaign_id TEXT PRIMARY KEY,
+    brand_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    record TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_campaigns_seq ON catalog_campaigns (seq);
+CREATE INDEX IF NOT EXISTS idx_creator_campaigns_posted ON creator_campaigns (status);
+CREATE TABLE IF NOT EXISTS engagement_counters (
+    creator_id TEXT NOT NULL,
+    campaign_id TEXT NOT NULL,
+    reach INTEGER NOT NULL DEFAULT 0,
+    engagement INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (creator_id, campaign_id)
+);
+CREATE INDEX IF NOT EXISTS idx_engagement_counters_updated ON engagement_counters (updated_at);
+CREATE TABLE IF NOT EXISTS engagement_series (
+    creator_id TEXT NOT NULL,
+    campaign_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    reach INTEGER NOT NULL,
+    engagement INTEGER NOT NULL,
+    PRIMARY KEY (creator_id, campaign_id, step, bucket)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_engagement_series_bucket ON engagement_series (step, bucket);
+"""
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache reuses the prepared form on every call
+SELECT_BALANCE = "SELECT balance_paisa FROM creators WHERE creator_id = ?"
+INSERT_CREATOR = "INSERT OR IGNORE INTO creators (creator_id, balance_paisa) VALUES (?, ?)"
+# Relative updates, so credits from the ingestor and withdrawals never overwrite each other
+DEBIT_BALANCE = (
+    "UPDATE creators SET balance_paisa = balance_paisa - ? "
+    "WHERE creator_id = ? AND balance_paisa >= ? RETURNING balance_paisa"
+)
+SELECT_CAMPAIGNS = "SELECT record FROM creator_campaigns WHERE creator_id = ? ORDER BY rowid"
+UPSERT_CAMPAIGN = (
+    "INSERT INTO creator_campaigns (creator_id, campaign_id, status, record, updated_at) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (creator_id, campaign_id) DO UPDATE SET "
+    "status = excluded.status, record = excluded.record, updated_at = excluded.updated_at"
+)
+SELECT_CONTENT = "SELECT record FROM content WHERE creator_id = ? ORDER BY id"
+INSERT_CONTENT = "INSERT INTO content (creator_id, campaign_id, record, created_at) VALUES (?, ?, ?, ?)"
+SELECT_NOTIFICATIONS = (
+    "SELECT record FROM (SELECT id, record FROM notifications WHERE creator_id = ? "
+    "ORDER BY id DESC LIMIT ?) ORDER BY id"
+)
+INSERT_NOTIFICATION = "INSERT INTO notifications (creator_id, record, created_at) VALUES (?, ?, ?)"
+PRUNE_NOTIFICATIONS = (
+    "DELETE FROM notifications WHERE creator_id = ? AND id <= ("
+    "SELECT id FROM notifications WHERE creator_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)"
+)
+DELETE_NOTIFICATIONS = "DELETE FROM notifications WHERE creator_id = ?"
+SELECT_CAMPAIGN_STATS = "SELECT campaign_id, accept_count, success_count, earning_sum FROM campaign_stats"
+BUMP_CAMPAIGN_STATS = (
+    "INSERT INTO campaign_stats (campaign_id, accept_count, success_count, earning_sum) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (campaign_id) DO UPDATE SET "
+    "accept_count = accept_count + excluded.accept_count, "
+    "success_count = success_count + excluded.success_count, "
+    "earning_sum = earning_sum + excluded.earning_sum"
+)
+SELECT_CATALOG_SEQ = (
+    "SELECT MAX(COALESCE((SELECT MAX(seq) FROM catalog_brands), 0), "
+    "COALESCE((SELECT MAX(seq) FROM catalog_campaigns), 0))"
+)
+UPSERT_CATALOG_BRAND = (
+    "INSERT INTO catalog_brands (brand_name, record, seq) VALUES (?, ?, ?) "
+    "ON CONFLICT (brand_name) DO UPDATE SET record = excluded.record, seq = excluded.seq"
+)
+UPSERT_CATALOG_CAMPAIGN = (
+    "INSERT INTO catalog_campaigns (campaign_id, brand_name, status, record, seq) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (campaign_id) DO UPDATE SET "
+    "brand_name = excluded.brand_name, status = excluded.status, record = excluded.record, seq = excluded.seq"
+)
+SELECT_CATALOG_CAMPAIGN = "SELECT brand_name, record FROM catalog_campaigns WHERE campaign_id = ?"
+SELECT_CATALOG_BRAND_NAMES = "SELECT brand_name FROM catalog_brands"
+SELECT_CATALOG_BRANDS_SINCE = "SELECT brand_name, record, seq FROM catalog_brands WHERE seq > ? ORDER BY seq"
+SELECT_CATALOG_CAMPAIGNS_SINCE = (
+    "SELECT brand_name, record, seq FROM catalog_campaigns WHERE seq > ? ORDER BY seq"
+)
+
+ADD_ENGAGEMENT = (
+    "INSERT INTO engagement_counters (creator_id, campaign_id, reach, engagement, updated_at) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (creator_id, campaign_id) DO UPDATE SET "
+    "reach = reach + excluded.reach, engagement = engagement + excluded.engagement, "
+    "updated_at = excluded.updated_at"
+)
+# A batch stamps every counter it touches with the same updated_at, so
+# its rows are found through the index without binding each key again
+SELECT_POSTED_UPDATED = (
+    "SELECT c.creator_id, c.record, e.reach, e.engagement FROM engagement_counters e "
+    "JOIN creator_campaigns c USING (creator_id, campaign_id) "
+    "WHERE e.updated_at = ? AND c.status = 'posted'"
+)
+SELECT_POSTED = (
+    "SELECT c.creator_id, c.record, e.reach, e.engagement FROM creator_campaigns c "
+    "LEFT JOIN engagement_counters e USING (creator_id, campaign_id) "
+    "WHERE c.status = 'posted'"
+)
+UPDATE_POSTED_CAMPAIGN = (
+    "UPDATE creator_campaigns SET status = ?, record = ?, updated_at = ? "
+    "WHERE creator_id = ? AND campaign_id = ? AND status = 'posted'"
+)
+CREDIT_BALANCE = "UPDATE creators SET balance_paisa = balance_paisa + ? WHERE creator_id = ?"
+BUMP_INGEST_SEQ = "UPDATE creators SET ingest_seq = ingest_seq + 1 WHERE creator_id = ?"
+SELECT_INGEST_SEQ = "SELECT ingest_seq FROM creators WHERE creator_id = ?"
+# Rollups keep the latest cumulative sample of each bucket
+UPSERT_ENGAGEMENT_SERIES = (
+    "INSERT INTO engagement_series (creator_id, campaign_id, step, bucket, reach, engagement) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (creator_id, campaign_id, step, bucket) DO UPDATE SET "
+    "reach = excluded.reach, engagement = excluded.engagement"
+)
+SELECT_ENGAGEMENT_SERIES = (
+    "SELECT campaign_id, step, bucket, reach, engagement FROM engagement_series "
+    "WHERE creator_id = ? ORDER BY campaign_id, step, bucket"
+)
+PRUNE_ENGAGEMENT_SERIES = "DELETE FROM engagement_series WHERE step = ? AND bucket < ?"
+
+
+class SQLiteCreatorStore(CreatorStore):
+    """SQLite store in WAL mode, shareable by several worker processes
+
+    Within a process every thread shares one connection behind a lock.
+    Streamlit runs each rerun on a fresh thread, so per-thread
+    connections would be reopened (and their statement cache lost) on
+    every rerun.
+    """
+
+    def __init__(self, path, notification_retention=500):
+        self.path = path
+        self.notification_retention = notification_retention
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    @contextmanager
+    def _connection(self):
+        with self._lock:
+            yield self._conn
+
+    def _migrate(self, conn):
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(creators)")}
+        if 'balance' not in columns:
+            return
+        # Databases from before integer paisa balances stored Taka in `balance`
+        with self._transaction():
+            conn.execute("ALTER TABLE creators ADD COLUMN balance_paisa INTEGER NOT NULL DEFAULT 0")
+            conn.execute("ALTER TABLE creators ADD COLUMN ingest_seq INTEGER NOT NULL DEFAULT 0")
+            conn.execute("UPDATE creators SET balance_paisa = CAST(ROUND(balance * 100) AS INTEGER)")
+            conn.execute("ALTER TABLE creators DROP COLUMN balance")
+
+    @contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def load_creator(self, creator_id, default_balance=0, notification_limit=20):
+        with self._connection() as conn:
+            conn.execute(INSERT_CREATOR, (creator_id, default_balance))
+            balance = conn.execute(SELECT_BALANCE, (creator_id,)).fetchone()[0]
+            campaigns = conn.execute(SELECT_CAMPAIGNS, (creator_id,)).fetchall()
+            content = conn.execute(SELECT_CONTENT, (creator_id,)).fetchall()
+        campaigns = [json.loads(r[0]) for r in campaigns]
+        return {
+            'balance': balance,
+            'active_campaigns': [c for c in campaigns if c['status'] != 'completed'],
+            'completed_campaigns': [c for c in campaigns if c['status'] == 'completed'],
+            'content_created': [json.loads(r[0]) for r in content],
+            'notifications': self.load_notifications(creator_id, notification_limit)
+        }
+
+    def save_campaign(self, creator_id, record):
+        with self._connection() as conn:
+            conn.execute(UPSERT_CAMPAIGN, (
+                creator_id, record['campaign_id'], record['status'],
+                json.dumps(record, ensure_ascii=False), time.time()
+            ))
+
+    def save_submission(self, creator_id, record, content_record):
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(UPSERT_CAMPAIGN, (
+                creator_id, record['campaign_id'], record['status'],
+                json.dumps(record, ensure_ascii=False), now
+            ))
+            conn.execute(INSERT_CONTENT, (
+                creator_id, content_record['campaign_id'],
+                json.dumps(content_record, ensure_ascii=False), now
+            ))
+
+    def add_notification(self, creator_id, notif):
+        with self._connection() as conn:
+            cursor = conn.execute(INSERT_NOTIFICATION, (
+                creator_id, json.dumps(notif, ensure_ascii=False), time.time()
+            ))
+            # Prune in amortized batches instead of on every insert
+            if cursor.lastrowid % 64 == 0:
+                conn.execute(PRUNE_NOTIFICATIONS, (creator_id, creator_id, self.notification_retention))
+
+    def load_notifications(self, creator_id, limit):
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_NOTIFICATIONS, (creator_id, limit)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def clear_notifications(self, creator_id):
+        with self._connection() as conn:
+            conn.execute(DELETE_NOTIFICATIONS, (creator_id,))
+
+    def debit_balance(self, creator_id, amount):
+        with self._connection() as conn:
+            row = conn.execute(DEBIT_BALANCE, (amount, creator_id, amount)).fetchone()
+        return None if row is None else row[0]
+
+    def load_campaign_stats(self):
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_CAMPAIGN_STATS).fetchall()
+        return {r[0]: [r[1], r[2], r[3]] for r in rows}
+
+    def bump_campaign_stats(self, campaign_id, accepts=0, successes=0, earning=0.0):
+        with self._connection() as conn:
+            conn.execute(BUMP_CAMPAIGN_STATS, (campaign_id, accepts, successes, earning))
+
+    def save_catalog(self, brands=(), campaigns=()):
+        with self._transaction() as conn:
+            seq = conn.execute(SELECT_CATALOG_SEQ).fetchone()[0]
+            brand_rows = []
+            for brand_name, data in brands:
+                seq += 1
+                brand_rows.append((brand_name, json.dumps(data, ensure_ascii=False), seq))
+            campaign_rows = []
+            for brand_name, campaign in campaigns:
+                seq += 1
+                campaign_rows.append((
+                    campaign['id'], brand_name, campaign['status'],
+                    json.dumps(campaign, ensure_ascii=False), seq
+                ))
+            conn.executemany(UPSERT_CATALOG_BRAND, brand_rows)
+            conn.executemany(UPSERT_CATALOG_CAMPAIGN, campaign_rows)
+        return seq
+
+    def load_catalog_changes(self, since=0):
+        with self._connection() as conn:
+            # One read transaction so brands and campaigns come from the same snapshot
+            conn.execute("BEGIN")
+            try:
+                brands = conn.execute(SELECT_CATALOG_BRANDS_SINCE, (since,)).fetchall()
+                campaigns = conn.execute(SELECT_CATALOG_CAMPAIGNS_SINCE, (since,)).fetchall()
+            finally:
+                conn.execute("COMMIT")
+        seq = max([since] + [r[2] for r in brands[-1:]] + [r[2] for r in campaigns[-1:]])
+        return {
+            'seq': seq,
+            'brands': [(r[0], json.loads(r[1])) for r in brands],
+            'campaigns': [(r[0], json.loads(r[1])) for r in campaigns]
+        }
+
+    def catalog_campaign_owners(self, campaign_ids):
+        campaign_ids = list(campaign_ids)
+        result = {}
+        with self._connection() as conn:
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(campaign_ids), 500):
+                chunk = campaign_ids[i:i + 500]
+                rows = conn.execute(
+                    "SELECT campaign_id, brand_name, status FROM catalog_campaigns WHERE campaign_id IN (%s)"
+                    % ','.join('?' * len(chunk)), chunk
+                )
+                result.update((campaign_id, (brand_name, status)) for campaign_id, brand_name, status in rows)
+        return result
+
+    def load_catalog_campaign(self, campaign_id):
+        with self._connection() as conn:
+            row = conn.execute(SELECT_CATALOG_CAMPAIGN, (campaign_id,)).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def catalog_brand_names(self):
+        with self._connection() as conn:
+            return {r[0] for r in conn.execute(SELECT_CATALOG_BRAND_NAMES)}
+
+    def add_engagement(self, deltas):
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(ADD_ENGAGEMENT, (
+                (creator_id, campaign_id, reach, engagement, now)
+                for creator_id, campaign_id, reach, engagement in deltas
+            ))
+            rows = conn.execute(SELECT_POSTED_UPDATED, (now,)).fetchall()
+        return [(r[0], json.loads(r[1]), r[2], r[3]) for r in rows]
+
+    def load_posted_campaigns(self):
+        with self._connection() as conn:
+            rows = conn.execute(SELECT_POSTED).fetchall()
+        return [(r[0], json.loads(r[1]), r[2], r[3]) for r in rows]
+
+    def settle_campaigns(self, records):
+        now = time.time()
+        completed = []
+        creators = set()
+        with self._transaction() as conn:
+            for creator_id, record in records:
+                cursor = conn.execute(UPDATE_POSTED_CAMPAIGN, (
+                    record['status'], json.dumps(record, ensure_ascii=False), now,
+                    creator_id, record['campaign_id']
+                ))
+                if not cursor.rowcount:
+                    continue
+                creators.add(creator_id)
+                if record['status'] == 'completed':
+                    completed.append((creator_id, record))
+            conn.executemany(CREDIT_BALANCE, (
+                (record['earning_paisa'], creator_id) for creator_id, record in completed
+            ))
+            conn.executemany(BUMP_CAMPAIGN_STATS, (
+                (record['campaign_id'], 0, 1, record['earning_paisa'] / 100) for _, record in completed
+            ))
+            conn.executemany(BUMP_INGEST_SEQ, ((creator_id,) for creator_id in creators))
+        return completed
+
+    def creator_ingest_seq(self, creator_id):
+        with self._connection() as conn:
+            row = conn.execute(SELECT_INGEST_SEQ, (creator_id,)).fetchone()
+        return 0 if row is None else row[0]
+
+    def save_engagement_series(self, rows):
+        with self._transaction() as conn:
+            conn.executemany(UPSERT_ENGAGEMENT_SERIES, rows)
+
+    def load_engagement_series(self, creator_id):
+        with self._connection() as conn:
+            return conn.execute(SELECT_ENGAGEMENT_SERIES, (creator_id,)).fetchall()
+
+    def prune_engagement_series(self, cutoffs):
+        with self._transaction() as conn:
+            conn.executemany(PRUNE_ENGAGEMENT_SERIES, cutoffs.items())
@@ -0,0 +1,266 @@
+"""Precompiled HTML card templates with a rendered-HTML LRU cache
+
+Styling lives in the global stylesheet (APP_CSS, CARD_CSS); templates only
+carry per-item values such as the accent color, which keeps every card
+short on the wire. Every value is HTML-escaped on substitution, since
+brand and campaign text comes from brand imports and ends up in
+unsafe_allow_html markup.
+"""
+import threading
+from collections import OrderedDict
+from html import escape
+from string import Template
+
+# Page-level classes shared by all pages
+APP_CSS = """
+    .brand-card {
+        background: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+        border-left: 5px solid;
+        border-left-color: #3b82f6;
+    }
+    
+    .campaign-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 20px;
+        border-radius: 15px;
+        margin: 10px 0;
+    }
+    
+    .earning-card {
+        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+        color: white;
+        padding: 20px;
+        border-radius: 15px;
+    }
+    
+    .bangla-text {
+        font-size: 1.1rem;
+        line-height: 1.8;
+    }
+    
+    .status-active { color: #10b981; font-weight: bold; }
+    .status-pending { color: #f59e0b; font-weight: bold; }
+    .status-completed { color: #6b7280; font-weight: bold; }
+    
+    .reach-badge {
+        background: #3b82f6;
+        color: white;
+        padding: 5px 10px;
+        border-radius: 20px;
+        font-size: 0.9rem;
+        display: inline-block;
+        margin: 5px;
+    }
+    
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 20px;
+        border-radius: 15px;
+        color: white;
+        margin-bottom: 30px;
+    }
+"""
+
+CARD_CSS = """
+    .stat-card {
+        color: white;
+        padding: 20px;
+        border-radius: 15px;
+    }
+    .stat-blue { background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); }
+    .stat-purple { background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%); }
+    .stat-orange { background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); }
+
+    .brand-header {
+        background: var(--accent-bg);
+        padding: 20px;
+        border-radius: 15px;
+        margin: 20px 0;
+        border-left: 5px solid var(--accent);
+    }
+
+    .campaign-facts { display: flex; gap: 20px; margin-top: 15px; }
+    .campaign-payment { margin-top: 15px; }
+
+    .activity-card {
+        background: white;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0;
+        border-left: 4px solid var(--accent);
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+    .activity-card .status { color: var(--accent); }
+
+    .notif-card {
+        background: var(--accent-bg);
+        border-left: 3px solid var(--accent);
+        padding: 10px;
+        margin: 5px 0;
+        border-radius: 5px;
+        font-size: 0.9rem;
+    }
+    .notif-row { display: flex; justify-content: space-between; }
+"""
+
+STAT_CARD = Template(
+    '<div class="$css_class"><h3>$title</h3><h2>$value</h2><p>$caption</p></div>'
+)
+
+BRAND_HEADER = Template(
+    '<div class="brand-header" style="--accent: $color; --accent-bg: ${color}20;">'
+    '<h2>$logo $brand</h2>'
+    '<p><strong>ক্যাটাগরি:</strong> $category | <strong>রেটিং:</strong> $rating ⭐</p>'
+    '</div>'
+)
+
+CAMPAIGN_CARD = Template(
+    '<div class="campaign-card"><h3>$title</h3><p>$description</p>'
+    '<div class="campaign-facts">'
+    '<div><strong>কন্টেন্ট টাইপ:</strong><br>$content_type</div>'
+    '<div><strong>বেস পেমেন্ট:</strong><br>৳$base_payment</div>'
+    '<div><strong>লক্ষ্য রিচ:</strong><br>$target_reach</div>'
+    '<div><strong>ন্যূনতম এঙ্গেজমেন্ট:</strong><br>$min_engagement</div>'
+    '</div>'
+    '<div class="campaign-payment"><strong>পেমেন্ট স্ট্রাকচার:</strong><br>'
+    '• বেস পেমেন্ট: ৳$base_payment<br>'
+    '• প্রতি এঙ্গেজমেন্ট: ৳$per_engagement<br>'
+    '• সর্বোচ্চ আয়: ৳$max_earning'
+    '</div></div>'
+)
+
+ACTIVE_CARD = Template(
+    '<div class="activity-card" style="--accent: $status_color;">'
+    '<h4>$brand - $title</h4>'
+    '<p><strong>স্ট্যাটাস:</strong> <span class="status">$status_text</span></p>'
+    '<p><strong>আনুমানিক আয়:</strong> ৳$earning</p>'
+    '<p><strong>ডেডলাইন:</strong> $deadline</p>'
+    '</div>'
+)
+
+COMPLETED_CARD = Template(
+    '<div class="activity-card" style="--accent: #10b981;">'
+    '<h4>$brand - $title</h4>'
+    '<p><strong>আয়:</strong> ৳$earning</p>'
+    '<p><strong>রিচ:</strong> $reach</p>'
+    '<p><strong>সম্পন্ন তারিখ:</strong> $completed_date</p>'
+    '</div>'
+)
+
+NOTIFICATION = Template(
+    '<div class="notif-card" style="--accent: $color; --accent-bg: ${color}10;">'
+    '<div class="notif-row"><span>$message</span><small>$time</small></div>'
+    '</div>'
+)
+
+
+class RenderCache:
+    """LRU cache of rendered HTML keyed by tuples of everything the HTML depends on
+
+    One instance is shared by every session thread, so lookups and
+    evictions happen under a lock.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, template, key, fields):
+        """Return cached HTML for key, substituting the template on a miss"""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                return html
+
+        html = template.substitute({name: escape(str(value)) for name, value in fields.items()})
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return html
+
+
+_cache = RenderCache()
+
+
+def render_stat_card(variant, title, value, caption):
+    """Render a dashboard stat card (variant: earning, blue, purple, orange)"""
+    css_class = 'earning-card' if variant == 'earning' else f'stat-card stat-{variant}'
+    return _cache.render(STAT_CARD, ('stat', variant, title, value, caption), {
+        'css_class': css_class, 'title': title, 'value': value, 'caption': caption
+    })
+
+
+def render_brand_header(brand_name, brand_data):
+    """Render the marketplace header for one brand"""
+    key = ('brand', brand_name, brand_data['color'], brand_data['logo'],
+           brand_data['category'], brand_data['rating'])
+    return _cache.render(BRAND_HEADER, key, {
+        'brand': brand_name,
+        'color': brand_data['color'],
+        'logo': brand_data['logo'],
+        'category': brand_data['category'],
+        'rating': brand_data['rating']
+    })
+
+
+def render_campaign_card(campaign, content_type_name, max_earning):
+    """Render a marketplace campaign card, cached by its field values"""
+    fields = {
+        'title': campaign['title'],
+        'description': campaign['description'],
+        'content_type': content_type_name,
+        'base_payment': campaign['base_payment'],
+        'target_reach': campaign['target_reach'],
+        'min_engagement': campaign['min_engagement'],
+        'per_engagement': campaign['per_engagement'],
+        'max_earning': f"{max_earning:.2f}"
+    }
+    # Keyed by content rather than a catalog version, which restarts at 1
+    # whenever the catalog is rebuilt in the same process
+    return _cache.render(CAMPAIGN_CARD, ('campaign',) + tuple(fields.values()), fields)
+
+
+def render_active_card(record, status_text, status_color, deadline):
+    """Render a dashboard card for an active campaign"""
+    earning = f"{record.get('estimated_earning', 0):.2f}"
+    key = ('active', record['campaign_id'], status_text, earning, deadline)
+    return _cache.render(ACTIVE_CARD, key, {
+        'brand': record['brand'],
+        'title': record['title'],
+        'status_text': status_text,
+        'status_color': status_color,
+        'earning': earning,
+        'deadline': deadline
+    })
+
+
+def render_completed_card(record):
+    """Render a dashboard card for a completed campaign"""
+    earning = f"{record.get('actual_earning', record.get('estimated_earning', 0)):.2f}"
+    reach = record.get('actual_reach', 0)
+    completed_date = record.get('completed_date', 'N/A')
+    key = ('completed', record['campaign_id'], earning, reach, completed_date)
+    return _cache.render(COMPLETED_CARD, key, {
+        'brand': record['brand'],
+        'title': record['title'],
+        'earning': earning,
+        'reach': reach,
+        'completed_date': completed_date
+    })
+
+
+def render_notification(notif, color):
+    """Render a sidebar notification"""
+    key = ('notification', notif['message'], notif['time'], color)
+    return _cache.render(NOTIFICATION, key, {
+        'message': notif['message'], 'time': notif['time'], 'color': color
+    })
@@ -0,0 +1,74 @@
+from datetime import date
+
+import pytest
+
+from bn_dates import format_bengali_date, parse_bengali_date
+from catalog import CampaignCatalog
+
+
+def campaign(campaign_id, deadline, status='active'):
+    return {
+        'id': campaign_id, 'title': campaign_id, 'content_type': 'video', 'status': status,
+        'base_payment': 100, 'target_reach': 1000, 'per_engagement': 0.5, 'min_engagement': 10,
+        'deadline': deadline
+    }
+
+
+def catalog(*campaigns):
+    return CampaignCatalog({'ব্র্যান্ড': {'category': 'খাদ্য', 'campaigns': list(campaigns)}})
+
+
+def test_yearless_date_resolves_to_next_occurrence():
+    assert parse_bengali_date('১৫ মে', date(2026, 11, 10)) == date(2027, 5, 15)
+    assert parse_bengali_date('১৫ মে', date(2026, 5, 15)) == date(2026, 5, 15)
+    assert parse_bengali_date('২৯ ফেব্রুয়ারি', date(2026, 3, 1)) == date(2028, 2, 29)
+    assert parse_bengali_date('১৫ ডিসেম্বর ২০২৫', date(2026, 11, 10)) == date(2025, 12, 15)
+
+
+def test_formatted_date_round_trips():
+    assert format_bengali_date(date(2027, 5, 15)) == '১৫ মে ২০২৭'
+    assert parse_bengali_date(format_bengali_date(date(2027, 1, 3))) == date(2027, 1, 3)
+
+
+@pytest.mark.parametrize('text', ['', '১৫', '১৫ মাস', '৩২ মে ২০২৬'])
+def test_invalid_dates_raise_value_error(text):
+    with pytest.raises(ValueError):
+        parse_bengali_date(text)
+
+
+def test_expire_due_flips_only_past_active_campaigns():
+    cat = catalog(
+        campaign('past', '১০ মে ২০২৬'),
+        campaign('today', '১৫ মে ২০২৬'),
+        campaign('future', '২০ মে ২০২৬'),
+        campaign('paused', '১ মে ২০২৬', status='paused')
+    )
+
+    expired = cat.expire_due(today=date(2026, 5, 15))
+
+    assert expired == ['past']
+    assert cat.campaigns['past']['status'] == 'expired'
+    assert cat.query(status='active') == {'today', 'future'}
+    assert cat.query(status='expired') == {'past'}
+    assert cat.campaigns['paused']['status'] == 'paused'
+    assert cat.expire_due(today=date(2026, 5, 15)) == []
+    assert not cat.has_due(today=date(2026, 5, 15))
+
+
+def test_expire_due_uses_the_current_deadline_after_an_update():
+    cat = catalog(campaign('c', '১০ মে ২০২৬'))
+    cat.upsert_campaign('ব্র্যান্ড', campaign('c', '১০ জুন ২০২৬'))
+
+    assert cat.expire_due(today=date(2026, 5, 15)) == []
+    assert cat.days_left('c', today=date(2026, 5, 15)) == 26
+    assert cat.expire_due(today=date(2026, 6, 11)) == ['c']
+
+
+def test_expiring_soon_lists_active_campaigns_in_window():
+    cat = catalog(
+        campaign('soon', '১৭ মে ২০২৬'),
+        campaign('later', '৩০ মে ২০২৬'),
+        campaign('closed', '১৬ মে ২০২৬', status='closed')
+    )
+
+    assert cat.expiring_soon(3, today=date(2026, 5, 15)) == ['soon']
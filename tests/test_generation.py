@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+from ai_content import TemplateModel, generate_ai_content, generate_video_script
+from generation import CANCELLED, DONE, QUEUED, RUNNING, GenerationService
+from generation_cache import GenerationCache
+
+
+class CountingModel(TemplateModel):
+    """TemplateModel that records how many calls ran and how many overlapped"""
+
+    def __init__(self, delay):
+        super().__init__(delay)
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def caption(self, brand, title):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            return super().caption(brand, title)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def make_service():
+    services = []
+
+    def make(model, **kwargs):
+        service = GenerationService(model, **kwargs)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.shutdown()
+
+
+def wait_for_status(service, job_id, status, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while service.get(job_id).status != status:
+        assert time.monotonic() < deadline, f"job never reached {status}"
+        time.sleep(0.005)
+
+
+def test_submit_and_poll(make_service):
+    service = make_service(TemplateModel(delay=0.05))
+    caption_id = service.submit('caption', 'প্রাণ ফুডস', 'জুস ক্যাম্পেইন')
+    script_id = service.submit('script', 'প্রাণ ফুডস', 'জুস ক্যাম্পেইন')
+
+    assert service.get(caption_id).status in (QUEUED, RUNNING)
+    caption = service.wait(caption_id, timeout=2)
+    script = service.wait(script_id, timeout=2)
+
+    assert caption.status == DONE
+    assert caption.result == generate_ai_content('প্রাণ ফুডস', 'জুস ক্যাম্পেইন')
+    assert script.status == DONE
+    assert script.result == generate_video_script('প্রাণ ফুডস', 'জুস ক্যাম্পেইন')
+    assert service.get('unknown') is None
+
+
+def test_cancel_queued_job_never_runs(make_service):
+    model = CountingModel(delay=0.1)
+    service = make_service(model, max_workers=1)
+    running_id = service.submit('caption', 'ব্র্যান্ড', 'প্রথম')
+    queued_id = service.submit('caption', 'ব্র্যান্ড', 'দ্বিতীয়')
+
+    assert service.get(queued_id).status == QUEUED
+    assert service.cancel(queued_id)
+    service.wait(running_id, timeout=2)
+    time.sleep(0.05)
+
+    assert service.get(running_id).status == DONE
+    assert service.get(queued_id).status == CANCELLED
+    assert model.calls == 1
+
+
+def test_cancel_running_job_drops_result(make_service):
+    service = make_service(TemplateModel(delay=0.1))
+    job_id = service.submit('caption', 'ব্র্যান্ড', 'ক্যাম্পেইন')
+    wait_for_status(service, job_id, RUNNING)
+
+    assert service.cancel(job_id)
+    job = service.wait(job_id, timeout=2)
+
+    assert job.status == CANCELLED
+    assert job.result is None
+    assert not service.cancel(job_id)
+
+
+def test_workers_cap_concurrent_generations(make_service):
+    model = CountingModel(delay=0.05)
+    service = make_service(model, max_workers=2)
+    job_ids = [service.submit('caption', 'ব্র্যান্ড', f"ক্যাম্পেইন {i}") for i in range(6)]
+
+    jobs = [service.wait(job_id, timeout=2) for job_id in job_ids]
+
+    assert all(job.status == DONE for job in jobs)
+    assert model.calls == 6
+    assert model.max_running == 2
+
+
+def test_cache_hit_skips_model(make_service):
+    model = CountingModel(delay=0.01)
+    cache = GenerationCache(maxsize=8)
+    service = make_service(model, cache=cache)
+    first = service.wait(service.submit('caption', 'ব্র্যান্ড', 'ক্যাম্পেইন', campaign_id='c1'), timeout=2)
+
+    # Same request after text normalization: answered from the cache
+    second = service.get(service.submit('caption', 'ব্র্যান্ড', '  ক্যাম্পেইন ', campaign_id='c1'))
+
+    assert second.status == DONE
+    assert second.future is None
+    assert second.result == first.result
+    assert model.calls == 1
+    assert cache.hits == 1
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+import numpy as np
+
+from money import to_taka
+from payouts import campaign_max_payout, campaign_payout, compute_payouts
+
+
+def test_bonus_rounds_half_up_to_whole_paisa():
+    # 0.0125 Taka per engagement: 1.25, 2.5 and 3.75 paisa
+    result = compute_payouts(0, 1000, 0.0125, 0, [1, 2, 3])
+
+    assert result['bonus'].tolist() == [1, 3, 4]
+
+
+def test_base_requires_min_engagement():
+    result = compute_payouts(100, 1000, 0.5, 50, [49, 50])
+
+    assert result['base'].tolist() == [0, 10000]
+    assert result['total'].tolist() == [2450, 12500]
+
+
+def test_bonus_capped_at_target_reach():
+    result = compute_payouts(10, 100, 0.5, 0, [100, 5000])
+    uncapped = compute_payouts(10, 100, 0.5, 0, [5000], cap=False)
+
+    assert result['total'].tolist() == [6000, 6000]
+    assert uncapped['total'].tolist() == [251000]
+
+
+def test_decimal_amounts_are_exact():
+    # 0.1 and 0.29 are inexact in binary floating point
+    result = compute_payouts([0.29, 0.1], 1000, 0.1, 0, [3, 3])
+
+    assert result['total'].dtype == np.int64
+    assert result['total'].tolist() == [59, 40]
+    assert to_taka(result['total'].sum()) == Decimal('0.99')
+
+
+def test_campaign_helpers_match_vectorized_engine():
+    campaign = {'base_payment': 120, 'target_reach': 5000, 'per_engagement': 0.35, 'min_engagement': 100}
+
+    assert campaign_payout(campaign, 99) == 34.65
+    assert campaign_payout(campaign, 1000) == 470.0
+    assert campaign_max_payout(campaign) == 1870.0
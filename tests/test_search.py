@@ -0,0 +1,60 @@
+from search import MAX_EXPANSIONS, SearchIndex, tokenize
+
+
+def index(docs):
+    search_index = SearchIndex()
+    for doc_id, fields in docs.items():
+        search_index.add(doc_id, fields)
+    return search_index
+
+
+def test_tokenize_normalizes_digits_joiners_and_case():
+    assert tokenize('জুস‌ ১২ SALE') == ('জুস', '12', 'sale')
+
+
+def test_every_query_word_must_match():
+    search_index = index({
+        'a': {'brand': 'প্রাণ', 'title': 'আমের জুস'},
+        'b': {'brand': 'প্রাণ', 'title': 'চিপস'},
+        'c': {'brand': 'আকিজ', 'title': 'জুস'}
+    })
+
+    assert search_index.match('প্রাণ জুস') == {'a'}
+    assert search_index.match('প্রাণ') == {'a', 'b'}
+    assert search_index.match('  ') is None
+
+
+def test_prefix_matches_all_words_beyond_scoring_cap():
+    docs = {f"d{i}": {'title': f"summer{i:03d}"} for i in range(MAX_EXPANSIONS * 4)}
+    search_index = index(docs)
+
+    assert search_index.match('summ') == set(docs)
+    assert set(search_index.rank('summ')) == set(docs)
+
+
+def test_fuzzy_match_when_no_prefix_hits():
+    search_index = index({'a': {'title': 'দারুণ অফার'}})
+
+    # দারুন (dental na) is a common misspelling of দারুণ
+    assert search_index.match('দারুন') == {'a'}
+
+
+def test_title_hits_rank_above_description_hits():
+    search_index = index({
+        'desc': {'title': 'নতুন অফার', 'description': 'ঠান্ডা জুস'},
+        'title': {'title': 'ঠান্ডা জুস', 'description': 'নতুন অফার'}
+    })
+
+    assert search_index.rank('জুস') == ['title', 'desc']
+
+
+def test_removed_and_replaced_documents_stop_matching():
+    search_index = index({'a': {'title': 'জুস'}, 'b': {'title': 'চিপস'}})
+    search_index.remove('b')
+    search_index.add('a', {'title': 'দুধ'})
+
+    assert search_index.match('জুস') == set()
+    assert search_index.match('চিপস') == set()
+    assert search_index.match('দুধ') == {'a'}
+    assert len(search_index) == 1
+
@@ -0,0 +1,57 @@
+import pytest
+
+from ingestion import EngagementIngestor
+from storage import SQLiteCreatorStore
+
+
+def posted(campaign_id, **terms):
+    return dict({
+        'campaign_id': campaign_id, 'status': 'posted', 'deadline': '১৫ ডিসেম্বর ২০৯৯',
+        'base_payment': 100, 'target_reach': 1000, 'per_engagement': 0.5, 'min_engagement': 10
+    }, **terms)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteCreatorStore(str(tmp_path / 'collabnet.db'))
+    store.load_creator('creator', default_balance=0)
+    return store
+
+
+def test_settle_campaigns_pays_a_completion_once(store):
+    store.save_campaign('creator', posted('c1'))
+    record = dict(posted('c1'), status='completed', earning_paisa=12345)
+
+    first = store.settle_campaigns([('creator', record)])
+    second = store.settle_campaigns([('creator', dict(record))])
+
+    assert [r['campaign_id'] for _, r in first] == ['c1']
+    assert second == []
+    assert store.load_creator('creator')['balance'] == 12345
+    assert store.load_campaign_stats()['c1'][1] == 1
+
+
+def test_settle_campaigns_skips_records_no_longer_posted(store):
+    store.save_campaign('creator', dict(posted('c1'), status='content_pending'))
+    seq = store.creator_ingest_seq('creator')
+
+    completed = store.settle_campaigns([('creator', dict(posted('c1'), status='completed', earning_paisa=500))])
+
+    assert completed == []
+    assert store.load_creator('creator')['balance'] == 0
+    assert store.creator_ingest_seq('creator') == seq
+
+
+def test_two_ingestors_settle_the_same_campaign_once(store):
+    store.save_campaign('creator', posted('c1'))
+    events = [{'creator_id': 'creator', 'campaign_id': 'c1', 'reach': 1200, 'likes': 40}]
+
+    reports = [EngagementIngestor(store, sweep_interval=3600).run(events) for _ in range(2)]
+
+    # 100 Taka base + 40 * 0.5 Taka bonus
+    assert [report.completed for report in reports] == [1, 0]
+    assert reports[0].paid_paisa == 12000
+    saved = store.load_creator('creator')
+    assert saved['balance'] == 12000
+    assert saved['completed_campaigns'][0]['actual_reach'] == 1200
+    assert store.creator_ingest_seq('creator') == 1
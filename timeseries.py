@@ -0,0 +1,155 @@
+"""Array-backed engagement history with hourly and daily rollups
+
+Samples are cumulative (reach, engagement) counters. Each rollup keeps
+the latest sample per bucket, so a bucket's value is the campaign's total
+at the end of that hour or day, and a coarser rollup never needs the
+finer one. Raw events are never kept.
+"""
+import time
+
+import numpy as np
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Rollup step -> how long its buckets are kept, in seconds
+RETENTION = {
+    HOUR: 14 * DAY,
+    DAY: 400 * DAY
+}
+STEPS = tuple(RETENTION)
+
+MAX_CHART_POINTS = 200
+
+
+def bucket_start(ts, step):
+    """Start of the step-sized bucket holding a UNIX timestamp"""
+    return int(ts) // step * step
+
+
+def rollup_rows(campaign_id, ts, reach, engagement):
+    """(campaign_id, step, bucket, reach, engagement) rows folding one sample into every rollup"""
+    return [(campaign_id, step, bucket_start(ts, step), reach, engagement) for step in STEPS]
+
+
+def downsample(times, *columns, max_points=MAX_CHART_POINTS):
+    """Thin cumulative series to at most `max_points` evenly spaced bins
+
+    The last sample of each bin is kept, which for cumulative counters
+    is the bin's exact total.
+    """
+    if len(times) <= max_points:
+        return (times,) + columns
+    edges = np.linspace(times[0], times[-1], max_points + 1)[1:]
+    last = np.unique(np.searchsorted(times, edges, side='right') - 1)
+    return (times[last],) + tuple(column[last] for column in columns)
+
+
+class RollupSeries:
+    """Fixed-capacity ring of (bucket start, reach, engagement) columns at one step
+
+    A sample in the newest bucket overwrites it, a later one opens a new
+    bucket and, once `capacity` buckets are held, evicts the oldest. Late
+    samples for older buckets are dropped, since the newer cumulative
+    totals already include them.
+    """
+
+    def __init__(self, step, capacity):
+        self.step = step
+        self.times = np.zeros(capacity, dtype=np.int64)
+        self.reach = np.zeros(capacity, dtype=np.int64)
+        self.engagement = np.zeros(capacity, dtype=np.int64)
+        self._end = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return len(self.times)
+
+    def record(self, ts, reach, engagement):
+        """Fold a cumulative sample into its bucket"""
+        bucket = bucket_start(ts, self.step)
+        newest = (self._end - 1) % self.capacity
+        if self._size and bucket < self.times[newest]:
+            return
+        if not self._size or bucket > self.times[newest]:
+            newest = self._end
+            self._end = (self._end + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+        self.times[newest] = bucket
+        self.reach[newest] = reach
+        self.engagement[newest] = engagement
+
+    def arrays(self, since=None):
+        """Chronological (times, reach, engagement) arrays, from `since` on when given"""
+        order = np.arange(self._end - self._size, self._end) % self.capacity
+        times = self.times[order]
+        lo = 0 if since is None else np.searchsorted(times, bucket_start(since, self.step))
+        return times[lo:], self.reach[order][lo:], self.engagement[order][lo:]
+
+    def value_before(self, ts):
+        """(end time, reach, engagement) of the newest bucket that ended by `ts`, or None"""
+        times, reach, engagement = self.arrays()
+        i = np.searchsorted(times, int(ts) - self.step, side='right') - 1
+        if i < 0:
+            return None
+        return int(times[i]) + self.step, int(reach[i]), int(engagement[i])
+
+
+class CampaignSeries:
+    """Hourly and daily rollups of one campaign's counters
+
+    Every rollup is a ring sized to its retention, so a campaign's history
+    takes a fixed ~17 KiB however long it runs.
+    """
+
+    def __init__(self):
+        self.rollups = {step: RollupSeries(step, retention // step) for step, retention in RETENTION.items()}
+
+    def record(self, ts, reach, engagement):
+        """Fold a cumulative sample into every rollup"""
+        for rollup in self.rollups.values():
+            rollup.record(ts, reach, engagement)
+
+    def history(self, since=None, now=None, max_points=MAX_CHART_POINTS):
+        """Downsampled (times, reach, engagement) from `since` (or the first sample) to now
+
+        Reads the finest rollup whose retention still reaches back that far.
+        A window starting after the first sample opens with the totals as
+        of `since`, so campaigns idle within the window still count.
+        """
+        start = since
+        if start is None:
+            coarsest = self.rollups[STEPS[-1]]
+            start = coarsest.arrays()[0][0] if len(coarsest) else 0
+        now = time.time() if now is None else now
+        step = next((s for s in STEPS if now - start <= RETENTION[s]), STEPS[-1])
+        times, reach, engagement = self.rollups[step].arrays(since)
+        if since is not None and (not len(times) or times[0] > since):
+            # Any rollup may hold the latest total before the window
+            seeds = [rollup.value_before(since) for rollup in self.rollups.values()]
+            seed = max((s for s in seeds if s is not None), default=None)
+            if seed is not None:
+                times = np.concatenate(([int(since)], times))
+                reach = np.concatenate(([seed[1]], reach))
+                engagement = np.concatenate(([seed[2]], engagement))
+        return downsample(times, reach, engagement, max_points=max_points)
+
+
+def build_series(rows):
+    """{campaign_id: CampaignSeries} from stored (campaign_id, step, bucket, reach, engagement) rows
+
+    Rows must be ordered by bucket within each campaign and step.
+    """
+    series = {}
+    for campaign_id, step, bucket, reach, engagement in rows:
+        campaign = series.get(campaign_id)
+        if campaign is None:
+            campaign = series[campaign_id] = CampaignSeries()
+        rollup = campaign.rollups.get(step)
+        if rollup is not None:
+            rollup.record(bucket, reach, engagement)
+    return series
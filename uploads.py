@@ -0,0 +1,152 @@
+"""Upload pipeline: chunked spooling to disk, dedup by hash, background thumbnails"""
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from assets import STATIC_DIR, STATIC_URL
+
+CHUNK_SIZE = 1024 * 1024
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+VIDEO_EXTENSIONS = {'.mp4', '.mov'}
+
+THUMBNAIL_DIR = STATIC_DIR / 'uploads'
+
+
+class UploadedMedia:
+    """A stored upload and its (possibly pending) thumbnail"""
+
+    def __init__(self, digest, name, size, path):
+        self.digest = digest
+        self.name = name
+        self.size = size
+        self.path = path
+        self.extension = path.suffix
+        self.kind = 'video' if self.extension in VIDEO_EXTENSIONS else 'image'
+        self.future = None
+        self.error = None
+
+    @property
+    def thumbnail_path(self):
+        return THUMBNAIL_DIR / f"{self.digest}.jpg"
+
+    @property
+    def preview_url(self):
+        """Static URL of the thumbnail, or None for media without one"""
+        if self.kind != 'image':
+            return None
+        return f"{STATIC_URL}/uploads/{self.digest}.jpg"
+
+    def thumbnail(self, timeout=None):
+        """Wait up to `timeout` seconds for the thumbnail; True once it exists
+
+        False for videos, while it is still being rendered, or when
+        rendering failed (e.g. a corrupt or mislabelled image), in which
+        case `error` holds the exception.
+        """
+        if self.future is None:
+            return False
+        try:
+            self.future.result(timeout)
+        except FutureTimeout:
+            return False
+        except Exception as exc:
+            self.error = exc
+            return False
+        return True
+
+
+def make_thumbnail(source, target, size):
+    """Write a downscaled, EXIF-rotated progressive JPEG of an image"""
+    with Image.open(source) as img:
+        # Let the JPEG decoder skip straight to roughly the target scale
+        img.draft('RGB', size)
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail(size)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            img.save(f, 'JPEG', quality=80, optimize=True, progressive=True)
+        os.replace(tmp, target)
+
+
+class UploadStore:
+    """Content-addressed store for creator uploads
+
+    Uploads are copied to disk in `chunk_size` pieces while being hashed,
+    so no extra in-memory copy of a large video is made. Identical files
+    are stored once, and each image gets one thumbnail rendered on a
+    small worker pool off the Streamlit script thread.
+    """
+
+    def __init__(self, root, max_workers=2, thumbnail_size=(480, 480), chunk_size=CHUNK_SIZE):
+        self.root = Path(root)
+        self.thumbnail_size = thumbnail_size
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='thumbnail')
+        self._media = {}
+        self._lock = threading.Lock()
+        (self.root / 'tmp').mkdir(parents=True, exist_ok=True)
+        THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+
+    def save(self, upload, name=None):
+        """Store a file-like upload and return its UploadedMedia
+
+        `upload` only needs read(); Streamlit's UploadedFile works as is.
+        """
+        name = name or getattr(upload, 'name', 'upload')
+        extension = Path(name).suffix.lower()
+        if hasattr(upload, 'seek'):
+            upload.seek(0)
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp = tempfile.mkstemp(dir=self.root / 'tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in iter(lambda: upload.read(self.chunk_size), b''):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            key = digest.hexdigest()
+            path = self.root / key[:2] / f"{key}{extension}"
+            if path.exists():
+                os.unlink(tmp)
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        with self._lock:
+            media = self._media.get(key)
+            if media is None:
+                media = UploadedMedia(key, name, size, path)
+                if media.kind == 'image':
+                    media.future = self._schedule_thumbnail(media)
+                self._media[key] = media
+        return media
+
+    def _schedule_thumbnail(self, media):
+        if media.thumbnail_path.exists():
+            future = self._executor.submit(lambda: None)
+        else:
+            future = self._executor.submit(
+                make_thumbnail, media.path, media.thumbnail_path, self.thumbnail_size
+            )
+        return future
+
+    def get(self, digest):
+        """Return stored media by content hash"""
+        return self._media.get(digest)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,16 @@
+"""Page modules, imported on first visit so a page's dependencies load lazily"""
+import importlib
+
+# Page key -> (module, render function)
+PAGES = {
+    'dashboard': ('views.dashboard', 'show_dashboard'),
+    'marketplace': ('views.marketplace', 'show_marketplace'),
+    'create_content': ('views.create_content', 'create_content'),
+    'performance': ('views.performance', 'show_performance')
+}
+
+
+def load_page(page):
+    """Return the render function of a page, importing its module on first use"""
+    module_name, function_name = PAGES[page]
+    return getattr(importlib.import_module(module_name), function_name)
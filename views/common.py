@@ -0,0 +1,222 @@
+"""Shared resources, session state and helpers used by every page"""
+import os
+from datetime import datetime
+
+import streamlit as st
+
+from ai_content import TemplateModel
+from assets import font_face_css, font_stack
+from campaign_stats import CampaignStatsBook
+from catalog import CampaignCatalog
+from generation import DONE, FAILED, FINISHED, GenerationService
+from generation_cache import GenerationCache
+from ledger import CreatorLedger, earning_paisa
+from money import PAISA_PER_TAKA, to_taka
+from notifications import NotificationFeed
+from storage import SQLiteCreatorStore
+from templates import APP_CSS, CARD_CSS
+
+CONTENT_TYPE_NAMES = {
+    'static_post': 'স্ট্যাটিক পোস্ট',
+    'video': 'ভিডিও',
+    'text_image': 'টেক্সট+ইমেজ'
+}
+
+# Persistent storage shared by all sessions and worker processes
+CREATOR_ID = os.environ.get('COLLABNET_CREATOR_ID', 'demo_creator')
+
+# New creators start with ৳1250
+STARTING_BALANCE_PAISA = 125_000
+
+# Notifications kept in session memory; older ones stay in the store
+NOTIFICATION_CAPACITY = 20
+
+@st.cache_resource
+def get_store():
+    """Open the SQLite store once per server process"""
+    return SQLiteCreatorStore(os.environ.get('COLLABNET_DB_PATH', 'collabnet.db'))
+
+@st.cache_resource
+def get_campaign_stats():
+    """Load the shared per-campaign statistics once per server process"""
+    return CampaignStatsBook(get_store())
+
+@st.cache_resource
+def get_upload_store():
+    """Open the shared upload store and thumbnail workers once per server process"""
+    from uploads import UploadStore
+    return UploadStore(os.environ.get('COLLABNET_UPLOAD_DIR', 'uploads'))
+
+@st.cache_resource
+def get_css():
+    """Assemble the global stylesheet once per server process"""
+    return (
+        "<style>" + font_face_css() +
+        "\n    * {\n        font-family: " + font_stack() + ";\n    }\n" +
+        APP_CSS + CARD_CSS + "</style>"
+    )
+
+@st.cache_resource
+def get_campaign_manager():
+    """Load the stored campaign catalog once per server process, seeding it on first use"""
+    from brands import BRANDS
+    from campaigns import CampaignManager
+    manager = CampaignManager(get_store(), CampaignCatalog())
+    manager.seed(BRANDS)
+    manager.sync(force=True)
+    return manager
+
+def get_catalog():
+    """Return the shared catalog with brand-side changes applied incrementally"""
+    manager = get_campaign_manager()
+    manager.sync()
+    return manager.catalog
+
+@st.cache_resource
+def _get_recommender():
+    from recommend import CampaignRecommender
+    return CampaignRecommender(get_catalog())
+
+def get_recommender():
+    """Return the shared campaign recommender, pointed at the latest catalog snapshot"""
+    recommender = _get_recommender()
+    recommender.catalog = get_catalog()
+    return recommender
+
+def get_content_type_name(content_type):
+    """Convert content type code to readable name"""
+    return CONTENT_TYPE_NAMES.get(content_type, content_type)
+
+@st.cache_resource
+def get_generation_service():
+    """Start the shared AI generation worker pool once per server process"""
+    cache = GenerationCache(
+        maxsize=int(os.environ.get('COLLABNET_AI_CACHE_SIZE', 1024)),
+        ttl=int(os.environ.get('COLLABNET_AI_CACHE_TTL', 24 * 3600)),
+        disk_dir=os.environ.get('COLLABNET_AI_CACHE_DIR')
+    )
+    return GenerationService(
+        TemplateModel(), max_workers=int(os.environ.get('COLLABNET_AI_WORKERS', 4)), cache=cache
+    )
+
+def start_generation(job_key, kind, campaign):
+    """Queue an AI generation job for a campaign and remember its id in the session"""
+    service = get_generation_service()
+    old_job_id = st.session_state.get(job_key)
+    if old_job_id is not None:
+        service.cancel(old_job_id)
+    job_id = service.submit(
+        kind, campaign['brand'], campaign['title'],
+        campaign_id=campaign['campaign_id'], content_type=campaign['content_type']
+    )
+    st.session_state[job_key] = job_id
+    # Fast generations finish within this run; slow ones are polled later
+    service.wait(job_id, timeout=0.5)
+
+def poll_generation(job_key, result_key, label):
+    """Show a pending AI job's status and move a finished result into the session"""
+    job_id = st.session_state.get(job_key)
+    if job_id is None:
+        return
+    
+    service = get_generation_service()
+    job = service.get(job_id)
+    if job is None or job.status in FINISHED:
+        del st.session_state[job_key]
+        if job is not None and job.status == DONE:
+            st.session_state[result_key] = job.result
+        elif job is not None and job.status == FAILED:
+            st.error(f"{label} তৈরি করা যায়নি: {job.error}")
+        return
+    
+    st.info(f"⏳ {label} তৈরি হচ্ছে...")
+    refresh_col, cancel_col = st.columns(2)
+    with refresh_col:
+        if st.button("🔄 রিফ্রেশ", key=f"{job_key}_refresh"):
+            st.rerun()
+    with cancel_col:
+        if st.button("✖️ বাতিল", key=f"{job_key}_cancel"):
+            service.cancel(job_id)
+            del st.session_state[job_key]
+            st.rerun()
+
+def add_notification(message, type='info'):
+    """Add notification to the session feed and the store"""
+    notif = {
+        'message': message,
+        'type': type,
+        'time': datetime.now().strftime("%H:%M")
+    }
+    st.session_state.notifications.push(notif)
+
+def submit_content(campaign, created_content, content, reach, engagement, earning, message,
+                   success="✅ কন্টেন্ট সাবমিট করা হয়েছে! পারফরম্যান্স ট্র্যাকিং শুরু হয়েছে।"):
+    """Shared submission pipeline for all content types
+
+    Updates the campaign, its content record and the ledger totals in one
+    step, then reruns once; the success message is shown on that rerun.
+    """
+    now = datetime.now().strftime("%d %b %Y, %I:%M %p")
+    st.session_state.ledger.submit(
+        campaign['campaign_id'],
+        {
+            'campaign_id': campaign['campaign_id'],
+            'brand': campaign['brand'],
+            'title': campaign['title'],
+            'content_type': campaign['content_type'],
+            'content': content,
+            'created_date': now,
+            'estimated_earning': earning
+        },
+        status='posted',
+        created_content=dict(created_content, created_date=now),
+        current_reach=reach,
+        current_engagement=engagement,
+        estimated_earning=earning,
+        # Estimates come from the paisa payout engine, so this is exact
+        earning_paisa=round(earning * PAISA_PER_TAKA)
+    )
+    add_notification(message, 'success')
+    st.session_state.flash = success
+    st.rerun()
+
+def init_session():
+    """Load the creator's ledger, balance and notifications into a new session"""
+    if 'ledger' in st.session_state:
+        return
+    # Read before loading, so ingestion that lands in between triggers a refresh
+    st.session_state.ingest_seq = get_store().creator_ingest_seq(CREATOR_ID)
+    saved = get_store().load_creator(
+        CREATOR_ID, default_balance=STARTING_BALANCE_PAISA, notification_limit=NOTIFICATION_CAPACITY
+    )
+    st.session_state.balance_paisa = saved['balance']
+    st.session_state.ledger = CreatorLedger(
+        get_store(), CREATOR_ID, saved['active_campaigns'], saved['completed_campaigns'],
+        saved['content_created'], get_campaign_stats()
+    )
+    st.session_state.notifications = NotificationFeed(
+        NOTIFICATION_CAPACITY, get_store(), CREATOR_ID, saved['notifications']
+    )
+
+def refresh_session():
+    """Pick up campaign updates and payouts written by the engagement ingestor
+
+    The ingestor bumps the creator's ingest_seq, so the session's own
+    writes never cause a reload.
+    """
+    store = get_store()
+    ingest_seq = store.creator_ingest_seq(CREATOR_ID)
+    if ingest_seq == st.session_state.ingest_seq:
+        return
+    ledger = st.session_state.ledger
+    completed_before = {c['campaign_id'] for c in ledger.completed_campaigns}
+    saved = store.load_creator(CREATOR_ID, notification_limit=0)
+    ledger.reload(saved['active_campaigns'], saved['completed_campaigns'], saved['content_created'])
+    st.session_state.balance_paisa = saved['balance']
+    st.session_state.ingest_seq = ingest_seq
+    for record in ledger.completed_campaigns:
+        if record['campaign_id'] not in completed_before:
+            add_notification(
+                f"🎉 '{record['title']}' ক্যাম্পেইন সম্পন্ন হয়েছে! ৳{to_taka(earning_paisa(record))} আপনার ব্যালেন্সে যোগ হয়েছে",
+                'success'
+            )
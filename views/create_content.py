@@ -0,0 +1,399 @@
+"""Content creation pages for static posts, videos and text+image posts"""
+from html import escape
+
+import streamlit as st
+
+from assets import placeholder_image
+from forecast import forecast_campaign
+from payouts import campaign_payout
+from views.common import (
+    CREATOR_ID, get_catalog, get_content_type_name, get_upload_store, poll_generation,
+    start_generation, submit_content
+)
+
+def create_content():
+    """Create content for campaigns"""
+    st.title("🎨 কন্টেন্ট তৈরি করুন")
+    
+    if not st.session_state.ledger.active_campaigns:
+        st.info("📭 আপনি এখনো কোনো ক্যাম্পেইন গ্রহণ করেননি। প্রথমে ব্র্যান্ড মার্কেটপ্লেস থেকে ক্যাম্পেইন গ্রহণ করুন।")
+        if st.button("🏢 ব্র্যান্ড মার্কেটপ্লেস দেখুন"):
+            st.session_state.page = "marketplace"
+            st.rerun()
+        return
+    
+    # Select campaign to create content for
+    pending_campaigns = [c for c in st.session_state.ledger.active_campaigns if c['status'] == 'content_pending']
+    
+    if not pending_campaigns:
+        st.success("✅ আপনার সব ক্যাম্পেইনের জন্য কন্টেন্ট তৈরি করা হয়েছে!")
+        return
+    
+    campaign_options = {f"{c['brand']} - {c['title']}": c for c in pending_campaigns}
+    selected_campaign_name = st.selectbox(
+        "কন্টেন্ট তৈরি করার জন্য ক্যাম্পেইন সিলেক্ট করুন",
+        list(campaign_options.keys())
+    )
+    
+    selected_campaign = campaign_options[selected_campaign_name]
+    brand = get_catalog().brands[selected_campaign['brand']]
+    
+    st.markdown(f"""
+    <div class="brand-card" style="border-left-color: {escape(brand['color'])};">
+        <h3>{escape(brand['logo'])} {escape(selected_campaign['brand'])}</h3>
+        <h4>{escape(selected_campaign['title'])}</h4>
+        <p><strong>কন্টেন্ট টাইপ:</strong> {escape(get_content_type_name(selected_campaign['content_type']))}</p>
+        <p><strong>বেস পেমেন্ট:</strong> ৳{selected_campaign['base_payment']}</p>
+        <p><strong>লক্ষ্য:</strong> {selected_campaign['target_reach']} রিচ, {selected_campaign['min_engagement']} এঙ্গেজমেন্ট</p>
+        <p><strong>ডেডলাইন:</strong> {escape(selected_campaign.get('deadline', '১৫ ডিসেম্বর'))}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Content Creation Based on Type
+    content_type = selected_campaign['content_type']
+    
+    if content_type == 'static_post':
+        create_static_post_content(selected_campaign)
+    elif content_type == 'video':
+        create_video_content(selected_campaign)
+    elif content_type == 'text_image':
+        create_text_image_content(selected_campaign)
+
+def show_forecast(campaign):
+    """Show the seeded performance forecast and return median reach, engagement and earning"""
+    forecast = forecast_campaign(CREATOR_ID, campaign)
+    reach = forecast['reach']['p50']
+    engagement = forecast['engagement']['p50']
+    earning = campaign_payout(campaign, engagement)
+    
+    st.metric("আনুমানিক রিচ", f"{reach}")
+    st.metric("আনুমানিক এঙ্গেজমেন্ট", f"{engagement}")
+    st.metric("আনুমানিক আয়", f"৳{earning:.2f}")
+    st.caption(
+        f"৮০% সম্ভাবনায় আয় ৳{forecast['earning']['p10']:.2f} – ৳{forecast['earning']['p90']:.2f}, "
+        f"রিচ {forecast['reach']['p10']} – {forecast['reach']['p90']}"
+    )
+    return reach, engagement, earning
+
+def create_static_post_content(campaign):
+    """Create static post content"""
+    st.subheader("🖼️ স্ট্যাটিক পোস্ট তৈরি করুন")
+    brand = get_catalog().brands[campaign['brand']]
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Image Upload or Generation
+        st.markdown("#### ১. ইমেজ তৈরি/আপলোড করুন")
+        image_option = st.radio(
+            "ইমেজ অপশন",
+            ["AI দিয়ে জেনারেট করুন", "আপলোড করুন", "টেমপ্লেট ব্যবহার করুন"]
+        )
+        
+        if image_option == "AI দিয়ে জেনারেট করুন":
+            prompt = st.text_area("AI প্রম্পট লিখুন", 
+                                 f"{campaign['brand']} এর {campaign['title']} এর জন্য আকর্ষণীয় সোশ্যাল মিডিয়া পোস্ট")
+            if st.button("🖼️ AI ইমেজ জেনারেট করুন"):
+                st.info("AI ইমেজ জেনারেট হচ্ছে... (ডেমো)")
+                # Mock image generation
+                st.image(placeholder_image(600, 400, '#3b82f6', campaign['brand'], "AI Generated Post"),
+                        caption="AI জেনারেটেড ইমেজ")
+        
+        elif image_option == "আপলোড করুন":
+            uploaded_file = st.file_uploader("ছবি আপলোড করুন", type=['jpg', 'png', 'jpeg'])
+            if uploaded_file:
+                show_upload_preview(uploaded_file, "আপলোডেড ইমেজ")
+        
+        else:  # Template
+            template = st.selectbox("টেমপ্লেট সিলেক্ট করুন", ["ডিজাইন ১", "ডিজাইন ২", "ডিজাইন ৩"])
+            st.image(placeholder_image(600, 400, brand['color'], campaign['brand'], template),
+                    caption=f"{template} টেমপ্লেট")
+    
+    with col2:
+        st.markdown("#### ২. টেক্সট কন্টেন্ট")
+        
+        # AI Text Generation
+        if st.button("🤖 AI টেক্সট জেনারেট করুন"):
+            start_generation('caption_job', 'caption', campaign)
+        poll_generation('caption_job', 'generated_text', "AI টেক্সট")
+        
+        if 'generated_text' in st.session_state:
+            headline = st.text_input("হেডলাইন", st.session_state.generated_text['headline'])
+            body = st.text_area("বডি টেক্সট", st.session_state.generated_text['body'], height=150)
+            hashtags = st.text_input("হ্যাশট্যাগ", st.session_state.generated_text['hashtags'])
+        else:
+            headline = st.text_input("হেডলাইন", f"{campaign['brand']} - {campaign['title']}")
+            body = st.text_area("বডি টেক্সট", "বিশেষ অফার! সীমিত সময়ের জন্য...", height=150)
+            hashtags = st.text_input("হ্যাশট্যাগ", f"#{campaign['brand'].replace(' ', '')} #অফার #বাংলাদেশ")
+        
+        st.markdown("#### ৩. প্ল্যাটফর্ম")
+        platforms = st.multiselect(
+            "পোস্ট করার প্ল্যাটফর্ম",
+            ["Facebook", "Instagram", "Twitter", "LinkedIn"],
+            default=["Facebook", "Instagram"]
+        )
+    
+    st.markdown("---")
+    
+    # Preview and Submit
+    st.subheader("👁️ পোস্ট প্রিভিউ")
+    
+    preview_col1, preview_col2 = st.columns([2, 1])
+    
+    with preview_col1:
+        st.markdown(f"""
+        <div style="
+            border: 2px solid #e5e7eb;
+            border-radius: 10px;
+            padding: 20px;
+            background: white;
+            margin: 10px 0;
+        ">
+            <div style="display: flex; align-items: center; margin-bottom: 15px;">
+                <div style="
+                    width: 40px;
+                    height: 40px;
+                    background: {escape(brand['color'])};
+                    border-radius: 50%;
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    color: white;
+                    font-size: 1.5rem;
+                    margin-right: 10px;
+                ">{escape(brand['logo'])}</div>
+                <div>
+                    <strong>আপনার পেজ</strong><br>
+                    <small>Sponsored • Just now</small>
+                </div>
+            </div>
+            
+            <p><strong>{escape(headline)}</strong></p>
+            <p>{escape(body)}</p>
+            
+            <div style="
+                background: #f3f4f6;
+                height: 300px;
+                border-radius: 10px;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                color: #6b7280;
+                margin: 15px 0;
+            ">
+                🖼️ পোস্ট ইমেজ
+            </div>
+            
+            <p><small>{escape(hashtags)}</small></p>
+            
+            <div style="display: flex; gap: 20px; color: #6b7280; margin-top: 15px;">
+                <span>❤️ লাইক</span>
+                <span>💬 কমেন্ট</span>
+                <span>🔄 শেয়ার</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with preview_col2:
+        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
+        
+        estimated_reach, estimated_engagement, total_estimated = show_forecast(campaign)
+        
+        if st.button("✅ কন্টেন্ট সাবমিট করুন", type="primary", use_container_width=True):
+            submit_content(
+                campaign,
+                created_content={
+                    'headline': headline,
+                    'body': body,
+                    'hashtags': hashtags,
+                    'platforms': platforms
+                },
+                content={'headline': headline, 'body': body, 'hashtags': hashtags},
+                reach=estimated_reach,
+                engagement=estimated_engagement,
+                earning=total_estimated,
+                message=f"✅ '{campaign['title']}' এর কন্টেন্ট সাবমিট করা হয়েছে!"
+            )
+
+def create_video_content(campaign):
+    """Create video content section"""
+    st.subheader("🎥 ভিডিও কন্টেন্ট তৈরি করুন")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("#### ১. ভিডিও স্ক্রিপ্ট")
+        
+        if st.button("🤖 AI স্ক্রিপ্ট জেনারেট করুন"):
+            start_generation('script_job', 'script', campaign)
+        poll_generation('script_job', 'video_script', "AI স্ক্রিপ্ট")
+        
+        if 'video_script' in st.session_state:
+            script_text = st.text_area("স্ক্রিপ্ট", st.session_state.video_script, height=200)
+        else:
+            script_text = st.text_area("স্ক্রিপ্ট", f"{campaign['brand']} এর {campaign['title']} সম্পর্কে ভিডিও স্ক্রিপ্ট...", height=200)
+        
+        st.markdown("#### ২. ভিডিও সেটিংস")
+        
+        duration = st.slider("ভিডিও দৈর্ঘ্য (সেকেন্ড)", 15, 60, 30)
+        aspect_ratio = st.selectbox("অ্যাসপেক্ট রেশিও", ["9:16 (Reels/TikTok)", "1:1 (Instagram)", "16:9 (YouTube)"])
+        music = st.selectbox("ব্যাকগ্রাউন্ড মিউজিক", ["Upbeat", "Calm", "Trending", "No Music"])
+        voiceover = st.selectbox("ভয়েসওভার", ["পুরুষ (বাংলা)", "মহিলা (বাংলা)", "ইংরেজি", "No Voiceover"])
+    
+    with col2:
+        st.markdown("#### ৩. মিডিয়া আপলোড")
+        
+        uploaded_files = st.file_uploader(
+            "ছবি/ভিডিও ক্লিপ আপলোড করুন",
+            type=['jpg', 'png', 'mp4', 'mov'],
+            accept_multiple_files=True
+        )
+        
+        if uploaded_files:
+            st.success(f"{len(uploaded_files)} টি ফাইল আপলোড হয়েছে")
+            preview_cols = st.columns(min(len(uploaded_files), 4))
+            for i, uploaded in enumerate(uploaded_files):
+                with preview_cols[i % len(preview_cols)]:
+                    show_upload_preview(uploaded, uploaded.name)
+        
+        st.markdown("#### ৪. AI ভিডিও জেনারেশন")
+        
+        if st.button("🎬 AI ভিডিও জেনারেট করুন"):
+            st.info("AI ভিডিও জেনারেট হচ্ছে... (ডেমো)")
+            # Mock video generation
+            st.markdown("""
+            <div style="
+                background: linear-gradient(45deg, #667eea, #764ba2);
+                height: 300px;
+                border-radius: 10px;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                color: white;
+                font-size: 1.5rem;
+                margin: 15px 0;
+            ">
+                🎥 AI Generated Video Preview
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Preview and Submit
+        st.markdown("---")
+        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
+        
+        estimated_reach, estimated_engagement, total_estimated = show_forecast(campaign)
+        
+        if st.button("✅ ভিডিও সাবমিট করুন", type="primary", use_container_width=True):
+            submit_content(
+                campaign,
+                created_content={
+                    'script': script_text,
+                    'duration': duration,
+                    'aspect_ratio': aspect_ratio,
+                    'music': music,
+                    'voiceover': voiceover
+                },
+                content={'script': script_text, 'duration': duration},
+                reach=estimated_reach,
+                engagement=estimated_engagement,
+                earning=total_estimated,
+                message=f"✅ '{campaign['title']}' এর ভিডিও সাবমিট করা হয়েছে!",
+                success="✅ ভিডিও সাবমিট করা হয়েছে! পারফরম্যান্স ট্র্যাকিং শুরু হয়েছে।"
+            )
+
+def create_text_image_content(campaign):
+    """Create text+image content section"""
+    st.subheader("📝 টেক্সট+ইমেজ কন্টেন্ট তৈরি করুন")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("#### ১. টেক্সট কন্টেন্ট")
+        
+        if st.button("🤖 AI টেক্সট জেনারেট করুন"):
+            start_generation('caption_job', 'caption', campaign)
+        poll_generation('caption_job', 'generated_text', "AI টেক্সট")
+        
+        if 'generated_text' in st.session_state:
+            headline = st.text_input("হেডলাইন", st.session_state.generated_text['headline'])
+            body = st.text_area("বডি টেক্সট", st.session_state.generated_text['body'], height=150)
+            hashtags = st.text_input("হ্যাশট্যাগ", st.session_state.generated_text['hashtags'])
+        else:
+            headline = st.text_input("হেডলাইন", f"{campaign['brand']} - {campaign['title']}")
+            body = st.text_area("বডি টেক্সট", "বিশেষ অফার! সীমিত সময়ের জন্য...", height=150)
+            hashtags = st.text_input("হ্যাশট্যাগ", f"#{campaign['brand'].replace(' ', '')} #অফার #বাংলাদেশ")
+    
+    with col2:
+        st.markdown("#### ২. ইমেজ সিলেক্ট করুন")
+        
+        image_option = st.radio(
+            "ইমেজ অপশন",
+            ["AI দিয়ে জেনারেট করুন", "আপলোড করুন", "স্টক ইমেজ ব্যবহার করুন"]
+        )
+        
+        if image_option == "AI দিয়ে জেনারেট করুন":
+            prompt = st.text_input("AI প্রম্পট লিখুন", f"{campaign['brand']} {campaign['title']}")
+            if st.button("🖼️ জেনারেট ইমেজ"):
+                st.info("AI ইমেজ জেনারেট হচ্ছে... (ডেমো)")
+        
+        elif image_option == "আপলোড করুন":
+            uploaded_file = st.file_uploader("ছবি আপলোড করুন", type=['jpg', 'png', 'jpeg'])
+            if uploaded_file:
+                show_upload_preview(uploaded_file, "আপলোডেড ইমেজ", width=200)
+        
+        else:
+            st.info("স্টক ইমেজ লাইব্রেরি থেকে সিলেক্ট করুন")
+        
+        # Preview and Submit
+        st.markdown("---")
+        st.markdown("#### 📊 আনুমানিক পারফরম্যান্স")
+        
+        estimated_reach, estimated_engagement, total_estimated = show_forecast(campaign)
+        
+        if st.button("✅ কন্টেন্ট সাবমিট করুন", type="primary", use_container_width=True):
+            submit_content(
+                campaign,
+                created_content={
+                    'headline': headline,
+                    'body': body,
+                    'hashtags': hashtags,
+                    'image_option': image_option
+                },
+                content={'headline': headline, 'body': body, 'hashtags': hashtags},
+                reach=estimated_reach,
+                engagement=estimated_engagement,
+                earning=total_estimated,
+                message=f"✅ '{campaign['title']}' এর টেক্সট+ইমেজ কন্টেন্ট সাবমিট করা হয়েছে!"
+            )
+
+def upload_id(uploaded_file):
+    """Identify a widget file, even among uploads with identical content"""
+    return getattr(uploaded_file, 'file_id', None) or uploaded_file.name
+
+def store_upload(uploaded_file):
+    """Spool an uploaded file to the upload store once per widget file"""
+    saved = st.session_state.setdefault('uploads', {})
+    file_id = upload_id(uploaded_file)
+    if file_id not in saved:
+        saved[file_id] = get_upload_store().save(uploaded_file)
+    return saved[file_id]
+
+def show_upload_preview(uploaded_file, caption, width=None):
+    """Show the thumbnail of an uploaded image, served from static, instead of the full-size original
+
+    Never waits on the thumbnail workers; a preview still rendering gets
+    a refresh button instead.
+    """
+    media = store_upload(uploaded_file)
+    if media.kind != 'image':
+        st.caption(f"🎞️ {media.name} ({media.size / (1024 * 1024):.1f} MB)")
+    elif media.thumbnail(timeout=0):
+        st.image(media.preview_url, caption=caption, width=width)
+    elif media.error is not None:
+        st.caption(f"⚠️ {media.name}: ছবিটি পড়া যায়নি, প্রিভিউ দেখানো সম্ভব নয়")
+    else:
+        st.caption(f"⏳ {media.name}: প্রিভিউ তৈরি হচ্ছে...")
+        if st.button("🔄 রিফ্রেশ", key=f"preview_refresh_{upload_id(uploaded_file)}"):
+            st.rerun()
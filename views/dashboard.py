@@ -0,0 +1,85 @@
+"""Dashboard page: balance, campaign counts and recent activity"""
+import streamlit as st
+
+from money import to_taka
+from templates import render_active_card, render_completed_card, render_stat_card
+
+def show_dashboard():
+    """Show main dashboard"""
+    st.markdown("""
+    <div class="main-header">
+        <h1>💰 Chronos Bazaar - ব্র্যান্ড মার্কেটপ্লেস</h1>
+        <p>ব্র্যান্ড ক্যাম্পেইনে অংশগ্রহণ করুন, কন্টেন্ট তৈরি করুন এবং আয় করুন</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Stats Cards
+    ledger = st.session_state.ledger
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(render_stat_card(
+            'earning', "💰 ব্যালেন্স", f"৳ {to_taka(st.session_state.balance_paisa)}", "বর্তমান আয়"
+        ), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(render_stat_card(
+            'blue', "🎯 সক্রিয় ক্যাম্পেইন", ledger.active_count, "চলমান কাজ"
+        ), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(render_stat_card(
+            'purple', "✅ সম্পন্ন ক্যাম্পেইন", ledger.completed_count, "সম্পন্ন কাজ"
+        ), unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(render_stat_card(
+            'orange', "📈 মোট আয়", f"৳ {to_taka(ledger.completed_earning_paisa)}", "সর্বমোট উপার্জন"
+        ), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Quick Actions
+    st.subheader("⚡ দ্রুত একশন")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🏢 ব্র্যান্ড ব্রাউজ করুন", use_container_width=True):
+            st.session_state.page = "marketplace"
+            st.rerun()
+    
+    with col2:
+        if st.button("🎨 কন্টেন্ট তৈরি করুন", use_container_width=True):
+            st.session_state.page = "create_content"
+            st.rerun()
+    
+    with col3:
+        if st.button("📊 পারফরম্যান্স দেখুন", use_container_width=True):
+            st.session_state.page = "performance"
+            st.rerun()
+    
+    st.markdown("---")
+    
+    # Recent Activity
+    st.subheader("📝 সাম্প্রতিক কার্যকলাপ")
+    
+    if not st.session_state.ledger.active_campaigns and not st.session_state.ledger.completed_campaigns:
+        st.info("ℹ️ আপনার কোনো সক্রিয় বা সম্পন্ন ক্যাম্পেইন নেই। প্রথমে ব্র্যান্ড মার্কেটপ্লেস থেকে ক্যাম্পেইন গ্রহণ করুন।")
+    
+    else:
+        # Show active campaigns
+        if st.session_state.ledger.active_campaigns:
+            st.markdown("#### 🎯 চলমান ক্যাম্পেইন")
+            for campaign in st.session_state.ledger.active_campaigns[-3:]:
+                status_text = "কন্টেন্ট তৈরি করতে হবে" if campaign['status'] == 'content_pending' else "পোস্ট করা হয়েছে"
+                status_color = "#f59e0b" if campaign['status'] == 'content_pending' else "#10b981"
+                
+                st.markdown(render_active_card(
+                    campaign, status_text, status_color, campaign.get('deadline', '১৫ ডিসেম্বর')
+                ), unsafe_allow_html=True)
+        
+        # Show completed campaigns
+        if st.session_state.ledger.completed_campaigns:
+            st.markdown("#### ✅ সম্পন্ন ক্যাম্পেইন")
+            for campaign in st.session_state.ledger.completed_campaigns[-3:]:
+                st.markdown(render_completed_card(campaign), unsafe_allow_html=True)
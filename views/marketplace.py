@@ -0,0 +1,183 @@
+"""Brand marketplace page: filtered, paginated campaign cards"""
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from payouts import campaign_max_payout
+from templates import render_brand_header, render_campaign_card
+from views.common import (
+    CONTENT_TYPE_NAMES, add_notification, get_campaign_stats, get_catalog, get_content_type_name,
+    get_recommender
+)
+
+# Marketplace filter labels mapped to catalog index keys
+CONTENT_FILTERS = {name: code for code, name in CONTENT_TYPE_NAMES.items()}
+PAYMENT_FILTERS = {
+    "৳১০০ এর নিচে": 'under_100',
+    "৳১০০-৳১৫০": '100_150',
+    "৳১৫০ এর উপরে": 'over_150'
+}
+
+# Marketplace orderings
+SORT_DEFAULT = "ডিফল্ট"
+SORT_RECOMMENDED = "আপনার জন্য সুপারিশ"
+SORT_OPTIONS = [SORT_DEFAULT, SORT_RECOMMENDED]
+
+# Campaign cards rendered per marketplace page
+MARKETPLACE_PAGE_SIZES = [10, 25, 50]
+
+# Campaigns due within this many days are flagged as expiring soon
+EXPIRING_SOON_DAYS = 3
+
+def show_marketplace():
+    """Show brand marketplace"""
+    st.title("🏢 ব্র্যান্ড মার্কেটপ্লেস")
+    
+    # Search and Filter
+    col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
+    
+    with col1:
+        search_query = st.text_input("ব্র্যান্ড/ক্যাম্পেইন সার্চ করুন", "")
+    
+    with col2:
+        content_filter = st.selectbox(
+            "কন্টেন্ট টাইপ ফিল্টার",
+            ["সবগুলো"] + list(CONTENT_FILTERS)
+        )
+    
+    with col3:
+        payment_filter = st.selectbox(
+            "পেমেন্ট ফিল্টার",
+            ["সবগুলো"] + list(PAYMENT_FILTERS)
+        )
+    
+    with col4:
+        sort_order = st.selectbox("সাজান", SORT_OPTIONS)
+    
+    with col5:
+        page_size = st.selectbox("প্রতি পেজে", MARKETPLACE_PAGE_SIZES)
+    
+    st.markdown("---")
+    
+    # Resolve filters against the catalog indexes; syncing also retires campaigns past their deadline
+    catalog = get_catalog()
+    expiring = catalog.expiring_soon(EXPIRING_SOON_DAYS)
+    if expiring:
+        st.warning(f"⏳ {len(expiring)} টি ক্যাম্পেইনের ডেডলাইন {EXPIRING_SOON_DAYS} দিনের মধ্যে শেষ হবে")
+    matching_ids = catalog.query(
+        status='active',
+        content_type=CONTENT_FILTERS.get(content_filter),
+        payment=PAYMENT_FILTERS.get(payment_filter),
+        text=search_query
+    )
+    
+    # Start from the first page whenever the filters change
+    filters = (search_query, content_filter, payment_filter, sort_order, page_size)
+    if st.session_state.get('marketplace_filters') != filters:
+        st.session_state.marketplace_filters = filters
+        st.session_state.marketplace_limit = page_size
+    visible_limit = st.session_state.marketplace_limit
+    
+    # Rank by similarity to the creator's campaigns; without history keep catalog order
+    visible_ids = None
+    if sort_order == SORT_RECOMMENDED:
+        visible_ids = get_recommender().rank(
+            st.session_state.ledger.accepted_ids, matching_ids, limit=visible_limit
+        )
+        if visible_ids is None:
+            st.caption("ℹ️ ক্যাম্পেইন গ্রহণ করলে আপনার জন্য সুপারিশ তৈরি হবে")
+    if visible_ids is None and search_query.strip():
+        visible_ids = catalog.ranked(search_query, matching_ids, limit=visible_limit)
+    if visible_ids is None:
+        visible_ids = catalog.ordered(matching_ids, limit=visible_limit)
+    
+    # Display Brands (only the visible slice is built)
+    current_brand = None
+    for campaign_id in visible_ids:
+        brand_name, campaign = catalog.get(campaign_id)
+        brand_data = catalog.brands[brand_name]
+        
+        if brand_name != current_brand:
+            current_brand = brand_name
+            st.markdown(render_brand_header(brand_name, brand_data), unsafe_allow_html=True)
+        
+        display_campaign_card(brand_name, brand_data, campaign)
+    
+    if not matching_ids:
+        st.info("ফিল্টারের সাথে মিলে এমন কোনো ক্যাম্পেইন নেই।")
+    elif visible_limit < len(matching_ids):
+        st.caption(f"{len(matching_ids)} টির মধ্যে {visible_limit} টি ক্যাম্পেইন দেখানো হচ্ছে")
+        if st.button("⬇️ আরও দেখুন", use_container_width=True):
+            st.session_state.marketplace_limit = visible_limit + page_size
+            st.rerun()
+
+def display_campaign_card(brand_name, brand_data, campaign):
+    """Display individual campaign card"""
+    col1, col2, col3 = st.columns([3, 1, 1])
+    
+    with col1:
+        max_earning = campaign_max_payout(campaign)
+        st.markdown(render_campaign_card(
+            campaign,
+            get_content_type_name(campaign['content_type']),
+            max_earning
+        ), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("#### 📅 ডেডলাইন")
+        st.markdown(f"**{campaign['deadline']}**")
+        
+        st.markdown("#### ⏱️ সময় বাকি")
+        days_left = get_catalog().days_left(campaign['id'])
+        if days_left is None:
+            st.markdown("**—**")
+        else:
+            st.markdown(f"**{days_left} দিন**" if days_left >= 0 else "**মেয়াদ শেষ**")
+    
+    with col3:
+        # Check if already accepted
+        already_accepted = st.session_state.ledger.is_accepted(campaign['id'])
+        
+        if not already_accepted:
+            if st.button("✅ ক্যাম্পেইন গ্রহণ করুন", key=f"accept_{campaign['id']}", use_container_width=True):
+                # Add to active campaigns
+                st.session_state.ledger.accept({
+                    'campaign_id': campaign['id'],
+                    'brand': brand_name,
+                    'title': campaign['title'],
+                    'content_type': campaign['content_type'],
+                    'base_payment': campaign['base_payment'],
+                    'target_reach': campaign['target_reach'],
+                    'min_engagement': campaign['min_engagement'],
+                    'per_engagement': campaign['per_engagement'],
+                    'deadline': campaign['deadline'],
+                    'accepted_date': datetime.now().strftime("%d %b %Y"),
+                    'accepted_at': time.time(),
+                    'status': 'content_pending',
+                    'created_content': None,
+                    'current_reach': 0,
+                    'current_engagement': 0,
+                    'estimated_earning': 0
+                })
+                add_notification(f"✅ '{campaign['title']}' ক্যাম্পেইন গ্রহণ করা হয়েছে!", 'success')
+                st.success(f"✅ '{campaign['title']}' ক্যাম্পেইন গ্রহণ করা হয়েছে!")
+                time.sleep(1)
+                st.rerun()
+        else:
+            st.info("⏳ ইতিমধ্যে গ্রহণ করা হয়েছে")
+        
+        # Quick Stats
+        st.markdown("---")
+        st.markdown("#### 📊 পরিসংখ্যান")
+        stats = get_campaign_stats().get(campaign['id'])
+        mean_earning = "—" if stats['mean_earning'] is None else f"৳{stats['mean_earning']:.2f}"
+        st.markdown(f"""
+        <small>
+        • গ্রহণ করেছে: {stats['accept_count']} জন<br>
+        • সফল হয়েছে: {stats['success_count']} জন<br>
+        • গড় আয়: {mean_earning}
+        </small>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
@@ -0,0 +1,110 @@
+"""Performance tracking page"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from money import to_taka
+from performance import (
+    COLUMN_LABELS, TIME_FILTERS, TREND_LABELS, build_frame, filter_frame, trend_frame, window_bounds
+)
+from timeseries import build_series
+from views.common import CREATOR_ID, get_store
+
+def get_performance_frame(ledger):
+    """Return the columnar performance table, rebuilt only when the ledger changes"""
+    cached = st.session_state.get('performance_frame')
+    if cached is None or cached[0] != ledger.revision:
+        cached = (ledger.revision, build_frame(ledger))
+        st.session_state.performance_frame = cached
+    return cached[1]
+
+def get_performance_series(ledger):
+    """Return {campaign_id: CampaignSeries} from the stored rollups, reloaded only when the ledger changes"""
+    cached = st.session_state.get('performance_series')
+    if cached is None or cached[0] != ledger.revision:
+        cached = (ledger.revision, build_series(get_store().load_engagement_series(CREATOR_ID)))
+        st.session_state.performance_series = cached
+    return cached[1]
+
+def show_performance():
+    """Show performance tracking"""
+    st.title("📊 পারফরম্যান্স ট্র্যাকিং")
+    
+    frame = get_performance_frame(st.session_state.ledger)
+    
+    # Filter options
+    col1, col2 = st.columns(2)
+    with col1:
+        time_filter = st.selectbox("সময়ফিল্টার", list(TIME_FILTERS))
+        custom_range = None
+        if TIME_FILTERS[time_filter] == 'custom':
+            today = datetime.now().date()
+            custom_range = st.date_input("তারিখ সীমা", (today - timedelta(days=7), today))
+            if len(custom_range) != 2:
+                custom_range = (custom_range[0], custom_range[0]) if custom_range else (today, today)
+    with col2:
+        campaign_filter = st.selectbox(
+            "ক্যাম্পেইন ফিল্টার",
+            ["সব ক্যাম্পেইন"] + frame['title'].tolist()
+        )
+    
+    st.markdown("---")
+    
+    # Performance Metrics
+    st.subheader("📈 পারফরম্যান্স মেট্রিক্স")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    ledger = st.session_state.ledger
+    
+    with col1:
+        st.metric("মোট রিচ", f"{ledger.total_reach}")
+    with col2:
+        st.metric("মোট এঙ্গেজমেন্ট", f"{ledger.total_engagement}")
+    with col3:
+        st.metric("মোট আয়", f"৳{to_taka(ledger.total_earning_paisa)}")
+    with col4:
+        st.metric("মোট ক্যাম্পেইন", f"{ledger.campaign_count}")
+    
+    # Trend of the downsampled hourly/daily rollups within the time filter
+    st.subheader("📉 ট্রেন্ড")
+    window = TIME_FILTERS[time_filter]
+    start, end = window_bounds(window, datetime.now(), custom_range)
+    trend_ids = None
+    if campaign_filter != "সব ক্যাম্পেইন":
+        trend_ids = frame.loc[frame['title'] == campaign_filter, 'campaign_id'].tolist()
+    trend = trend_frame(get_performance_series(ledger), trend_ids, since=start, until=end)
+    if trend.empty:
+        st.caption("এখনো কোনো এঙ্গেজমেন্ট ইতিহাস নেই। পোস্টের এঙ্গেজমেন্ট আসা শুরু হলে এখানে ট্রেন্ড দেখা যাবে।")
+    else:
+        st.line_chart(trend.rename(columns=TREND_LABELS))
+    
+    st.markdown("---")
+    
+    # Detailed Campaign Performance
+    st.subheader("🎯 ক্যাম্পেইন পারফরম্যান্স")
+    
+    if frame.empty:
+        st.info("📭 কোনো ক্যাম্পেইন ডেটা নেই। প্রথমে কিছু ক্যাম্পেইন গ্রহণ করুন।")
+    else:
+        # Resolve the time window on the ledger timeline, then mask the table
+        campaign_ids = None
+        if window is not None:
+            campaign_ids = st.session_state.ledger.accepted_between(start, end)
+        view = filter_frame(
+            frame,
+            campaign_ids=campaign_ids,
+            title=None if campaign_filter == "সব ক্যাম্পেইন" else campaign_filter
+        )
+        
+        if not view.empty:
+            st.dataframe(
+                view[list(COLUMN_LABELS)].rename(columns=COLUMN_LABELS),
+                column_config={
+                    COLUMN_LABELS['earning']: st.column_config.NumberColumn(format="৳%.2f")
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+        else:
+            st.info("ফিল্টারের সাথে মিলছে না এমন কোনো ক্যাম্পেইন নেই।")